@@ -6,6 +6,7 @@ VectorBT Pro GUI System - Multi/Single-Timeframe Resampling
 - Informationen anzeigen
 - Resampling: Single- oder Multi-Timeframe
 - Timeframe-Auswahl (1m, 2m, ..., 1w)
+- Session-basiertes Resampling mit Börsen-Kalendern (Handelszeiten, Feiertage)
 - Speichern als VBT-konforme Datei mit Performance-Features
 - Code-Generierung für Jupyter
 """
@@ -23,6 +24,7 @@ from shared_components import (
 )
 from data_manager import data_manager
 from code_generator import code_generator
+from resampling_engine import CALENDARS, resample_ohlcv, bin_index_cache
 
 class ResamplingApp:
     """🔄 APP 2: DATEN RESAMPLING"""
@@ -138,6 +140,16 @@ class ResamplingApp:
         ttk.Radiobutton(methods_frame, text="Standard", variable=self.ohlc_method, value="standard").pack(side=tk.LEFT)
         ttk.Radiobutton(methods_frame, text="VWAP", variable=self.ohlc_method, value="vwap").pack(side=tk.LEFT, padx=(10, 0))
         
+        # Börsen-Kalender (Handelszeiten, Feiertage, Zeitzone)
+        ttk.Label(options_frame, text="Börsen-Kalender:", font=ModernStyle.FONTS['normal']).pack(anchor=tk.W)
+        self.calendar_var = tk.StringVar(value="24/7")
+        ttk.Combobox(
+            options_frame,
+            textvariable=self.calendar_var,
+            values=list(CALENDARS.keys()),
+            state="readonly"
+        ).pack(fill=tk.X, pady=(5, 10))
+        
         # Dropna Option
         self.dropna_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(options_frame, text="Leere Zeilen entfernen", variable=self.dropna_var).pack(anchor=tk.W)
@@ -353,35 +365,13 @@ class ResamplingApp:
                     progress = int((i / total_timeframes) * 100)
                     self.root.after(0, lambda p=progress: self.status_bar.update_status(f"Resampling {timeframe}...", p))
                     
-                    # OHLCV Resampling
-                    if self.ohlc_method.get() == "vwap" and 'volume' in self.current_data.columns:
-                        # VWAP-basiertes Resampling
-                        resampled = self.current_data.resample(timeframe).apply({
-                            'open': 'first',
-                            'high': 'max',
-                            'low': 'min',
-                            'close': 'last',
-                            'volume': 'sum'
-                        })
-                        
-                        # VWAP berechnen
-                        vwap = (self.current_data['close'] * self.current_data['volume']).resample(timeframe).sum() / \
-                               self.current_data['volume'].resample(timeframe).sum()
-                        resampled['vwap'] = vwap
-                        
-                    else:
-                        # Standard OHLC Resampling
-                        agg_dict = {
-                            'open': 'first',
-                            'high': 'max',
-                            'low': 'min',
-                            'close': 'last'
-                        }
-                        
-                        if 'volume' in self.current_data.columns:
-                            agg_dict['volume'] = 'sum'
-                        
-                        resampled = self.current_data.resample(timeframe).agg(agg_dict)
+                    # Session-basiertes OHLCV Resampling (Bin-Index wird gecacht)
+                    resampled = resample_ohlcv(
+                        self.current_data,
+                        timeframe,
+                        calendar=self.calendar_var.get(),
+                        method=self.ohlc_method.get()
+                    )
                     
                     # Leere Zeilen entfernen falls gewünscht
                     if self.dropna_var.get():
@@ -420,6 +410,10 @@ class ResamplingApp:
             
             info["Gesamt Memory"] = f"{total_memory:.1f} MB"
             info["Anzahl Timeframes"] = len(self.resampled_data)
+            info["Börsen-Kalender"] = self.calendar_var.get()
+            
+            cache_stats = bin_index_cache.get_stats()
+            info["Bin-Index Cache"] = f"{cache_stats['hits']} Treffer / {cache_stats['misses']} berechnet"
             
             self.resampled_info.update_info(info)
             
@@ -436,6 +430,7 @@ class ResamplingApp:
                     metadata={
                         'resampling_mode': 'single',
                         'timeframe': timeframe,
+                        'calendar': self.calendar_var.get(),
                         'original_shape': self.current_data.shape,
                         'resampled_shape': self.resampled_data[timeframe].shape
                     }
@@ -448,6 +443,7 @@ class ResamplingApp:
                     metadata={
                         'resampling_mode': 'multi',
                         'timeframes': list(self.resampled_data.keys()),
+                        'calendar': self.calendar_var.get(),
                         'original_shape': self.current_data.shape
                     }
                 )
@@ -521,6 +517,7 @@ class ResamplingApp:
             config = {
                 'timeframes': list(self.resampled_data.keys()),
                 'method': self.ohlc_method.get(),
+                'calendar': self.calendar_var.get(),
                 'dropna': self.dropna_var.get(),
                 'resampling_mode': self.resampling_mode.get(),
                 'input_file': 'app1_output.h5',  # Placeholder
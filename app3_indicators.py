@@ -4,8 +4,14 @@
 VectorBT Pro GUI System - Indikatoren hinzufügen und konfigurieren
 - Daten von App 2 laden
 - Informationen anzeigen (erkennt Multi/Single-Timeframe)
-- Auswahl aus 551 Indikatoren
+- Auswahl aus 551 Indikatoren (indizierter Katalog, Suche über Token-Index)
 - Parameteränderung für Indikatoren (mit Validierung)
+- Parameter-Grids (z.B. window=5..50) in einem gebündelten Aufruf
+- Parallele Berechnung aller (Indikator, Timeframe)-Paare
+- Gemeinsame Zwischenergebnisse (EMA, True Range, ...) über Indikatoren hinweg
+- Indikator-Outputs als ein zusammenhängender Block pro Timeframe (ohne Kopie der Basisdaten)
+- Eingebaute Indikator-Bibliothek als Backend ohne VectorBT Pro
+- Inkrementelle Updates für neu angehängte Bars (Zustand wird mitgespeichert)
 - Unterschiedliche Indikatoren für verschiedene Zeiteinheiten bei Multi-Timeframe
 - Speichern als VBT-konforme Datei mit Performance-Features
 - Code-Generierung für Jupyter
@@ -13,7 +19,6 @@ VectorBT Pro GUI System - Indikatoren hinzufügen und konfigurieren
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
 import pandas as pd
 from datetime import datetime
 import threading
@@ -25,6 +30,11 @@ from shared_components import (
 )
 from data_manager import data_manager
 from code_generator import code_generator
+from indicator_grid import parse_param_grid, grid_size
+from column_assembler import assemble_timeframe
+from indicator_engine import ParallelIndicatorEngine, ENGINE_MODES, INDICATOR_BACKENDS, compute_indicator
+from incremental_indicators import IncrementalIndicatorSet
+from indicator_registry import indicator_registry
 
 class IndicatorsApp:
     """📈 APP 3: INDIKATOREN MANAGER"""
@@ -41,7 +51,8 @@ class IndicatorsApp:
         self.timeframes = []
         self.indicators_config = {}
         self.calculated_indicators = {}
-        self.available_indicators = {}
+        self.available_indicators = None
+        self.incremental_set = None
         
         # Indikatoren-Parameter laden
         self.load_indicators_parameters()
@@ -53,37 +64,13 @@ class IndicatorsApp:
         self.load_previous_data()
     
     def load_indicators_parameters(self):
-        """Indikatoren-Parameter aus JSON laden"""
+        """Indikatoren-Index laden (Schemas erst bei Bedarf)"""
         try:
-            with open('vectorbt_all_indicators_params.json', 'r', encoding='utf-8') as f:
-                self.available_indicators = json.load(f)
-            
-            print(f"✅ {len(self.available_indicators)} Indikatoren geladen")
-            
-        except FileNotFoundError:
-            print("⚠️ vectorbt_all_indicators_params.json nicht gefunden")
-            # Fallback: Basis-Indikatoren
-            self.available_indicators = {
-                "vbt:RSI": {
-                    "description": "Relative Strength Index",
-                    "run_params": {
-                        "close": {"required": True, "type": "Series"},
-                        "window": {"default": "14", "required": False, "type": "int"}
-                    }
-                },
-                "vbt:MACD": {
-                    "description": "Moving Average Convergence Divergence",
-                    "run_params": {
-                        "close": {"required": True, "type": "Series"},
-                        "fast_window": {"default": "12", "required": False, "type": "int"},
-                        "slow_window": {"default": "26", "required": False, "type": "int"},
-                        "signal_window": {"default": "9", "required": False, "type": "int"}
-                    }
-                }
-            }
+            self.available_indicators = indicator_registry.load()
+
         except Exception as e:
             print(f"❌ Fehler beim Laden der Indikatoren: {e}")
-            self.available_indicators = {}
+            self.available_indicators = None
     
     def create_widgets(self):
         """GUI-Elemente erstellen"""
@@ -148,6 +135,33 @@ class IndicatorsApp:
         actions_frame = ttk.LabelFrame(left_frame, text="🚀 Aktionen", padding="10")
         actions_frame.pack(fill=tk.X, pady=(10, 0))
         
+        # Parallel-Modus der Indikator-Engine
+        ttk.Label(actions_frame, text="Parallel-Modus:", font=ModernStyle.FONTS['small']).pack(anchor=tk.W)
+        self.engine_mode_var = tk.StringVar(value="auto")
+        ttk.Combobox(
+            actions_frame,
+            textvariable=self.engine_mode_var,
+            values=ENGINE_MODES,
+            state="readonly"
+        ).pack(fill=tk.X, pady=(0, 5))
+        
+        # Backend: VectorBT Pro oder eingebaute Bibliothek (ohne Lizenz)
+        ttk.Label(actions_frame, text="Backend:", font=ModernStyle.FONTS['small']).pack(anchor=tk.W)
+        self.backend_var = tk.StringVar(value="auto")
+        ttk.Combobox(
+            actions_frame,
+            textvariable=self.backend_var,
+            values=INDICATOR_BACKENDS,
+            state="readonly"
+        ).pack(fill=tk.X, pady=(0, 5))
+        
+        self.use_planner_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            actions_frame,
+            text="Gemeinsame Zwischenergebnisse (Planer)",
+            variable=self.use_planner_var
+        ).pack(anchor=tk.W, pady=(0, 5))
+        
         ttk.Button(
             actions_frame, 
             text="📈 Indikatoren berechnen", 
@@ -155,6 +169,12 @@ class IndicatorsApp:
             style="Accent.TButton"
         ).pack(fill=tk.X, pady=(0, 5))
         
+        ttk.Button(
+            actions_frame, 
+            text="🔄 Neue Bars anhängen", 
+            command=self.refresh_from_previous_app
+        ).pack(fill=tk.X, pady=(0, 5))
+        
         ttk.Button(
             actions_frame, 
             text="💾 Daten speichern", 
@@ -235,6 +255,14 @@ class IndicatorsApp:
         self.parameter_panel = ParameterPanel(middle_right_frame, title="⚙️ Parameter")
         self.parameter_panel.pack(fill=tk.X, pady=(0, 10))
         
+        # Parameter-Grid (alle Kombinationen in einem Aufruf)
+        grid_frame = ttk.LabelFrame(middle_right_frame, text="🧩 Parameter-Grid (optional)", padding="10")
+        grid_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        self.param_grid_var = tk.StringVar()
+        ttk.Entry(grid_frame, textvariable=self.param_grid_var, font=ModernStyle.FONTS['normal']).pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(grid_frame, text="z.B. window=5..50; alpha=1.5,2,2.5 (Bereich: start..ende:schritt)", font=ModernStyle.FONTS['small']).pack(anchor=tk.W)
+        
         # Daten-Information
         self.data_info = DataInfoPanel(middle_right_frame, title="📊 Daten-Information")
         self.data_info.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
@@ -260,31 +288,24 @@ class IndicatorsApp:
         """Indikatoren-Liste füllen"""
         self.indicators_listbox.delete(0, tk.END)
         
-        for indicator_name, indicator_info in self.available_indicators.items():
-            display_name = indicator_name.replace("vbt:", "")
-            description = indicator_info.get("description", "")
-            
-            display_text = f"{display_name} - {description}"
-            self.indicators_listbox.insert(tk.END, display_text)
+        if self.available_indicators is None:
+            return
+        
+        # Anzeige-Texte liegen fertig im Index → ein einziger Insert
+        self.indicators_listbox.insert(tk.END, *self.available_indicators.display_texts)
         
         self.status_bar.update_status(f"{len(self.available_indicators)} Indikatoren verfügbar")
     
     def on_search_change(self, *args):
-        """Suche in Indikatoren"""
-        search_term = self.search_var.get().lower()
+        """Suche in Indikatoren (invertierter Index)"""
+        if self.available_indicators is None:
+            return
         
-        self.indicators_listbox.delete(0, tk.END)
+        matches = self.available_indicators.search_display(self.search_var.get())
         
-        for indicator_name, indicator_info in self.available_indicators.items():
-            display_name = indicator_name.replace("vbt:", "")
-            description = indicator_info.get("description", "")
-            
-            # Suche in Name und Beschreibung
-            if (search_term in display_name.lower() or 
-                search_term in description.lower()):
-                
-                display_text = f"{display_name} - {description}"
-                self.indicators_listbox.insert(tk.END, display_text)
+        self.indicators_listbox.delete(0, tk.END)
+        if matches:
+            self.indicators_listbox.insert(tk.END, *matches)
     
     def on_indicator_select(self, event):
         """Indikator aus Liste ausgewählt"""
@@ -294,21 +315,16 @@ class IndicatorsApp:
         
         # Hole Indikator-Info
         selected_text = self.indicators_listbox.get(selection[0])
-        indicator_name = selected_text.split(" - ")[0]
         
-        # Finde vollständigen Namen
-        full_name = None
-        for name in self.available_indicators.keys():
-            if name.replace("vbt:", "") == indicator_name:
-                full_name = name
-                break
+        # Vollständigen Namen über den Index auflösen
+        full_name = self.available_indicators.resolve(selected_text)
         
         if full_name:
             self.show_indicator_details(full_name)
     
     def show_indicator_details(self, indicator_name):
         """Indikator-Details anzeigen"""
-        indicator_info = self.available_indicators.get(indicator_name, {})
+        indicator_info = self.available_indicators.get_info(indicator_name)
         
         # Details-Text aktualisieren
         self.details_text.config(state='normal')
@@ -333,7 +349,7 @@ class IndicatorsApp:
         self.parameter_panel.parameters = {}
         self.parameter_panel.widgets = {}
         
-        indicator_info = self.available_indicators.get(indicator_name, {})
+        indicator_info = self.available_indicators.get_info(indicator_name)
         run_params = indicator_info.get('run_params', {})
         
         for param_name, param_info in run_params.items():
@@ -381,19 +397,21 @@ class IndicatorsApp:
             return
         
         selected_text = self.indicators_listbox.get(selection[0])
-        indicator_name = selected_text.split(" - ")[0]
         
-        # Finde vollständigen Namen
-        full_name = None
-        for name in self.available_indicators.keys():
-            if name.replace("vbt:", "") == indicator_name:
-                full_name = name
-                break
+        # Vollständigen Namen über den Index auflösen
+        full_name = self.available_indicators.resolve(selected_text)
         
         if full_name and full_name not in self.indicators_config:
             # Parameter abrufen
             parameters = self.parameter_panel.get_parameters()
             
+            # Optionales Parameter-Grid
+            try:
+                param_grid = parse_param_grid(self.param_grid_var.get())
+            except ValueError as e:
+                messagebox.showerror("Fehler", f"Ungültiges Parameter-Grid: {e}")
+                return
+            
             # Timeframe-spezifische Konfiguration
             if self.is_multi_timeframe:
                 # Für Multi-Timeframe: Indikator für alle Timeframes hinzufügen
@@ -402,14 +420,16 @@ class IndicatorsApp:
                     self.indicators_config[config_key] = {
                         'indicator': full_name,
                         'timeframe': timeframe,
-                        'parameters': parameters.copy()
+                        'parameters': parameters.copy(),
+                        'param_grid': param_grid
                     }
             else:
                 # Für Single-Timeframe
                 self.indicators_config[full_name] = {
                     'indicator': full_name,
                     'timeframe': 'single',
-                    'parameters': parameters
+                    'parameters': parameters,
+                    'param_grid': param_grid
                 }
             
             self.update_selected_indicators_list()
@@ -449,6 +469,9 @@ class IndicatorsApp:
             else:
                 display_text = f"{indicator_name} ({timeframe})"
             
+            if config.get('param_grid'):
+                display_text += f" [Grid: {grid_size(config['param_grid'])}]"
+            
             self.selected_listbox.insert(tk.END, display_text)
     
     def on_selected_indicator_select(self, event):
@@ -481,6 +504,10 @@ class IndicatorsApp:
                     self.is_multi_timeframe = False
                     self.timeframes = ['single']
 
+                # Gespeicherten Indikator-Zustand übernehmen (falls aus Datei geladen)
+                if self.restore_incremental_state(metadata.get('file_path'), data):
+                    self.append_new_bars(data)
+
                 self.update_data_display()
                 self.update_timeframe_info()
                 self.status_bar.update_status("✅ Daten von App 2 geladen")
@@ -498,11 +525,18 @@ class IndicatorsApp:
             try:
                 data = data_manager.load_data(file_path)
 
-                if data is not None:
+                if data is not None and self.can_append_bars(data):
+                    # Nur neue Bars berechnen, Historie bleibt unverändert
+                    self.append_new_bars(data)
+                elif data is not None:
                     self.current_data = data
                     self.is_multi_timeframe = False
                     self.timeframes = ['single']
 
+                    # Gespeicherter Indikator-Zustand: Historie nicht neu berechnen
+                    if self.restore_incremental_state(file_path, data):
+                        self.append_new_bars(data)
+
                     self.root.after(0, self.update_data_display)
                     self.root.after(0, self.update_timeframe_info)
                     self.root.after(0, lambda: self.status_bar.update_status("✅ Externe Daten geladen", 100))
@@ -580,38 +614,32 @@ class IndicatorsApp:
 
         def calculate_in_background():
             try:
-                self.calculated_indicators = {}
-                total_indicators = len(self.indicators_config)
-
-                for i, (config_key, config) in enumerate(self.indicators_config.items()):
-                    progress = int((i / total_indicators) * 100)
-                    indicator_name = config['indicator']
-                    timeframe = config['timeframe']
-                    parameters = config['parameters']
-
-                    self.root.after(0, lambda p=progress, name=indicator_name:
-                                  self.status_bar.update_status(f"Berechne {name}...", p))
-
-                    try:
-                        # Daten für Timeframe abrufen
-                        if self.is_multi_timeframe:
-                            data = self.current_data[timeframe]
-                        else:
-                            data = self.current_data
-
-                        # Indikator berechnen
-                        result = self.calculate_single_indicator(indicator_name, data, parameters)
-
-                        if result is not None:
-                            self.calculated_indicators[config_key] = {
-                                'indicator': indicator_name,
-                                'timeframe': timeframe,
-                                'data': result,
-                                'parameters': parameters
-                            }
-
-                    except Exception as e:
-                        print(f"❌ Fehler bei {indicator_name}: {e}")
+                # Daten pro Timeframe ('single' bei Single-Timeframe)
+                if self.is_multi_timeframe:
+                    datasets = self.current_data
+                else:
+                    datasets = {'single': self.current_data}
+
+                def on_progress(done, total, config_key, config, success):
+                    progress = int((done / total) * 100)
+                    name = config['indicator'].replace("vbt:", "")
+                    if config['timeframe'] != 'single':
+                        name += f" ({config['timeframe']})"
+                    marker = "✅" if success else "❌"
+                    self.root.after(0, lambda p=progress, text=f"{marker} {name} [{done}/{total}]":
+                                  self.status_bar.update_status(text, p))
+
+                # Alle (Indikator, Timeframe)-Paare parallel berechnen
+                engine = ParallelIndicatorEngine(
+                    mode=self.engine_mode_var.get(),
+                    use_planner=self.use_planner_var.get(),
+                    backend=self.backend_var.get()
+                )
+                self.calculated_indicators = engine.run(datasets, self.indicators_config, on_progress)
+
+                # Zustände für spätere inkrementelle Updates (Seeding erst beim ersten Update/Speichern)
+                self.incremental_set = IncrementalIndicatorSet.from_config(self.indicators_config)
+                self.incremental_set.seed(datasets, lazy=True)
 
                 # GUI aktualisieren
                 self.root.after(0, self.update_indicators_display)
@@ -621,122 +649,166 @@ class IndicatorsApp:
 
         threading.Thread(target=calculate_in_background, daemon=True).start()
 
-    def calculate_single_indicator(self, indicator_name, data, parameters):
-        """Einzelnen Indikator berechnen"""
-        try:
-            # VectorBT Pro Indikator-Berechnung
-            import vectorbtpro as vbt
-
-            # Basis-Indikatoren implementieren
-            if indicator_name == "vbt:RSI":
-                window = parameters.get('window', 14)
-                return vbt.RSI.run(data['close'], window=window).rsi
-
-            elif indicator_name == "vbt:MACD":
-                fast_window = parameters.get('fast_window', 12)
-                slow_window = parameters.get('slow_window', 26)
-                signal_window = parameters.get('signal_window', 9)
-
-                macd = vbt.MACD.run(
-                    data['close'],
-                    fast_window=fast_window,
-                    slow_window=slow_window,
-                    signal_window=signal_window
-                )
-
-                return {
-                    'macd': macd.macd,
-                    'signal': macd.signal,
-                    'histogram': macd.histogram
-                }
-
-            elif indicator_name == "vbt:BBANDS":
-                window = parameters.get('window', 20)
-                alpha = parameters.get('alpha', 2)
-
-                bb = vbt.BBANDS.run(data['close'], window=window, alpha=alpha)
+    def can_append_bars(self, data):
+        """Prüfen ob neue Daten die aktuellen nur um Bars verlängern"""
+        if self.incremental_set is None or not self.calculated_indicators or self.current_data is None:
+            return False
+
+        old_sets = self.current_data if self.is_multi_timeframe else {'single': self.current_data}
+        new_sets = data if isinstance(data, dict) else {'single': data}
+        if set(old_sets) != set(new_sets):
+            return False
+
+        for timeframe, old in old_sets.items():
+            new = new_sets[timeframe]
+            if len(new) < len(old) or not new.index[:len(old)].equals(old.index):
+                return False
+        return True
+
+    def restore_incremental_state(self, file_path, data):
+        """
+        Gespeicherten Indikator-Zustand eines Datensatzes übernehmen
+
+        Die berechneten Indikatoren kommen aus den gespeicherten Spalten, der Zustand aus der
+        JSON-Datei neben dem Datensatz. Danach gelten nur die Bars bis zum gespeicherten Stand
+        als aktuelle Daten, spätere Bars werden inkrementell angehängt.
+
+        Returns:
+            True falls Zustand, Konfiguration und Datensatz zusammenpassen
+        """
+        indicator_set = IncrementalIndicatorSet.load(file_path) if file_path else None
+        if indicator_set is None or not indicator_set.indicators:
+            return False
+
+        datasets = data if isinstance(data, dict) else {'single': data}
+        indicators_config = data_manager.get_metadata().get('indicators_config') or {}
+        if not indicator_set.matches(datasets, indicators_config):
+            print(f"⚠️ Indikator-Zustand passt nicht zu {file_path} - wird ignoriert")
+            return False
+
+        history = indicator_set.history(datasets)
+        calculated = {}
+        for config_key, (timeframe, indicator) in indicator_set.indicators.items():
+            config = indicators_config[config_key]
+            frame = history[timeframe]
+            # Spaltennamen wie column_assembler.indicator_columns
+            short_name = config['indicator'].replace("vbt:", "")
+            if indicator.outputs:
+                columns = {output: f"{short_name}_{output}" for output in indicator.outputs}
+            else:
+                columns = {None: short_name}
+            if any(column not in frame.columns for column in columns.values()):
+                print(f"⚠️ Indikator-Spalten für {config_key} fehlen - Zustand wird ignoriert")
+                return False
+
+            calculated[config_key] = {
+                'indicator': config['indicator'],
+                'timeframe': timeframe,
+                'data': ({output: frame[column] for output, column in columns.items()}
+                         if indicator.outputs else frame[short_name]),
+                'parameters': config['parameters'],
+                'param_grid': None
+            }
 
-                return {
-                    'upper': bb.upper,
-                    'middle': bb.middle,
-                    'lower': bb.lower
-                }
+        self.indicators_config = dict(indicators_config)
+        self.calculated_indicators = calculated
+        self.incremental_set = indicator_set
+        self.current_data = history if isinstance(data, dict) else history['single']
+        self.root.after(0, self.update_selected_indicators_list)
+        print(f"🔄 Indikator-Zustand geladen: {len(calculated)} Indikatoren ohne Neuberechnung")
+        return True
+
+    def append_new_bars(self, data):
+        """Neue Bars inkrementell anhängen (O(1) pro Bar und Indikator)"""
+        datasets = data if isinstance(data, dict) else {'single': data}
+        old_sets = self.current_data if self.is_multi_timeframe else {'single': self.current_data}
+        new_bars = sum(len(datasets[tf]) - len(old_sets[tf]) for tf in datasets)
+        if new_bars == 0:
+            return
 
-            elif indicator_name == "vbt:ATR":
-                window = parameters.get('window', 14)
-                return vbt.ATR.run(data['high'], data['low'], data['close'], window=window).atr
+        new_results = self.incremental_set.append(datasets)
+        for config_key, new_data in new_results.items():
+            entry = self.calculated_indicators[config_key]
+            if isinstance(new_data, dict):
+                entry['data'] = {name: pd.concat([entry['data'][name], new_data[name]]) for name in new_data}
+            else:
+                entry['data'] = pd.concat([entry['data'], new_data])
+
+        # Nicht inkrementelle Einträge (Grids, übrige Indikatoren) neu berechnen
+        remaining = {
+            config_key: config for config_key, config in self.indicators_config.items()
+            if config_key not in self.incremental_set.indicators
+        }
+        if remaining:
+            engine = ParallelIndicatorEngine(
+                mode=self.engine_mode_var.get(),
+                use_planner=self.use_planner_var.get(),
+                backend=self.backend_var.get()
+            )
+            self.calculated_indicators.update(engine.run(datasets, remaining))
+
+        self.current_data = data
+        print(f"🔄 {new_bars} neue Bars inkrementell aktualisiert ({len(new_results)} Indikatoren)")
+        self.root.after(0, self.update_indicators_display)
+        self.root.after(0, lambda: self.status_bar.update_status(f"🔄 {new_bars} neue Bars angehängt", 100))
+
+    def refresh_from_previous_app(self):
+        """Verlängerte Daten von App 2 übernehmen"""
+        data = data_manager.get_current_data()
+        if data is None or not self.can_append_bars(data):
+            messagebox.showwarning("Warnung", "Keine verlängerten Daten für inkrementelles Update vorhanden!")
+            return
 
-            elif indicator_name == "vbt:ADX":
-                window = parameters.get('window', 14)
-                return vbt.ADX.run(data['high'], data['low'], data['close'], window=window).adx
+        def append_in_background():
+            try:
+                self.append_new_bars(data)
+            except Exception as e:
+                self.root.after(0, lambda: messagebox.showerror("Fehler", f"Update-Fehler: {e}"))
 
-            # Weitere Indikatoren können hier hinzugefügt werden
-            else:
-                print(f"⚠️ Indikator {indicator_name} noch nicht implementiert")
-                return None
+        threading.Thread(target=append_in_background, daemon=True).start()
 
-        except Exception as e:
-            print(f"❌ Fehler bei Indikator-Berechnung {indicator_name}: {e}")
-            return None
+    def calculate_single_indicator(self, indicator_name, data, parameters):
+        """Einzelnen Indikator berechnen"""
+        return compute_indicator(indicator_name, data, parameters, self.backend_var.get())
 
     def update_indicators_display(self):
         """Indikatoren-Anzeige aktualisieren"""
         self.performance_monitor.stop_timing()
 
         if self.calculated_indicators:
-            # Berechnete Indikatoren zu Daten hinzufügen
-            if self.is_multi_timeframe:
-                enhanced_data = {}
-                for timeframe, data in self.current_data.items():
-                    enhanced_data[timeframe] = data.copy()
-
-                    # Indikatoren für diesen Timeframe hinzufügen
-                    for config_key, indicator_result in self.calculated_indicators.items():
-                        if indicator_result['timeframe'] == timeframe:
-                            indicator_data = indicator_result['data']
-                            indicator_name = indicator_result['indicator'].replace("vbt:", "")
-
-                            if isinstance(indicator_data, dict):
-                                # Multi-Output Indikator (z.B. MACD)
-                                for output_name, output_data in indicator_data.items():
-                                    column_name = f"{indicator_name}_{output_name}"
-                                    enhanced_data[timeframe][column_name] = output_data
-                            else:
-                                # Single-Output Indikator
-                                enhanced_data[timeframe][indicator_name] = indicator_data
+            # Daten pro Timeframe ('single' bei Single-Timeframe)
+            datasets = self.current_data if self.is_multi_timeframe else {'single': self.current_data}
+
+            # Ein zusammenhängender Indikator-Block pro Timeframe, Basisdaten ohne Kopie
+            enhanced_data = {}
+            for timeframe, data in datasets.items():
+                results = [
+                    indicator_result for indicator_result in self.calculated_indicators.values()
+                    if indicator_result['timeframe'] == timeframe
+                ]
+                enhanced_data[timeframe], _ = assemble_timeframe(data, results)
 
+            if self.is_multi_timeframe:
                 # Enhanced Data setzen
                 data_manager.set_current_data(
                     enhanced_data,
                     source_app='app3_indicators',
                     metadata={
                         'indicators_added': list(self.calculated_indicators.keys()),
+                        'indicators_config': self.indicators_config,
                         'is_multi_timeframe': True,
                         'timeframes': self.timeframes
                     }
                 )
 
             else:
-                # Single-Timeframe
-                enhanced_data = self.current_data.copy()
-
-                for config_key, indicator_result in self.calculated_indicators.items():
-                    indicator_data = indicator_result['data']
-                    indicator_name = indicator_result['indicator'].replace("vbt:", "")
-
-                    if isinstance(indicator_data, dict):
-                        for output_name, output_data in indicator_data.items():
-                            column_name = f"{indicator_name}_{output_name}"
-                            enhanced_data[column_name] = output_data
-                    else:
-                        enhanced_data[indicator_name] = indicator_data
-
                 # Enhanced Data setzen
                 data_manager.set_current_data(
-                    enhanced_data,
+                    enhanced_data['single'],
                     source_app='app3_indicators',
                     metadata={
                         'indicators_added': list(self.calculated_indicators.keys()),
+                        'indicators_config': self.indicators_config,
                         'is_multi_timeframe': False
                     }
                 )
@@ -769,6 +841,10 @@ class IndicatorsApp:
                     app_name='app3_indicators'
                 )
 
+                # Indikator-Zustand neben dem Datensatz ablegen
+                if self.incremental_set is not None:
+                    self.incremental_set.save(file_path)
+
                 self.root.after(0, lambda: messagebox.showinfo("Erfolg", f"Daten mit Indikatoren gespeichert:\n{file_path}"))
                 self.root.after(0, lambda: self.status_bar.update_status("✅ Daten gespeichert", 100))
 
@@ -787,7 +863,8 @@ class IndicatorsApp:
                 'indicators': {
                     key: {
                         'indicator': val['indicator'],
-                        'parameters': val['parameters']
+                        'parameters': val['parameters'],
+                        'param_grid': val.get('param_grid') or {}
                     }
                     for key, val in self.calculated_indicators.items()
                 },
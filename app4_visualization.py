@@ -3,9 +3,9 @@
 📊 APP 4: VISUALISIERUNG (KONTROLLE)
 VectorBT Pro GUI System - Charts und CSV-Export
 - Visualisierung von Charts (TradingView-ähnlich)
-- CSV-Export zur Kontrolle der Indikatoren
+- Export zur Kontrolle der Indikatoren (CSV/Parquet/Feather/Arrow, blockweise)
 - Auswahl von Chart-Anzahl, Kerzen pro Chart, Zeitraum (Segmentierung)
-- Auswahl der Exportmenge für CSV
+- Auswahl von Exportmenge, Spalten und Kompression
 - Code-Generierung für Jupyter
 """
 
@@ -16,8 +16,6 @@ import numpy as np
 from datetime import datetime
 import threading
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.dates as mdates
 
 # Lokale Imports
 from shared_components import (
@@ -26,6 +24,11 @@ from shared_components import (
 )
 from data_manager import data_manager
 from code_generator import code_generator
+from chart_pyramid import pyramid_cache, PyramidNavigator
+from chart_rendering import render_chart, chart_layout, draw_candles_window
+from chart_manager import chart_manager
+from render_worker import RenderWorker
+from export_engine import export_dataframe, available_formats, EXPORT_FORMATS
 
 class VisualizationApp:
     """📊 APP 4: VISUALISIERUNG (KONTROLLE)"""
@@ -44,6 +47,12 @@ class VisualizationApp:
         self.chart_count = tk.IntVar(value=1)
         self.candles_per_chart = tk.IntVar(value=100)
         self.csv_export_rows = tk.IntVar(value=1000)
+        self.export_all_rows = tk.BooleanVar(value=False)
+        self.export_format = tk.StringVar(value='csv')
+        self.export_compression = tk.StringVar(value='none')
+        self.export_columns = tk.StringVar(value='')
+        self.navigator = None
+        self.render_worker = RenderWorker(self.root)
         
         # GUI erstellen
         self.create_widgets()
@@ -148,8 +157,8 @@ class VisualizationApp:
         
         ttk.Label(candles_frame, textvariable=self.candles_per_chart).pack(side=tk.RIGHT)
         
-        # CSV-Export Konfiguration
-        csv_frame = ttk.LabelFrame(left_frame, text="📄 CSV-Export", padding="10")
+        # Export Konfiguration
+        csv_frame = ttk.LabelFrame(left_frame, text="📄 Export", padding="10")
         csv_frame.pack(fill=tk.X, pady=(10, 0))
         
         ttk.Label(csv_frame, text="Anzahl Zeilen:").pack(anchor=tk.W)
@@ -165,6 +174,28 @@ class VisualizationApp:
         
         ttk.Label(csv_rows_frame, textvariable=self.csv_export_rows).pack(side=tk.RIGHT)
         
+        ttk.Checkbutton(csv_frame, text="Alle Zeilen exportieren", variable=self.export_all_rows).pack(anchor=tk.W)
+        
+        # Format + Kompression
+        format_frame = ttk.Frame(csv_frame)
+        format_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        ttk.Label(format_frame, text="Format:").pack(side=tk.LEFT)
+        format_combo = ttk.Combobox(
+            format_frame, textvariable=self.export_format, values=available_formats(), state="readonly", width=8
+        )
+        format_combo.pack(side=tk.LEFT, padx=(5, 10))
+        format_combo.bind('<<ComboboxSelected>>', self.on_export_format_change)
+        
+        self.compression_combo = ttk.Combobox(
+            format_frame, textvariable=self.export_compression,
+            values=EXPORT_FORMATS['csv']['compressions'], state="readonly", width=8
+        )
+        self.compression_combo.pack(side=tk.LEFT)
+        
+        ttk.Label(csv_frame, text="Spalten (kommagetrennt, leer = alle):").pack(anchor=tk.W, pady=(5, 0))
+        ttk.Entry(csv_frame, textvariable=self.export_columns).pack(fill=tk.X)
+        
         # Aktions-Buttons
         actions_frame = ttk.LabelFrame(left_frame, text="🚀 Aktionen", padding="10")
         actions_frame.pack(fill=tk.X, pady=(10, 0))
@@ -178,8 +209,14 @@ class VisualizationApp:
         
         ttk.Button(
             actions_frame, 
-            text="📄 CSV exportieren", 
-            command=self.export_csv
+            text="🔍 Zoom-Chart (Pan/Zoom)", 
+            command=self.create_zoom_chart
+        ).pack(fill=tk.X, pady=(0, 5))
+        
+        ttk.Button(
+            actions_frame, 
+            text="📄 Daten exportieren", 
+            command=self.export_data
         ).pack(fill=tk.X, pady=(0, 5))
         
         ttk.Button(
@@ -303,12 +340,13 @@ class VisualizationApp:
     
     def on_timeframe_change(self, event=None):
         """Timeframe geändert"""
+        self.cancel_rendering()
         self.update_data_display()
     
     def on_chart_config_change(self, value=None):
         """Chart-Konfiguration geändert"""
-        # Charts neu erstellen falls bereits vorhanden
-        pass
+        # Veraltetes Rendering abbrechen; Charts werden per Button neu erstellt
+        self.cancel_rendering()
     
     def get_current_timeframe_data(self):
         """Daten für aktuellen Timeframe abrufen"""
@@ -325,7 +363,7 @@ class VisualizationApp:
         return None
     
     def create_charts(self):
-        """Charts erstellen"""
+        """Charts erstellen (Rendering im Hintergrund, Main Thread zeigt nur das Bild)"""
         data = self.get_current_timeframe_data()
         
         if data is None:
@@ -335,108 +373,159 @@ class VisualizationApp:
         self.status_bar.update_status("Erstelle Charts...", 0)
         self.performance_monitor.start_timing()
         
-        def create_in_background():
-            try:
-                # Chart-Container leeren
-                self.root.after(0, self.clear_charts)
-                
-                chart_count = self.chart_count.get()
-                candles_per_chart = self.candles_per_chart.get()
-                
-                # Daten segmentieren
-                total_rows = len(data)
-                segment_size = min(candles_per_chart, total_rows // chart_count)
-                
-                charts_data = []
-                for i in range(chart_count):
-                    start_idx = i * segment_size
-                    end_idx = min(start_idx + segment_size, total_rows)
-                    
-                    if start_idx < total_rows:
-                        segment = data.iloc[start_idx:end_idx]
-                        charts_data.append(segment)
-                
-                # Charts im Main Thread erstellen
-                self.root.after(0, lambda: self.create_chart_widgets(charts_data))
+        # Tk-Zustand nur im Main Thread lesen
+        plt.style.use('dark_background')
+        chart_count = self.chart_count.get()
+        candles_per_chart = self.candles_per_chart.get()
+        width = self.chart_frame.winfo_width() - 20
+        height = self.chart_frame.winfo_height() - 30
+        if width <= 1 or height <= 1:
+            width, height = 1200, 800
+        
+        def render_in_background(job, worker):
+            # Daten segmentieren
+            total_rows = len(data)
+            segment_size = min(candles_per_chart, total_rows // chart_count)
+            
+            charts_data = []
+            for i in range(chart_count):
+                start_idx = i * segment_size
+                end_idx = min(start_idx + segment_size, total_rows)
                 
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Fehler", f"Chart-Fehler: {e}"))
-        
-        threading.Thread(target=create_in_background, daemon=True).start()
+                if start_idx < total_rows:
+                    segment = data.iloc[start_idx:end_idx]
+                    charts_data.append(segment)
+            
+            job.check()
+            ppm = worker.render(
+                'grid', width, height,
+                lambda figure, job: self.draw_chart_grid(figure, charts_data, job), job
+            )
+            return ppm, len(charts_data)
+        
+        # Neuer Auftrag ersetzt einen noch laufenden
+        self.render_worker.submit(
+            render_in_background,
+            on_done=self.show_rendered_charts,
+            on_error=lambda e: messagebox.showerror("Fehler", f"Chart-Fehler: {e}")
+        )
+    
+    def cancel_rendering(self):
+        """Laufendes Chart-Rendering abbrechen"""
+        self.render_worker.cancel()
     
     def clear_charts(self):
-        """Chart-Container leeren"""
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
+        """Zoom-Navigator lösen (Figure/Canvas bleiben im Chart-Manager erhalten)"""
+        if self.navigator is not None:
+            self.navigator.disconnect()
+            self.navigator = None
+    
+    def create_zoom_chart(self):
+        """Interaktiven Chart über alle Daten erstellen (Pyramide + Pan/Zoom)"""
+        data = self.get_current_timeframe_data()
+        
+        if data is None:
+            messagebox.showwarning("Warnung", "Keine Daten für Charts verfügbar!")
+            return
+        
+        self.status_bar.update_status("Baue Chart-Pyramide...", 0)
+        self.performance_monitor.start_timing()
+        
+        def build_in_background():
+            try:
+                pyramid = pyramid_cache.get(data)
+                self.root.after(0, lambda: self.create_zoom_chart_widget(pyramid))
+            except Exception as e:
+                self.root.after(0, lambda: messagebox.showerror("Fehler", f"Pyramiden-Fehler: {e}"))
+        
+        threading.Thread(target=build_in_background, daemon=True).start()
     
-    def create_chart_widgets(self, charts_data):
-        """Chart-Widgets erstellen"""
+    def create_zoom_chart_widget(self, pyramid):
+        """Zoom-Chart im Main Thread erstellen"""
         try:
-            # Matplotlib Style
             plt.style.use('dark_background')
+            panel = chart_manager.get_panel(self.chart_frame)
             
-            chart_count = len(charts_data)
-            
-            # Grid Layout berechnen
-            if chart_count == 1:
-                rows, cols = 1, 1
-            elif chart_count == 2:
-                rows, cols = 1, 2
-            elif chart_count <= 4:
-                rows, cols = 2, 2
-            else:
-                rows, cols = 2, 3
-            
-            # Figure erstellen
-            fig, axes = plt.subplots(rows, cols, figsize=(12, 8))
-            fig.patch.set_facecolor('#2b2b2b')
-            
-            if chart_count == 1:
-                axes = [axes]
-            elif chart_count > 1 and rows == 1:
-                axes = axes
-            else:
-                axes = axes.flatten()
-            
-            # Charts erstellen
-            for i, segment_data in enumerate(charts_data):
-                if i >= len(axes):
-                    break
-                
-                ax = axes[i]
-                
-                # OHLC Candlestick (vereinfacht)
-                if all(col in segment_data.columns for col in ['open', 'high', 'low', 'close']):
-                    # Vereinfachte Candlestick-Darstellung
-                    ax.plot(segment_data.index, segment_data['close'], color='white', linewidth=1, label='Close')
-                    
-                    # Indikatoren hinzufügen falls vorhanden
-                    for col in segment_data.columns:
-                        if col.lower() in ['rsi', 'macd', 'sma', 'ema']:
-                            ax2 = ax.twinx()
-                            ax2.plot(segment_data.index, segment_data[col], alpha=0.7, label=col)
-                            ax2.legend(loc='upper right')
-                
-                ax.set_title(f"Chart {i+1} ({len(segment_data)} Kerzen)")
+            # Gleiche Pyramide → Achsen und Navigator weiterverwenden
+            if panel.ensure_layout(('zoom', id(pyramid))) or self.navigator is None:
+                self.clear_charts()
+                ax = panel.figure.add_subplot(1, 1, 1)
                 ax.grid(True, alpha=0.3)
-                ax.legend()
+                ax.set_title(f"Zoom-Chart ({len(pyramid):,} Kerzen, {len(pyramid.levels)} Stufen)")
+                
+                def on_view_change(level_no, bar_count):
+                    self.status_bar.update_status(
+                        f"🔍 Stufe {level_no} (1:{pyramid.factor ** level_no}) - {bar_count:,} Bars sichtbar", 100
+                    )
                 
-                # X-Achse formatieren
-                if hasattr(segment_data.index, 'to_pydatetime'):
-                    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-                    ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(segment_data)//5)))
-                    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+                self.navigator = PyramidNavigator(
+                    ax, pyramid, self.chart_frame, renderer=draw_candles_window, on_view_change=on_view_change
+                )
             
-            # Leere Subplots ausblenden
-            for i in range(chart_count, len(axes)):
-                axes[i].set_visible(False)
+            # Start mit den letzten Kerzen entsprechend der Chart-Konfiguration
+            visible = self.chart_count.get() * self.candles_per_chart.get()
+            self.navigator.set_view(len(pyramid) - visible, len(pyramid))
+            # Canvas wieder einblenden (nach "Charts erstellen" liegt dort noch das Bitmap)
+            panel.draw()
+            
+            self.performance_monitor.stop_timing()
             
-            plt.tight_layout()
+        except Exception as e:
+            messagebox.showerror("Fehler", f"Zoom-Chart-Fehler: {e}")
+    
+    def draw_chart_grid(self, figure, charts_data, job=None):
+        """Chart-Raster in eine Figure zeichnen (läuft im Render-Worker)"""
+        chart_count = len(charts_data)
+        
+        # Grid Layout berechnen
+        if chart_count == 1:
+            rows, cols = 1, 1
+        elif chart_count == 2:
+            rows, cols = 1, 2
+        elif chart_count <= 4:
+            rows, cols = 2, 2
+        else:
+            rows, cols = 2, 3
+        
+        ohlc_columns = ['open', 'high', 'low', 'close']
+        layouts = tuple(
+            chart_layout(segment) if all(col in segment.columns for col in ohlc_columns) else None
+            for segment in charts_data
+        )
+        
+        # Gleiches Layout → Achsen wiederverwenden und Artists in-place aktualisieren
+        rebuild = figure.ensure_layout(('grid', rows, cols) + layouts)
+        if rebuild:
+            outer = figure.figure.add_gridspec(rows, cols)
+        
+        # Charts erstellen (jede Zelle: Preis-, Volumen- und Indikator-Panes)
+        for i, segment_data in enumerate(charts_data):
+            if i >= rows * cols:
+                break
+            if job is not None:
+                job.check()
             
-            # Canvas erstellen
-            canvas = FigureCanvasTkAgg(fig, self.chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            title = f"Chart {i+1} ({len(segment_data)} Kerzen)"
+            if layouts[i] is not None:
+                # Candlesticks + Volumen über Collections, Indikatoren mit einer Achse pro Pane
+                figure.slots[i] = render_chart(
+                    figure.figure, outer[i] if rebuild else None, segment_data, title=title,
+                    axes=figure.slots.get(i), artists=figure.artists, prefix=f"{i}:"
+                )
+            elif rebuild:
+                ax = figure.figure.add_subplot(outer[i])
+                ax.set_title(title)
+                ax.grid(True, alpha=0.3)
+        
+        if rebuild:
+            figure.figure.tight_layout()
+    
+    def show_rendered_charts(self, result):
+        """Fertig gerendertes Chart-Bild anzeigen (Main Thread)"""
+        try:
+            ppm, chart_count = result
+            self.clear_charts()
+            chart_manager.get_panel(self.chart_frame).show_bitmap(ppm)
             
             self.performance_monitor.stop_timing()
             self.status_bar.update_status(f"✅ {chart_count} Charts erstellt", 100)
@@ -444,47 +533,65 @@ class VisualizationApp:
         except Exception as e:
             messagebox.showerror("Fehler", f"Chart-Widget-Fehler: {e}")
     
-    def export_csv(self):
-        """CSV exportieren"""
+    def on_export_format_change(self, event=None):
+        """Export-Format geändert → passende Kompressionen anbieten"""
+        compressions = EXPORT_FORMATS[self.export_format.get()]['compressions']
+        self.compression_combo.configure(values=compressions)
+        self.export_compression.set(compressions[0])
+    
+    def export_data(self):
+        """Daten blockweise exportieren (CSV/Parquet/Feather/Arrow)"""
         data = self.get_current_timeframe_data()
         
         if data is None:
-            messagebox.showwarning("Warnung", "Keine Daten für CSV-Export verfügbar!")
+            messagebox.showwarning("Warnung", "Keine Daten für Export verfügbar!")
             return
         
+        export_format = self.export_format.get()
+        extension = EXPORT_FORMATS[export_format]['extension']
+        
         # Datei-Dialog
         file_path = filedialog.asksaveasfilename(
-            title="CSV exportieren",
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            title="Daten exportieren",
+            defaultextension=extension,
+            filetypes=[(f"{export_format.upper()} files", f"*{extension}"), ("All files", "*.*")]
         )
         
         if not file_path:
             return
         
-        self.status_bar.update_status("Exportiere CSV...", 0)
+        # Tk-Zustand nur im Main Thread lesen
+        compression = self.export_compression.get()
+        columns = [column.strip() for column in self.export_columns.get().split(',') if column.strip()]
+        export_rows = None if self.export_all_rows.get() else self.csv_export_rows.get()
+        
+        self.status_bar.update_status(f"Exportiere {export_format.upper()}...", 0)
+        
+        def on_progress(snapshot):
+            self.root.after(0, lambda: self.status_bar.update_status(
+                f"Exportiere {export_format.upper()}... {snapshot['rows']:,}/{snapshot['total_rows']:,} Zeilen "
+                f"({snapshot['rows_per_sec']:,.0f} Zeilen/s)", snapshot['percent']
+            ))
         
         def export_in_background():
             try:
-                # Anzahl Zeilen begrenzen
-                export_rows = self.csv_export_rows.get()
-                
-                if len(data) > export_rows:
-                    # Letzte N Zeilen exportieren
-                    export_data = data.tail(export_rows)
-                else:
-                    export_data = data
+                # Letzte N Zeilen exportieren (Sicht, keine Kopie)
+                export_data = data if export_rows is None or len(data) <= export_rows else data.tail(export_rows)
                 
-                # CSV speichern
-                export_data.to_csv(file_path, index=True)
+                result = export_dataframe(
+                    export_data, file_path, export_format,
+                    columns=columns or None, compression=compression, progress_callback=on_progress
+                )
                 
-                file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+                file_size_mb = result['bytes'] / (1024 * 1024)
+                summary = (f"{result['rows']:,} Zeilen, {file_size_mb:.1f} MB\n"
+                           f"{result['seconds']:.1f}s - {result['rows_per_sec']:,.0f} Zeilen/s, {result['mb_per_sec']:.1f} MB/s")
                 
-                self.root.after(0, lambda: self.status_bar.update_status(f"✅ CSV exportiert: {file_size_mb:.1f} MB", 100))
-                self.root.after(0, lambda: messagebox.showinfo("Erfolg", f"CSV exportiert:\n{file_path}\n\n{len(export_data):,} Zeilen, {file_size_mb:.1f} MB"))
+                self.root.after(0, lambda: self.status_bar.update_status(f"✅ {export_format.upper()} exportiert: {file_size_mb:.1f} MB", 100))
+                self.root.after(0, lambda: messagebox.showinfo("Erfolg", f"Export erstellt:\n{file_path}\n\n{summary}"))
                 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Fehler", f"CSV-Export-Fehler: {e}"))
+                self.root.after(0, lambda: messagebox.showerror("Fehler", f"Export-Fehler: {e}"))
         
         threading.Thread(target=export_in_background, daemon=True).start()
     
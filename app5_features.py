@@ -240,6 +240,7 @@ class FeaturesApp:
         self.strategy_params_panel.add_parameter("signal_threshold", "float", 0.7, "Signal Threshold")
         self.strategy_params_panel.add_parameter("min_holding_period", "int", 1, "Min Holding Period (Bars)")
         self.strategy_params_panel.add_parameter("max_holding_period", "int", 100, "Max Holding Period (Bars)")
+        self.strategy_params_panel.add_parameter("cooldown_period", "int", 0, "Cool-down nach Exit (Bars)")
     
     def on_file_selected(self, file_path):
         """Externe Datei ausgewählt"""
@@ -7,8 +7,10 @@ VectorBT Pro GUI System - Form-basierter Strategie-Builder
 - Form-basierter Strategie-Builder:
   - Einfache Formulare für Strategie-Parameter
   - Dropdown-Menüs für Indikatoren (Entry/Exit)
-  - Bedingungen für Indikatoren (z.B. RSI < 30)
-  - Logik-Auswahl (AND/OR/Custom)
+  - Bedingungen für Indikatoren (z.B. RSI < 30, close > SMA_50)
+  - Crossover, rising/falling über N Bars, Zeitfenster (innerhalb der letzten N Bars)
+  - Höhere Timeframes als Indikatoren ohne Look-Ahead (z.B. RSI@4H)
+  - Logik-Auswahl (AND/OR/Custom, Custom als sichere Ausdruckssprache)
   - Risk Management (Position Size, Max Drawdown)
 - Speichern als VBT-konforme Datei mit Performance-Features
 - Code-Generierung für Jupyter
@@ -27,6 +29,9 @@ from shared_components import (
 )
 from data_manager import data_manager
 from code_generator import code_generator
+from timeframe_projection import TimeframeSources
+from condition_engine import OPERATORS, COMPARISON_OPERATORS, WINDOW_MODES, parse_operand, condition_text
+from strategy_expression import validate_expression
 
 class StrategyBuilderApp:
     """🎯 APP 6: STRATEGIEENTWICKLUNG (FORM-BASIERT)"""
@@ -202,8 +207,8 @@ class StrategyBuilderApp:
         operator_frame = ttk.Frame(parent)
         operator_frame.pack(fill=tk.X, pady=(0, 10))
         
-        operators = [">", "<", ">=", "<=", "==", "!="]
-        for i, op in enumerate(operators):
+        # Vergleiche (Zeile 1), Crossover und Trend über N Bars (Zeile 2)
+        for i, op in enumerate(COMPARISON_OPERATORS):
             ttk.Radiobutton(
                 operator_frame, 
                 text=op, 
@@ -211,18 +216,38 @@ class StrategyBuilderApp:
                 value=op
             ).grid(row=0, column=i, padx=2)
         
-        # Wert-Eingabe
-        ttk.Label(parent, text="Wert:", font=ModernStyle.FONTS['normal']).pack(anchor=tk.W)
+        for i, op in enumerate(OPERATORS[len(COMPARISON_OPERATORS):]):
+            ttk.Radiobutton(
+                operator_frame, 
+                text=op, 
+                variable=operator_var, 
+                value=op
+            ).grid(row=1, column=i * 3, columnspan=3, padx=2, sticky=tk.W)
+        
+        # Wert-Eingabe: Zahl oder Spalte (z.B. SMA_50); bei rising/falling Anzahl Bars
+        ttk.Label(parent, text="Wert / Spalte:", font=ModernStyle.FONTS['normal']).pack(anchor=tk.W)
         
         value_var = tk.StringVar(value="30" if condition_type == "entry" else "70")
-        value_entry = ttk.Entry(parent, textvariable=value_var)
-        value_entry.pack(fill=tk.X, pady=(0, 10))
+        value_combo = ttk.Combobox(parent, textvariable=value_var)
+        value_combo.pack(fill=tk.X, pady=(0, 10))
+        
+        # Zeitfenster: Bedingung innerhalb der letzten N Bars (any) bzw. durchgehend (all)
+        window_frame = ttk.Frame(parent)
+        window_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(window_frame, text="Fenster (Bars):", font=ModernStyle.FONTS['normal']).pack(side=tk.LEFT)
+        window_var = tk.IntVar(value=1)
+        ttk.Spinbox(window_frame, from_=1, to=1000, textvariable=window_var, width=6).pack(side=tk.LEFT, padx=(5, 10))
+        window_mode_var = tk.StringVar(value="any")
+        ttk.Combobox(
+            window_frame, textvariable=window_mode_var, values=WINDOW_MODES, state="readonly", width=5
+        ).pack(side=tk.LEFT)
         
         # Bedingung hinzufügen Button
         ttk.Button(
             parent, 
             text=f"➕ {condition_type.title()} Bedingung hinzufügen",
-            command=lambda: self.add_condition(condition_type, indicator_var, operator_var, value_var)
+            command=lambda: self.add_condition(condition_type, indicator_var, operator_var, value_var, window_var, window_mode_var)
         ).pack(fill=tk.X, pady=(0, 10))
         
         # Aktuelle Bedingungen
@@ -245,12 +270,14 @@ class StrategyBuilderApp:
             self.entry_value_var = value_var
             self.entry_conditions_listbox = conditions_listbox
             self.entry_indicator_combo = indicator_combo
+            self.entry_value_combo = value_combo
         else:
             self.exit_indicator_var = indicator_var
             self.exit_operator_var = operator_var
             self.exit_value_var = value_var
             self.exit_conditions_listbox = conditions_listbox
             self.exit_indicator_combo = indicator_combo
+            self.exit_value_combo = value_combo
     
     def create_risk_management_widgets(self, parent):
         """Risk Management Widgets erstellen"""
@@ -284,10 +311,23 @@ class StrategyBuilderApp:
         ttk.Radiobutton(parent, text="OR (eine Bedingung)", variable=self.logic_var, value="OR").pack(anchor=tk.W)
         ttk.Radiobutton(parent, text="Custom Logic", variable=self.logic_var, value="CUSTOM").pack(anchor=tk.W)
         
-        # Custom Logic Entry
+        # Custom Logic Entry/Exit (C1..Cn zählen je Seite)
+        ttk.Label(parent, text="Entry:", font=ModernStyle.FONTS['small']).pack(anchor=tk.W, pady=(5, 0))
         self.custom_logic_var = tk.StringVar(value="(C1 AND C2) OR C3")
         custom_entry = ttk.Entry(parent, textvariable=self.custom_logic_var)
-        custom_entry.pack(fill=tk.X, pady=(5, 0))
+        custom_entry.pack(fill=tk.X)
+        
+        ttk.Label(parent, text="Exit:", font=ModernStyle.FONTS['small']).pack(anchor=tk.W, pady=(5, 0))
+        self.custom_exit_logic_var = tk.StringVar(value="C1")
+        custom_exit = ttk.Entry(parent, textvariable=self.custom_exit_logic_var)
+        custom_exit.pack(fill=tk.X)
+        
+        ttk.Label(
+            parent,
+            text="C1..Cn je Seite, Spalten (RSI@4H), + - * /, < > ==, AND/OR/NOT,\n"
+                 "crosses_above(a, b), rising(x, n), any(bed, n), close[3]",
+            font=ModernStyle.FONTS['small']
+        ).pack(anchor=tk.W, pady=(2, 0))
     
     def on_file_selected(self, file_path):
         """Externe Datei ausgewählt"""
@@ -352,9 +392,8 @@ class StrategyBuilderApp:
         
         if self.current_data is not None:
             if isinstance(self.current_data, dict):
-                # Multi-Timeframe: Erste Timeframe nehmen
-                first_timeframe = list(self.current_data.keys())[0]
-                columns = self.current_data[first_timeframe].columns
+                # Multi-Timeframe: feinster Timeframe + Spalten höherer Timeframes (z.B. RSI@4H, close@1D)
+                columns = TimeframeSources(self.current_data).columns
             else:
                 columns = self.current_data.columns
             
@@ -368,40 +407,50 @@ class StrategyBuilderApp:
             for indicator in self.available_indicators:
                 self.indicators_listbox.insert(tk.END, indicator)
             
-            # Comboboxes aktualisieren
-            self.entry_indicator_combo['values'] = self.available_indicators
-            self.exit_indicator_combo['values'] = self.available_indicators
+            # Comboboxes aktualisieren (auch OHLC, z.B. close > SMA_50)
+            operand_columns = list(columns)
+            self.entry_indicator_combo['values'] = operand_columns
+            self.exit_indicator_combo['values'] = operand_columns
+            self.entry_value_combo['values'] = operand_columns
+            self.exit_value_combo['values'] = operand_columns
     
-    def add_condition(self, condition_type, indicator_var, operator_var, value_var):
+    def add_condition(self, condition_type, indicator_var, operator_var, value_var, window_var=None, window_mode_var=None):
         """Bedingung hinzufügen"""
         indicator = indicator_var.get()
         operator = operator_var.get()
-        value = value_var.get()
+        value = value_var.get().strip()
+        window = window_var.get() if window_var is not None else 1
+        window_mode = window_mode_var.get() if window_mode_var is not None else 'any'
         
         if not indicator:
             messagebox.showwarning("Warnung", "Bitte wählen Sie einen Indikator aus!")
             return
         
-        condition_text = f"{indicator} {operator} {value}"
+        # Wert: Zahl oder bekannte Spalte
+        if operator not in ('rising', 'falling') and self.current_data is not None:
+            columns = list(self.entry_value_combo['values'])
+            constant, column = parse_operand(value, columns)
+            if constant is None and column is None:
+                messagebox.showwarning("Warnung", f"'{value}' ist weder eine Zahl noch eine Spalte!")
+                return
+        
+        condition = {
+            'indicator': indicator,
+            'operator': operator,
+            'value': value,
+            'window': max(int(window), 1),
+            'window_mode': window_mode
+        }
+        condition['text'] = condition_text(condition)
         
         if condition_type == "entry":
-            self.entry_conditions.append({
-                'indicator': indicator,
-                'operator': operator,
-                'value': value,
-                'text': condition_text
-            })
-            self.entry_conditions_listbox.insert(tk.END, condition_text)
+            self.entry_conditions.append(condition)
+            self.entry_conditions_listbox.insert(tk.END, condition['text'])
         else:
-            self.exit_conditions.append({
-                'indicator': indicator,
-                'operator': operator,
-                'value': value,
-                'text': condition_text
-            })
-            self.exit_conditions_listbox.insert(tk.END, condition_text)
+            self.exit_conditions.append(condition)
+            self.exit_conditions_listbox.insert(tk.END, condition['text'])
         
-        self.status_bar.update_status(f"{condition_type.title()} Bedingung hinzugefügt: {condition_text}")
+        self.status_bar.update_status(f"{condition_type.title()} Bedingung hinzugefügt: {condition['text']}")
     
     def remove_condition(self, condition_type, listbox):
         """Bedingung entfernen"""
@@ -427,6 +476,19 @@ class StrategyBuilderApp:
             messagebox.showwarning("Warnung", "Bitte fügen Sie mindestens eine Entry- oder Exit-Bedingung hinzu!")
             return
         
+        # Custom Logic vor dem Speichern prüfen (C1..Cn je Seite)
+        if self.logic_var.get() == "CUSTOM":
+            columns = list(self.entry_value_combo['values'])
+            sides = (("Entry", self.custom_logic_var.get(), self.entry_conditions),
+                     ("Exit", self.custom_exit_logic_var.get(), self.exit_conditions))
+            for side, text, conditions in sides:
+                if not conditions:
+                    continue
+                error = validate_expression(text, columns, conditions)
+                if error:
+                    messagebox.showerror("Fehler", f"Custom Logic ({side}) ungültig: {error}")
+                    return
+        
         self.status_bar.update_status("Erstelle Strategie...", 0)
         
         # Strategie-Konfiguration sammeln
@@ -435,6 +497,7 @@ class StrategyBuilderApp:
             'exit_conditions': self.exit_conditions,
             'logic': self.logic_var.get(),
             'custom_logic': self.custom_logic_var.get(),
+            'custom_exit_logic': self.custom_exit_logic_var.get(),
             'risk_management': {
                 'position_size': self.position_size_var.get() / 100.0,
                 'stop_loss': self.stop_loss_var.get() / 100.0,
@@ -4,6 +4,9 @@
 VectorBT Pro GUI System - Strategie-Visualisierung
 - Daten von App 6 laden
 - Informationen anzeigen (Zeitraum, Asset, Multi/Single-Timeframe, Indikatoren, Strategieparameter)
+- Multi-Timeframe-Signale: Bedingungen über alle Timeframes, ein Durchlauf ohne Look-Ahead
+- Signal-Bereinigung (Haltedauer, Cool-down) → Entry/Exit-Positionen statt Bool-Serien
+- Screener: Strategie über alle Symbole in historical_data, Rangliste der Entries am letzten Bar
 - Visualisierung von Einstiegen, Ausstiegen, Stop Loss etc. auf einem Chart
 - Code-Generierung für Jupyter
 """
@@ -15,7 +18,6 @@ import numpy as np
 from datetime import datetime
 import threading
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 # Lokale Imports
 from shared_components import (
@@ -24,6 +26,14 @@ from shared_components import (
 )
 from data_manager import data_manager
 from code_generator import code_generator
+from timeframe_projection import TimeframeSources
+from condition_engine import count_signals
+from signal_processing import clean_signals, holding_parameters
+from screener import run_screener, DEFAULT_DIRECTORY
+from strategy_expression import compile_strategy
+from chart_downsampling import downsample_line
+from chart_manager import chart_manager
+from render_worker import RenderWorker
 
 class StrategyVizApp:
     """📊 APP 7: VISUALISIERUNG (STRATEGIE)"""
@@ -38,6 +48,7 @@ class StrategyVizApp:
         self.current_data = None
         self.strategy_config = None
         self.signals = None
+        self.render_worker = RenderWorker(self.root)
         
         # GUI erstellen
         self.create_widgets()
@@ -124,8 +135,14 @@ class StrategyVizApp:
         self.show_stop_loss_var = tk.BooleanVar(value=True)
         self.show_take_profit_var = tk.BooleanVar(value=True)
         
-        ttk.Checkbutton(chart_options_frame, text="Entry Signale", variable=self.show_entries_var).pack(anchor=tk.W)
-        ttk.Checkbutton(chart_options_frame, text="Exit Signale", variable=self.show_exits_var).pack(anchor=tk.W)
+        ttk.Checkbutton(
+            chart_options_frame, text="Entry Signale", variable=self.show_entries_var,
+            command=lambda: self.toggle_signal_markers('entries', self.show_entries_var)
+        ).pack(anchor=tk.W)
+        ttk.Checkbutton(
+            chart_options_frame, text="Exit Signale", variable=self.show_exits_var,
+            command=lambda: self.toggle_signal_markers('exits', self.show_exits_var)
+        ).pack(anchor=tk.W)
         ttk.Checkbutton(chart_options_frame, text="Stop Loss", variable=self.show_stop_loss_var).pack(anchor=tk.W)
         ttk.Checkbutton(chart_options_frame, text="Take Profit", variable=self.show_take_profit_var).pack(anchor=tk.W)
         
@@ -152,6 +169,12 @@ class StrategyVizApp:
             command=self.generate_code
         ).pack(fill=tk.X, pady=(0, 5))
         
+        ttk.Button(
+            actions_frame, 
+            text="🔎 Screener (alle Symbole)", 
+            command=self.start_screener
+        ).pack(fill=tk.X, pady=(0, 5))
+        
         ttk.Button(
             actions_frame, 
             text="➡️ Zu App 8", 
@@ -293,73 +316,39 @@ class StrategyVizApp:
             messagebox.showwarning("Warnung", "Keine Daten oder Strategie-Konfiguration verfügbar!")
             return
         
+        # Chart zu alten Signalen nicht mehr ausliefern
+        self.render_worker.cancel()
+        
+        # Haltedauer/Cool-down aus den Strategieparametern von App 5
+        strategy_parameters = data_manager.get_metadata().get('strategy_parameters', {})
+        min_holding, max_holding, cooldown = holding_parameters(strategy_parameters)
+        
         self.status_bar.update_status("Berechne Trading-Signale...", 0)
         self.performance_monitor.start_timing()
         
         def calculate_in_background():
             try:
-                # Vereinfachte Signal-Berechnung
-                if isinstance(self.current_data, dict):
-                    # Multi-Timeframe: Erste Timeframe nehmen
-                    data = list(self.current_data.values())[0]
-                else:
-                    data = self.current_data
+                # Multi-Timeframe: Ausführung auf dem feinsten Timeframe, höhere Timeframes
+                # werden über gecachte Index-Zuordnungen gelesen (ohne projizierte Kopien)
+                sources = TimeframeSources(self.current_data)
+                data = sources.base
                 
-                # Entry Signale
-                entry_signals = pd.Series(False, index=data.index)
-                for condition in self.strategy_config.get('entry_conditions', []):
-                    indicator = condition['indicator']
-                    operator = condition['operator']
-                    value = float(condition['value'])
-                    
-                    if indicator in data.columns:
-                        if operator == '>':
-                            signal = data[indicator] > value
-                        elif operator == '<':
-                            signal = data[indicator] < value
-                        elif operator == '>=':
-                            signal = data[indicator] >= value
-                        elif operator == '<=':
-                            signal = data[indicator] <= value
-                        elif operator == '==':
-                            signal = data[indicator] == value
-                        else:
-                            signal = pd.Series(False, index=data.index)
-                        
-                        if self.strategy_config.get('logic', 'AND') == 'AND':
-                            entry_signals = entry_signals & signal
-                        else:
-                            entry_signals = entry_signals | signal
+                # Alle Regeln kompilieren und in einem Durchlauf auswerten (gepackte Bits)
+                compiled = compile_strategy(self.strategy_config, sources)
+                entries_packed, exits_packed = compiled.evaluate(sources)
                 
-                # Exit Signale
-                exit_signals = pd.Series(False, index=data.index)
-                for condition in self.strategy_config.get('exit_conditions', []):
-                    indicator = condition['indicator']
-                    operator = condition['operator']
-                    value = float(condition['value'])
-                    
-                    if indicator in data.columns:
-                        if operator == '>':
-                            signal = data[indicator] > value
-                        elif operator == '<':
-                            signal = data[indicator] < value
-                        elif operator == '>=':
-                            signal = data[indicator] >= value
-                        elif operator == '<=':
-                            signal = data[indicator] <= value
-                        elif operator == '==':
-                            signal = data[indicator] == value
-                        else:
-                            signal = pd.Series(False, index=data.index)
-                        
-                        if self.strategy_config.get('logic', 'AND') == 'AND':
-                            exit_signals = exit_signals & signal
-                        else:
-                            exit_signals = exit_signals | signal
+                # Handelbare Entry/Exit-Paare als Positionen (Speicher ~ Anzahl Trades)
+                cleaned = clean_signals(
+                    entries_packed, exits_packed, len(data),
+                    min_holding=min_holding, max_holding=max_holding, cooldown=cooldown,
+                    index=data.index
+                )
+                data_manager.set_signals(cleaned)
                 
                 self.signals = {
-                    'entries': entry_signals,
-                    'exits': exit_signals,
+                    'entries_packed': entries_packed,
+                    'exits_packed': exits_packed,
+                    'cleaned': cleaned,
                     'data': data
                 }
                 
@@ -376,10 +365,15 @@ class StrategyVizApp:
         self.performance_monitor.stop_timing()
         
         if self.signals:
-            entry_count = self.signals['entries'].sum()
-            exit_count = self.signals['exits'].sum()
+            entry_count = count_signals(self.signals['entries_packed'])
+            exit_count = count_signals(self.signals['exits_packed'])
+            cleaned = self.signals['cleaned']
             
-            self.status_bar.update_status(f"✅ Signale berechnet: {entry_count} Entries, {exit_count} Exits", 100)
+            self.status_bar.update_status(
+                f"✅ Signale berechnet: {entry_count} Entries, {exit_count} Exits → "
+                f"{cleaned.entry_count} Trades nach Bereinigung", 100
+            )
+            self.performance_monitor.update_metric("Signal-Speicher", f"{cleaned.nbytes / 1024:.1f} KB")
             
             # Chart automatisch erstellen
             self.create_chart()
@@ -392,88 +386,161 @@ class StrategyVizApp:
         
         self.status_bar.update_status("Erstelle Strategie-Chart...", 0)
         
-        def create_in_background():
-            try:
-                # Chart-Container leeren
-                self.root.after(0, self.clear_chart)
-                
-                data = self.signals['data']
-                entries = self.signals['entries']
-                exits = self.signals['exits']
-                
-                # Daten begrenzen
-                candles = self.chart_candles_var.get()
-                if len(data) > candles:
-                    data = data.tail(candles)
-                    entries = entries.tail(candles)
-                    exits = exits.tail(candles)
-                
-                # Chart im Main Thread erstellen
-                self.root.after(0, lambda: self.create_chart_widget(data, entries, exits))
-                
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Fehler", f"Chart-Fehler: {e}"))
+        # Tk-Zustand nur im Main Thread lesen
+        candles = self.chart_candles_var.get()
+        pixel_width = self.chart_frame.winfo_width()
+        if pixel_width <= 1:
+            pixel_width = 1200
+        signals = self.signals
         
-        threading.Thread(target=create_in_background, daemon=True).start()
+        def prepare_in_background(job, worker):
+            data = signals['data']
+            cleaned = signals['cleaned']
+            
+            # Daten begrenzen (Positionen relativ zum Ausschnitt)
+            if len(data) > candles:
+                data = data.tail(candles)
+                cleaned = cleaned.tail(candles)
+            entries, exits = cleaned.entries, cleaned.exits
+            job.check()
+            
+            # Linien auf Pixel-Breite reduzieren (Signal-Bars bleiben enthalten)
+            signal_rows = np.concatenate([entries, exits])
+            close = downsample_line(data['close'], pixel_width, method='minmax', keep=signal_rows)
+            
+            indicator_cols = [col for col in data.columns if col.lower() not in ['open', 'high', 'low', 'close', 'volume']]
+            indicator_line = None
+            if indicator_cols:
+                job.check()
+                indicator_line = downsample_line(data[indicator_cols[0]], pixel_width, method='lttb')
+            
+            return data, entries, exits, close, indicator_line
+        
+        # Neuer Auftrag ersetzt einen noch laufenden
+        self.render_worker.submit(
+            prepare_in_background,
+            on_done=lambda result: self.create_chart_widget(*result),
+            on_error=lambda e: messagebox.showerror("Fehler", f"Chart-Fehler: {e}")
+        )
     
-    def clear_chart(self):
-        """Chart-Container leeren"""
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
+    def toggle_signal_markers(self, name, variable):
+        """Entry/Exit-Marker ein-/ausblenden (nur Marker werden neu gezeichnet)"""
+        panel = chart_manager.panels.get(id(self.chart_frame))
+        if panel is not None:
+            panel.set_visible(name, variable.get())
     
-    def create_chart_widget(self, data, entries, exits):
-        """Chart-Widget erstellen"""
+    def create_chart_widget(self, data, entries, exits, close, indicator_line=None):
+        """Chart-Widget erstellen bzw. in-place aktualisieren"""
         try:
             # Matplotlib Style
             plt.style.use('dark_background')
             
-            # Figure erstellen
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), height_ratios=[3, 1])
-            fig.patch.set_facecolor('#2b2b2b')
+            # Persistente Figure: Achsen nur beim ersten Aufruf anlegen
+            panel = chart_manager.get_panel(self.chart_frame)
+            if panel.ensure_layout('strategy'):
+                ax1, ax2 = panel.figure.subplots(2, 1, height_ratios=[3, 1])
+                ax1.set_title('Strategie-Visualisierung')
+                ax1.grid(True, alpha=0.3)
+                ax2.grid(True, alpha=0.3)
+                panel.slots['axes'] = (ax1, ax2)
+            ax1, ax2 = panel.slots['axes']
             
-            # Hauptchart (Preis)
-            ax1.plot(data.index, data['close'], color='white', linewidth=1, label='Close Price')
+            # Hauptchart (Preis) – im Hintergrund auf Pixel-Breite reduziert
+            panel.line('close', ax1, close.index, close.to_numpy(), color='white', linewidth=1, label='Close Price')
             
-            # Entry Signale
-            if self.show_entries_var.get():
-                entry_points = data[entries]
-                if not entry_points.empty:
-                    ax1.scatter(entry_points.index, entry_points['close'], 
-                              color='green', marker='^', s=100, label='Entry', zorder=5)
+            # Entry/Exit Signale (animiert → Umschalten per Blitting)
+            entry_points = data.iloc[entries]
+            panel.scatter('entries', ax1, entry_points.index, entry_points['close'].to_numpy(),
+                          color='green', marker='^', s=100, label='Entry', zorder=5, animated=True)
+            panel.artists['entries'].set_visible(self.show_entries_var.get())
             
-            # Exit Signale
-            if self.show_exits_var.get():
-                exit_points = data[exits]
-                if not exit_points.empty:
-                    ax1.scatter(exit_points.index, exit_points['close'], 
-                              color='red', marker='v', s=100, label='Exit', zorder=5)
+            exit_points = data.iloc[exits]
+            panel.scatter('exits', ax1, exit_points.index, exit_points['close'].to_numpy(),
+                          color='red', marker='v', s=100, label='Exit', zorder=5, animated=True)
+            panel.artists['exits'].set_visible(self.show_exits_var.get())
             
-            ax1.set_title('Strategie-Visualisierung')
-            ax1.grid(True, alpha=0.3)
+            ax1.relim()
+            ax1.autoscale_view()
             ax1.legend()
             
-            # Indikatoren-Chart (falls vorhanden)
-            indicator_cols = [col for col in data.columns if col.lower() not in ['open', 'high', 'low', 'close', 'volume']]
-            if indicator_cols:
-                # Ersten Indikator anzeigen
-                indicator = indicator_cols[0]
-                ax2.plot(data.index, data[indicator], color='orange', label=indicator)
+            # Indikatoren-Chart (falls vorhanden, erster Indikator)
+            if indicator_line is not None:
+                indicator = indicator_line.name
+                artist = panel.line(
+                    'indicator', ax2, indicator_line.index, indicator_line.to_numpy(), color='orange', label=indicator
+                )
+                artist.set_label(indicator)
                 ax2.set_title(f'Indikator: {indicator}')
-                ax2.grid(True, alpha=0.3)
+                ax2.relim()
+                ax2.autoscale_view()
                 ax2.legend()
             
-            plt.tight_layout()
-            
-            # Canvas erstellen
-            canvas = FigureCanvasTkAgg(fig, self.chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            panel.figure.tight_layout()
+            panel.draw()
             
             self.status_bar.update_status("✅ Strategie-Chart erstellt", 100)
             
         except Exception as e:
             messagebox.showerror("Fehler", f"Chart-Widget-Fehler: {e}")
     
+    def start_screener(self):
+        """Strategie über alle Symbole in historical_data auswerten"""
+        if not self.strategy_config:
+            messagebox.showwarning("Warnung", "Keine Strategie-Konfiguration verfügbar!")
+            return
+        
+        # Indikator-Konfiguration aus App 3 (ohne: nur Spalten aus den Dateien)
+        indicators_config = data_manager.get_metadata().get('indicators_config')
+        strategy_config = self.strategy_config
+        
+        self.status_bar.update_status("🔎 Screener läuft...", 0)
+        
+        def on_progress(done, total):
+            progress = int(done / total * 100)
+            self.root.after(0, lambda: self.status_bar.update_status(f"🔎 Screener: {done}/{total} Symbole", progress))
+        
+        def screen_in_background():
+            try:
+                ranking, stats = run_screener(strategy_config, indicators_config, progress_callback=on_progress)
+                self.root.after(0, lambda: self.show_screener_results(ranking, stats))
+            except Exception as e:
+                self.root.after(0, lambda: messagebox.showerror("Fehler", f"Screener-Fehler: {e}"))
+        
+        threading.Thread(target=screen_in_background, daemon=True).start()
+    
+    def show_screener_results(self, ranking, stats):
+        """Screener-Rangliste in eigenem Fenster anzeigen"""
+        if not stats['symbols']:
+            self.status_bar.update_status(f"⚠️ Keine Symbole in {DEFAULT_DIRECTORY} gefunden", 100)
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("🔎 Screener - Entry am letzten Bar")
+        window.geometry("800x500")
+        
+        summary = (f"{stats['evaluated']}/{stats['symbols']} Symbole ausgewertet, "
+                   f"{stats['hits']} Treffer ({stats.get('seconds', 0):.2f}s)")
+        ttk.Label(window, text=summary, padding="10").pack(anchor=tk.W)
+        
+        columns = ("Rang", "Symbol", "Zeitpunkt", "Close", "Neu", "Bars aktiv", "Veraltet")
+        tree = ttk.Treeview(window, columns=columns, show="headings")
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=100)
+        
+        for row in ranking.itertuples(index=False):
+            tree.insert("", "end", values=(
+                row.rank, row.symbol, str(row.timestamp), f"{row.close:.4f}",
+                "✅" if row.fresh else "", row.bars_active, "⚠️" if row.stale else ""
+            ))
+        
+        scrollbar = ttk.Scrollbar(window, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.status_bar.update_status(f"✅ Screener: {stats['hits']} Symbole mit Entry am letzten Bar", 100)
+    
     def generate_code(self):
         """Jupyter Code generieren"""
         if not self.signals:
@@ -5,14 +5,13 @@ VectorBT Pro GUI System - Performance-optimiertes Backtesting
 - Daten von App 6 laden
 - Anzeige aktivierter Performance-Features
 - Möglichkeit, alle Performance-Features zu aktivieren
-- Backtesting-Ausführung
+- Backtesting-Ausführung: kompilierte Portfolio-Simulation (Signale aus App 7, Risk Management aus App 6)
 - Code-Generierung für Jupyter
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox
 import pandas as pd
-import numpy as np
 from datetime import datetime
 import threading
 
@@ -23,6 +22,10 @@ from shared_components import (
 )
 from data_manager import data_manager
 from code_generator import code_generator
+from timeframe_projection import TimeframeSources
+from signal_processing import strategy_signals
+from portfolio_simulator import simulate_portfolio
+from performance_metrics import METRICS, format_metric
 
 class BacktestingApp:
     """🚀 APP 8: BACKTESTING"""
@@ -38,6 +41,8 @@ class BacktestingApp:
         self.strategy_config = None
         self.backtest_results = None
         self.backtest_config = {}
+        self.simulation = None
+        self.signals = None
         
         # GUI erstellen
         self.create_widgets()
@@ -278,55 +283,58 @@ class BacktestingApp:
         
         def backtest_in_background():
             try:
+                # Risk Management aus App 6
+                risk_mgmt = self.strategy_config.get('risk_management', {})
+                
                 # Backtest-Konfiguration sammeln
                 self.backtest_config = {
                     'initial_cash': self.initial_cash_var.get(),
                     'fees': self.fees_var.get() / 100.0,
                     'slippage': self.slippage_var.get() / 100.0,
+                    'position_size': risk_mgmt.get('position_size', 1.0),
+                    'stop_loss': risk_mgmt.get('stop_loss', 0.0),
+                    'take_profit': risk_mgmt.get('take_profit', 0.0),
                     'performance_features': {key: var.get() for key, var in self.performance_features.items()}
                 }
                 
-                # Vereinfachte Backtest-Simulation
+                # Bereinigte Signale aus App 7 (sonst hier berechnen)
+                signals = data_manager.get_signals()
                 if isinstance(self.current_data, dict):
-                    data = list(self.current_data.values())[0]
+                    data = TimeframeSources(self.current_data).base
                 else:
                     data = self.current_data
+                if signals is None or signals.n_bars != len(data):
+                    strategy_parameters = data_manager.get_metadata().get('strategy_parameters', {})
+                    data, signals = strategy_signals(self.strategy_config, self.current_data, strategy_parameters)
+                self.signals = signals
                 
-                # Einfache Buy-and-Hold Simulation
+                # Kompilierte Portfolio-Simulation
                 initial_cash = self.backtest_config['initial_cash']
-                fees = self.backtest_config['fees']
-                
-                start_price = data['close'].iloc[0]
-                end_price = data['close'].iloc[-1]
-                
-                shares = initial_cash / start_price
-                final_value = shares * end_price
-                total_fees = initial_cash * fees * 2  # Buy + Sell
-                net_value = final_value - total_fees
-                
-                total_return = (net_value - initial_cash) / initial_cash
-                
-                # Weitere Metriken (vereinfacht)
-                returns = data['close'].pct_change().dropna()
-                volatility = returns.std() * np.sqrt(252)  # Annualisiert
-                sharpe_ratio = (total_return - 0.02) / volatility if volatility > 0 else 0  # 2% Risk-free rate
+                self.simulation = simulate_portfolio(
+                    data, signals,
+                    init_cash=initial_cash,
+                    size=self.backtest_config['position_size'],
+                    fees=self.backtest_config['fees'],
+                    slippage=self.backtest_config['slippage'],
+                    stop_loss=self.backtest_config['stop_loss'],
+                    take_profit=self.backtest_config['take_profit']
+                )
+                summary = self.simulation.summary()
                 
-                max_drawdown = 0.15  # Placeholder
-                win_rate = 0.65  # Placeholder
+                # Alle Kennzahlen in einem Durchlauf über Equity und Trades
+                metrics = self.simulation.metrics()
                 
-                self.backtest_results = {
-                    'total_return': total_return,
-                    'sharpe_ratio': sharpe_ratio,
-                    'max_drawdown': max_drawdown,
-                    'volatility': volatility,
-                    'win_rate': win_rate,
+                self.backtest_results = {name: float(value) for name, value in metrics.items()}
+                self.backtest_results.update({
                     'initial_cash': initial_cash,
-                    'final_value': net_value,
-                    'total_trades': 10,  # Placeholder
-                    'profitable_trades': 7,  # Placeholder
+                    'final_value': summary['final_value'],
+                    'total_fees': summary['total_fees'],
+                    'total_trades': summary['total_trades'],
+                    'profitable_trades': summary['profitable_trades'],
+                    'closed_trades': summary['closed_trades'],
                     'start_date': data.index[0],
                     'end_date': data.index[-1]
-                }
+                })
                 
                 # GUI aktualisieren
                 self.root.after(0, self.update_results_display)
@@ -342,6 +350,10 @@ class BacktestingApp:
         
         if self.backtest_results:
             results = self.backtest_results
+            metrics_text = "\n".join(
+                f"  {label + ':':<21}{format_metric(name, results[name]):>10}"
+                for name, (_, label, _) in METRICS.items() if name in results and name != 'total_trades'
+            )
             
             # Ergebnisse formatieren
             results_text = f"""
@@ -349,21 +361,24 @@ class BacktestingApp:
 {'='*50}
 
 📊 PERFORMANCE-METRIKEN:
-  Total Return:        {results['total_return']:>10.2%}
-  Sharpe Ratio:        {results['sharpe_ratio']:>10.2f}
-  Max Drawdown:        {results['max_drawdown']:>10.2%}
-  Volatilität:         {results['volatility']:>10.2%}
-  Win Rate:            {results['win_rate']:>10.2%}
+{metrics_text}
 
 💰 FINANZIELLE ERGEBNISSE:
   Startkapital:        {results['initial_cash']:>10,.2f} €
   Endwert:             {results['final_value']:>10,.2f} €
   Gewinn/Verlust:      {results['final_value'] - results['initial_cash']:>10,.2f} €
+  Gebühren:            {results['total_fees']:>10,.2f} €
 
 📈 TRADING-STATISTIKEN:
   Gesamte Trades:      {results['total_trades']:>10}
   Profitable Trades:   {results['profitable_trades']:>10}
-  Verlust Trades:      {results['total_trades'] - results['profitable_trades']:>10}
+  Verlust Trades:      {results['closed_trades'] - results['profitable_trades']:>10}
+  Offene Position:     {results['total_trades'] - results['closed_trades']:>10}
+
+⚠️ RISK MANAGEMENT:
+  Position Size:       {self.backtest_config['position_size']:>10.2%}
+  Stop Loss:           {self.backtest_config['stop_loss']:>10.2%}
+  Take Profit:         {self.backtest_config['take_profit']:>10.2%}
 
 📅 ZEITRAUM:
   Start:               {results['start_date'].strftime('%Y-%m-%d')}
@@ -393,6 +408,7 @@ class BacktestingApp:
                     'backtest_config': self.backtest_config
                 }
             )
+            data_manager.set_signals(self.signals)
             
             self.status_bar.update_status("✅ Backtesting abgeschlossen", 100)
             
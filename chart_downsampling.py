@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+📉 CHART DOWNSAMPLING - VectorBT Pro GUI System
+Level-of-Detail für Preis- und Indikator-Charts
+- Min/Max pro Pixel-Bucket für Preise (Extrema bleiben exakt erhalten)
+- OHLC-Aggregation pro Bucket (Open/High/Low/Close exakt)
+- LTTB (Largest Triangle Three Buckets) für Indikator-Linien
+- Signal-Punkte werden immer übernommen
+- Zielgröße aus der Pixel-Breite der Achse
+"""
+
+import numpy as np
+import pandas as pd
+
+from indicator_kernels import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+
+# Ab diesem Verhältnis Punkte/Pixel wird reduziert
+POINTS_PER_PIXEL = 2
+
+
+def axis_pixel_width(ax, widget=None, default=800):
+    """
+    Breite einer Matplotlib-Achse in Pixeln
+
+    Mit widget (Tk-Frame des Canvas) wird dessen tatsächliche Breite
+    anteilig zur Achsen-Position verwendet, sonst die Figure-Größe.
+    """
+    try:
+        if widget is not None:
+            widget_width = widget.winfo_width()
+            if widget_width > 1:
+                return max(int(widget_width * ax.get_position().width), 1)
+        width = int(ax.get_window_extent().width)
+        return width if width > 0 else default
+    except Exception:
+        return default
+
+
+def _bucket_starts(n, n_buckets):
+    """Startpositionen gleich großer Buckets"""
+    n_buckets = max(1, min(int(n_buckets), n))
+    return np.unique(np.linspace(0, n, n_buckets + 1).astype(np.int64)[:-1])
+
+
+def _with_keep(indices, keep, n):
+    """Erzwungene Positionen (z.B. Signale) ergänzen"""
+    if keep is None:
+        return indices
+    keep = np.asarray(keep)
+    if keep.dtype == bool:
+        keep = np.flatnonzero(keep)
+    keep = keep[(keep >= 0) & (keep < n)]
+    return np.union1d(indices, keep.astype(np.int64))
+
+
+def _first_position_of(values, bucket_values, starts, sizes):
+    """Erste Position pro Bucket, an der values den Bucket-Wert annimmt"""
+    n = len(values)
+    hit = values == np.repeat(bucket_values, sizes)
+    candidates = np.where(hit, np.arange(n), n)
+    return np.minimum.reduceat(candidates, starts)
+
+
+def minmax_indices(values, n_buckets, keep=None):
+    """
+    Min/Max-Downsampling: pro Bucket erste, letzte, minimale und maximale Position
+
+    Args:
+        values: 1D-Werte (z.B. Close)
+        n_buckets: Anzahl Buckets (≈ Pixel-Breite)
+        keep: Positionen oder Bool-Maske, die immer erhalten bleiben
+
+    Returns:
+        Sortierte Positionen (int64)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if n <= POINTS_PER_PIXEL * n_buckets:
+        return np.arange(n)
+
+    starts = _bucket_starts(n, n_buckets)
+    sizes = np.diff(np.append(starts, n))
+    ends = starts + sizes - 1
+
+    # NaN darf kein Extremum sein
+    high = np.where(np.isnan(values), -np.inf, values)
+    low = np.where(np.isnan(values), np.inf, values)
+    argmax = _first_position_of(high, np.maximum.reduceat(high, starts), starts, sizes)
+    argmin = _first_position_of(low, np.minimum.reduceat(low, starts), starts, sizes)
+
+    indices = np.unique(np.concatenate([starts, ends, argmax, argmin]))
+    indices = indices[indices < n]
+    return _with_keep(indices, keep, n)
+
+
+def aggregate_ohlc(data, n_buckets):
+    """
+    OHLC pro Bucket aggregieren (Open erster, High max, Low min, Close letzter Wert)
+
+    Returns:
+        DataFrame mit einem Bar pro Bucket (Index = erster Zeitstempel des Buckets)
+    """
+    n = len(data)
+    if n <= POINTS_PER_PIXEL * n_buckets:
+        return data
+
+    starts = _bucket_starts(n, n_buckets)
+    ends = np.append(starts[1:], n) - 1
+    result = {
+        'open': data['open'].to_numpy()[starts],
+        'high': np.fmax.reduceat(data['high'].to_numpy(dtype=np.float64), starts),
+        'low': np.fmin.reduceat(data['low'].to_numpy(dtype=np.float64), starts),
+        'close': data['close'].to_numpy()[ends]
+    }
+    if 'volume' in data.columns:
+        result['volume'] = np.add.reduceat(np.nan_to_num(data['volume'].to_numpy(dtype=np.float64)), starts)
+    return pd.DataFrame(result, index=data.index[starts])
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _lttb_nb(x, y, n_out):
+        n = x.shape[0]
+        out = np.empty(n_out, dtype=np.int64)
+        out[0] = 0
+        out[n_out - 1] = n - 1
+        every = (n - 2) / (n_out - 2)
+        a = 0
+
+        for i in range(n_out - 2):
+            avg_start = int(np.floor((i + 1) * every)) + 1
+            avg_end = min(int(np.floor((i + 2) * every)) + 1, n)
+            avg_x = 0.0
+            avg_y = 0.0
+            for j in range(avg_start, avg_end):
+                avg_x += x[j]
+                avg_y += y[j]
+            count = max(avg_end - avg_start, 1)
+            avg_x /= count
+            avg_y /= count
+
+            range_start = int(np.floor(i * every)) + 1
+            range_end = int(np.floor((i + 1) * every)) + 1
+            best = range_start
+            best_area = -1.0
+            for j in range(range_start, range_end):
+                area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+                if area > best_area:
+                    best_area = area
+                    best = j
+            out[i + 1] = best
+            a = best
+
+        return out
+
+
+def _lttb_numpy(x, y, n_out):
+    """LTTB mit vektorisierter Flächenberechnung pro Bucket"""
+    n = len(x)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    every = (n - 2) / (n_out - 2)
+    bounds = (np.floor(np.arange(n_out) * every) + 1).astype(np.int64)
+    bounds = np.minimum(bounds, n)
+
+    # Mittelwerte aller Folge-Buckets vorab über kumulative Summen
+    csum_x = np.concatenate(([0.0], np.cumsum(x)))
+    csum_y = np.concatenate(([0.0], np.cumsum(y)))
+    avg_start, avg_end = bounds[1:-1], bounds[2:]
+    count = np.maximum(avg_end - avg_start, 1)
+    avg_x = (csum_x[avg_end] - csum_x[avg_start]) / count
+    avg_y = (csum_y[avg_end] - csum_y[avg_start]) / count
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        xs, ys = x[lo:hi], y[lo:hi]
+        area = np.abs((x[a] - avg_x[i]) * (ys - y[a]) - (x[a] - xs) * (avg_y[i] - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def lttb_indices(y, n_out, x=None, keep=None):
+    """
+    LTTB-Downsampling einer Linie
+
+    Args:
+        y: 1D-Werte (NaN-Lücken bleiben erhalten)
+        n_out: Ziel-Anzahl Punkte
+        x: X-Werte (Standard: Positionen)
+        keep: Positionen oder Bool-Maske, die immer erhalten bleiben
+
+    Returns:
+        Sortierte Positionen (int64)
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max(n_out, 3):
+        return np.arange(n)
+
+    valid = np.flatnonzero(~np.isnan(y))
+    if len(valid) <= max(n_out, 3):
+        selected = valid
+    else:
+        xs = (np.asarray(x, dtype=np.float64) if x is not None else np.arange(n, dtype=np.float64))[valid]
+        ys = y[valid]
+        if NUMBA_AVAILABLE:
+            selected = valid[_lttb_nb(xs, ys, int(n_out))]
+        else:
+            selected = valid[_lttb_numpy(xs, ys, int(n_out))]
+
+    # Übergänge zu NaN-Lücken erhalten, damit Linien dort unterbrochen bleiben
+    gaps = np.flatnonzero(np.diff(np.isnan(y).astype(np.int8)) != 0)
+    edges = np.concatenate([gaps, gaps + 1])
+    return _with_keep(np.union1d(selected, edges), keep, n)
+
+
+def _x_values(index):
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8.astype(np.float64)
+    return None
+
+
+def downsample_line(series, pixel_width, method='lttb', keep=None):
+    """
+    Serie für die Darstellung reduzieren
+
+    Args:
+        method: 'minmax' (Preise) oder 'lttb' (Indikatoren)
+
+    Returns:
+        Reduzierte Serie (Original, falls bereits klein genug)
+    """
+    n_buckets = max(int(pixel_width), 2)
+    if method == 'minmax':
+        indices = minmax_indices(series.to_numpy(dtype=np.float64), n_buckets, keep)
+    else:
+        indices = lttb_indices(
+            series.to_numpy(dtype=np.float64), POINTS_PER_PIXEL * n_buckets,
+            x=_x_values(series.index), keep=keep
+        )
+    if len(indices) == len(series):
+        return series
+    return series.iloc[indices]
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+🖼️ CHART MANAGER - VectorBT Pro GUI System
+Persistente Figure/Canvas pro Chart-Panel
+- Eine Figure + ein FigureCanvasTkAgg pro Panel, über alle Refreshes wiederverwendet
+- Achsen werden nur bei geändertem Layout neu aufgebaut
+- Artists (Linien, Scatter, Collections) werden in-place aktualisiert
+- Blitting: nur geänderte (animierte) Artists werden neu gezeichnet
+- Anzeige fertiger Bitmaps aus dem Render-Worker
+"""
+
+import tkinter as tk
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+class FigureState:
+    """
+    🧩 FIGURE-ZUSTAND
+    Figure + Layout-Schlüssel + Achsen-Slots + Artists nach Namen (ohne Anzeige)
+    """
+
+    def __init__(self, figure):
+        self.figure = figure
+        self.layout_key = None
+        self.slots = {}
+        self.artists = {}
+
+    # === LAYOUT ===
+
+    def ensure_layout(self, key):
+        """
+        Layout prüfen; bei Änderung Figure leeren
+
+        Returns:
+            True wenn neu aufgebaut werden muss
+        """
+        if key == self.layout_key:
+            return False
+        self.figure.clear()
+        self.slots = {}
+        self.artists = {}
+        self.layout_key = key
+        return True
+
+    # === ARTISTS ===
+
+    def line(self, name, ax, x, y, **style):
+        """Linie anlegen oder Daten in-place setzen"""
+        artist = self.artists.get(name)
+        if artist is None:
+            artist, = ax.plot(x, y, **style)
+            self.artists[name] = artist
+        else:
+            artist.set_data(x, y)
+        return artist
+
+    def scatter(self, name, ax, x, y, **style):
+        """Scatter anlegen oder Punkte in-place setzen"""
+        artist = self.artists.get(name)
+        if artist is None:
+            artist = ax.scatter(x, y, **style)
+            self.artists[name] = artist
+        else:
+            # Einheiten (z.B. Datum) wie beim Anlegen in Achsen-Koordinaten umrechnen
+            x = np.asarray(ax.convert_xunits(np.asarray(x)), dtype=np.float64)
+            y = np.asarray(ax.convert_yunits(np.asarray(y)), dtype=np.float64)
+            artist.set_offsets(np.column_stack([x, y]))
+        return artist
+
+
+class ChartPanel(FigureState):
+    """
+    🖼️ CHART-PANEL
+    Eine Figure + Canvas im Tk-Container; alternativ ein fertiges Bitmap (Render-Worker)
+    """
+
+    def __init__(self, parent, figsize=(12, 8), facecolor='#2b2b2b'):
+        # Figure ohne pyplot → kein globales Register, kein Leck bei Refreshes
+        super().__init__(Figure(figsize=figsize))
+        self.figure.patch.set_facecolor(facecolor)
+        self.parent = parent
+        self.facecolor = facecolor
+        self.canvas = FigureCanvasTkAgg(self.figure, parent)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        self.bitmap = None
+        self.bitmap_label = None
+        self.showing_bitmap = False
+        self.background = None
+        self.draw_count = 0
+        self.blit_count = 0
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def ensure_layout(self, key):
+        rebuild = super().ensure_layout(key)
+        if rebuild:
+            self.background = None
+        return rebuild
+
+    # === BITMAP-ANZEIGE ===
+
+    def show_bitmap(self, ppm_data):
+        """Im Hintergrund gerendertes Bild (PPM) statt des Canvas anzeigen"""
+        self.bitmap = tk.PhotoImage(data=ppm_data, format='PPM')
+        if self.bitmap_label is None:
+            self.bitmap_label = tk.Label(self.parent, bd=0, bg=self.facecolor)
+        self.bitmap_label.configure(image=self.bitmap)
+        if not self.showing_bitmap:
+            self.canvas.get_tk_widget().pack_forget()
+            self.bitmap_label.pack(fill=tk.BOTH, expand=True)
+            self.showing_bitmap = True
+
+    def _show_canvas(self):
+        if self.showing_bitmap:
+            self.bitmap_label.pack_forget()
+            self.bitmap = None
+            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self.showing_bitmap = False
+
+    def set_visible(self, name, visible):
+        """Sichtbarkeit eines Artists ändern (animiert → per Blitting)"""
+        artist = self.artists.get(name)
+        if artist is None:
+            return
+        artist.set_visible(visible)
+        if artist.get_animated():
+            self.blit()
+        else:
+            self.draw()
+
+    # === ZEICHNEN ===
+
+    def _animated_artists(self):
+        # Einträge können auch Artist-Gruppen sein (z.B. Kerzen: [Dochte, Körper])
+        animated = []
+        for entry in self.artists.values():
+            group = entry if isinstance(entry, (list, tuple)) else [entry]
+            animated.extend(artist for artist in group if artist.get_animated())
+        return animated
+
+    def _on_draw(self, event):
+        """Nach jedem vollen Draw: Hintergrund ohne animierte Artists sichern"""
+        self.draw_count += 1
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated_artists():
+            if artist.axes is not None:
+                artist.axes.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def draw(self):
+        """Vollständiger Redraw (nötig bei geänderten Achsen-Grenzen)"""
+        self._show_canvas()
+        self.canvas.draw_idle()
+
+    def blit(self):
+        """Nur animierte Artists auf den gesicherten Hintergrund zeichnen"""
+        if self.background is None:
+            self.canvas.draw()
+            return
+        self.blit_count += 1
+        self.canvas.restore_region(self.background)
+        self._draw_animated()
+
+    def get_stats(self):
+        """Redraw-Statistiken"""
+        return {'artists': len(self.artists), 'draws': self.draw_count, 'blits': self.blit_count}
+
+    def destroy(self):
+        """Panel entfernen"""
+        self.figure.clear()
+        self.canvas.get_tk_widget().destroy()
+        if self.bitmap_label is not None:
+            self.bitmap_label.destroy()
+
+
+class ChartManager:
+    """
+    🗂️ CHART-MANAGER
+    Ein Panel pro Container-Widget, über die Laufzeit der App wiederverwendet
+    """
+
+    def __init__(self):
+        self.panels = {}
+
+    def get_panel(self, parent, figsize=(12, 8)):
+        """Panel des Containers (beim ersten Aufruf angelegt)"""
+        panel = self.panels.get(id(parent))
+        if panel is None or not panel.canvas.get_tk_widget().winfo_exists():
+            # Platzhalter o.ä. entfernen – das Panel ist danach einziger Inhalt
+            for widget in parent.winfo_children():
+                widget.destroy()
+            panel = ChartPanel(parent, figsize)
+            self.panels[id(parent)] = panel
+        return panel
+
+    def release(self, parent):
+        """Panel eines Containers freigeben"""
+        panel = self.panels.pop(id(parent), None)
+        if panel is not None:
+            panel.destroy()
+
+
+# Globale Instanz
+chart_manager = ChartManager()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+🔺 CHART PYRAMID - VectorBT Pro GUI System
+Multi-Resolution OHLC-Pyramide für Pan/Zoom über Millionen Bars
+- Jede Stufe fasst die darunterliegende um Faktor 4 zusammen (OHLC exakt)
+- Einmal pro Datensatz aufgebaut und gecacht
+- Stufenwahl nach sichtbarem Bereich → pro Redraw nur ~Pixel-Breite Bars
+- Interaktiver Navigator: Mausrad = Zoom, Ziehen = Pan
+- X-Achse in Bar-Positionen (keine Lücken an Wochenenden)
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from matplotlib.ticker import FuncFormatter
+
+from resampling_engine import buffer_digest, index_fingerprint
+from chart_downsampling import axis_pixel_width
+
+PYRAMID_FACTOR = 4
+MIN_LEVEL_BARS = 256
+ZOOM_STEP = 1.25
+
+
+class PyramidLevel:
+    """
+    📶 PYRAMIDEN-STUFE
+    Aggregierte Bars; positions = erste Basis-Position jedes Bars, span = Basis-Bars pro Bar
+    """
+
+    def __init__(self, positions, span, open_, high, low, close, volume):
+        self.positions = positions
+        self.span = span
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    def __len__(self):
+        return len(self.positions)
+
+    def aggregate(self, factor):
+        """Nächsthöhere Stufe (Faktor Bars → 1 Bar)"""
+        n = len(self.positions)
+        starts = np.arange(0, n, factor)
+        ends = np.append(starts[1:], n) - 1
+        return PyramidLevel(
+            self.positions[starts],
+            self.span * factor,
+            self.open[starts],
+            np.fmax.reduceat(self.high, starts),
+            np.fmin.reduceat(self.low, starts),
+            self.close[ends],
+            np.add.reduceat(self.volume, starts)
+        )
+
+    def slice(self, start, end):
+        """Bars, die den Basis-Bereich [start, end) berühren"""
+        lo = max(int(np.searchsorted(self.positions, start, side='right')) - 1, 0)
+        hi = int(np.searchsorted(self.positions, end, side='left'))
+        return lo, hi
+
+
+class OHLCPyramid:
+    """
+    🔺 OHLC-PYRAMIDE
+    Stufe 0 = Originaldaten, Stufe k = Faktor^k Bars pro Bar
+    """
+
+    def __init__(self, data, factor=PYRAMID_FACTOR, min_bars=MIN_LEVEL_BARS):
+        self.factor = factor
+        self.index = data.index
+        n = len(data)
+
+        def column(name, fallback=None):
+            if name in data.columns:
+                return data[name].to_numpy(dtype=np.float64)
+            return fallback
+
+        close = column('close')
+        base = PyramidLevel(
+            np.arange(n, dtype=np.int64), 1,
+            column('open', close), column('high', close), column('low', close), close,
+            np.nan_to_num(column('volume', np.zeros(n)))
+        )
+
+        self.levels = [base]
+        while len(self.levels[-1]) > min_bars:
+            self.levels.append(self.levels[-1].aggregate(factor))
+
+    def __len__(self):
+        return len(self.index)
+
+    def level_for(self, visible_bars, target_bars):
+        """Feinste Stufe mit höchstens target_bars sichtbaren Bars"""
+        level = 0
+        while level < len(self.levels) - 1 and visible_bars / (self.factor ** level) > target_bars:
+            level += 1
+        return level
+
+    def window(self, start, end, target_bars):
+        """
+        Sichtbaren Bereich auf passender Stufe holen
+
+        Args:
+            start, end: Basis-Positionen (end exklusiv)
+            target_bars: Maximale Anzahl Bars (≈ Pixel-Breite)
+
+        Returns:
+            (Stufe, DataFrame mit OHLCV; Index = Bar-Mitte in Basis-Positionen)
+        """
+        start = max(int(np.floor(start)), 0)
+        end = min(int(np.ceil(end)), len(self))
+        level_no = self.level_for(max(end - start, 1), max(int(target_bars), 1))
+        level = self.levels[level_no]
+        lo, hi = level.slice(start, end)
+
+        centers = level.positions[lo:hi] + (level.span - 1) / 2.0
+        window = pd.DataFrame({
+            'open': level.open[lo:hi],
+            'high': level.high[lo:hi],
+            'low': level.low[lo:hi],
+            'close': level.close[lo:hi],
+            'volume': level.volume[lo:hi]
+        }, index=centers)
+        return level_no, window
+
+    def time_at(self, position):
+        """Zeitstempel einer (gebrochenen) Basis-Position"""
+        if len(self.index) == 0:
+            return None
+        position = min(max(int(round(position)), 0), len(self.index) - 1)
+        return self.index[position]
+
+    def format_position(self, position, pos=None):
+        """Achsen-Beschriftung einer Basis-Position"""
+        timestamp = self.time_at(position)
+        if timestamp is None:
+            return ''
+        if isinstance(timestamp, pd.Timestamp):
+            return timestamp.strftime('%Y-%m-%d\n%H:%M')
+        return str(timestamp)
+
+
+def _data_fingerprint(data):
+    """Index-Fingerabdruck + Digest der Close-Werte"""
+    close = data['close'].to_numpy() if 'close' in data.columns else np.empty(0)
+    return (index_fingerprint(data.index), buffer_digest(close))
+
+
+class PyramidCache:
+    """
+    ⚡ PYRAMIDEN-CACHE
+    LRU-Cache der Pyramiden pro Datensatz
+    """
+
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, data):
+        """Pyramide abrufen oder aufbauen"""
+        key = _data_fingerprint(data)
+
+        with self._lock:
+            pyramid = self._entries.get(key)
+            if pyramid is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return pyramid
+
+        pyramid = OHLCPyramid(data)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = pyramid
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return pyramid
+
+    def clear(self):
+        """Cache leeren"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """Cache-Statistiken"""
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Globale Instanz für alle Apps
+pyramid_cache = PyramidCache()
+
+
+def draw_price_window(ax, window, level_no):
+    """Standard-Darstellung: Close-Linie, ab Stufe 1 mit High/Low-Band"""
+    artists = ax.plot(window.index, window['close'], color='white', linewidth=1, label='Close')
+    if level_no > 0:
+        artists.append(ax.fill_between(window.index, window['low'], window['high'], color='white', alpha=0.15, linewidth=0))
+    return artists
+
+
+class PyramidNavigator:
+    """
+    🧭 PAN/ZOOM-NAVIGATOR
+    Zeichnet bei jeder Änderung des sichtbaren Bereichs nur die passende Pyramiden-Stufe
+    """
+
+    def __init__(self, ax, pyramid, widget=None, renderer=draw_price_window, on_view_change=None):
+        self.ax = ax
+        self.pyramid = pyramid
+        self.widget = widget
+        self.renderer = renderer
+        self.on_view_change = on_view_change
+        self.artists = []
+        self.drag_origin = None
+        self.view = (0.0, float(len(pyramid)))
+
+        canvas = ax.figure.canvas
+        self.connections = [
+            canvas.mpl_connect('scroll_event', self.on_scroll),
+            canvas.mpl_connect('button_press_event', self.on_press),
+            canvas.mpl_connect('motion_notify_event', self.on_motion),
+            canvas.mpl_connect('button_release_event', self.on_release)
+        ]
+        ax.xaxis.set_major_formatter(FuncFormatter(pyramid.format_position))
+
+    def set_view(self, start, end):
+        """Sichtbaren Bereich setzen (Basis-Positionen) und neu zeichnen"""
+        n = float(len(self.pyramid))
+        width = min(max(end - start, 10.0), n)
+        start = min(max(start, 0.0), n - width)
+        self.view = (start, start + width)
+        self.redraw()
+
+    def redraw(self):
+        """Sichtbaren Bereich auf passender Stufe zeichnen"""
+        for artist in self.artists:
+            artist.remove()
+
+        start, end = self.view
+        level_no, window = self.pyramid.window(start, end, axis_pixel_width(self.ax, self.widget))
+        self.artists = list(self.renderer(self.ax, window, level_no) or [])
+
+        self.ax.set_xlim(start - 0.5, end - 0.5)
+        if len(window):
+            low, high = np.nanmin(window['low'].to_numpy()), np.nanmax(window['high'].to_numpy())
+            if np.isfinite(low) and np.isfinite(high):
+                margin = (high - low) * 0.05 or abs(high) * 0.01 or 1.0
+                self.ax.set_ylim(low - margin, high + margin)
+
+        if self.on_view_change:
+            self.on_view_change(level_no, len(window))
+        self.ax.figure.canvas.draw_idle()
+
+    # === MAUS-EVENTS ===
+
+    def on_scroll(self, event):
+        if event.inaxes is not self.ax or event.xdata is None:
+            return
+        start, end = self.view
+        scale = 1 / ZOOM_STEP if event.button == 'up' else ZOOM_STEP
+        anchor = event.xdata
+        self.set_view(anchor - (anchor - start) * scale, anchor + (end - anchor) * scale)
+
+    def on_press(self, event):
+        if event.inaxes is self.ax and event.button == 1:
+            self.drag_origin = (event.x, self.view)
+
+    def on_motion(self, event):
+        if self.drag_origin is None or event.x is None:
+            return
+        origin_x, (start, end) = self.drag_origin
+        axis_width = max(self.ax.get_window_extent().width, 1)
+        shift = (origin_x - event.x) / axis_width * (end - start)
+        self.set_view(start + shift, end + shift)
+
+    def on_release(self, event):
+        self.drag_origin = None
+
+    def disconnect(self):
+        """Event-Verbindungen lösen"""
+        canvas = self.ax.figure.canvas
+        for connection in self.connections:
+            canvas.mpl_disconnect(connection)
+        self.connections = []
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+🕯️ CHART RENDERING - VectorBT Pro GUI System
+Vektorisierte Candlestick- und Volumen-Darstellung
+- Kerzen als eine LineCollection (Dochte) + eine PolyCollection (Körper)
+- Volumen als eine PolyCollection
+- Alle Vertices per NumPy in einem Schritt berechnet
+- Indikatoren: Overlays im Preis-Pane, übrige Familien mit je einer Achse pro Pane
+- X-Achse in Bar-Positionen, Beschriftung mit Zeitstempeln
+"""
+
+import numpy as np
+import pandas as pd
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.ticker import FuncFormatter
+
+from chart_downsampling import axis_pixel_width, aggregate_ohlc, downsample_line
+from timeframe_projection import indicator_columns_of
+
+UP_COLOR = '#26a69a'
+DOWN_COLOR = '#ef5350'
+BODY_WIDTH = 0.7
+MAX_INDICATOR_PANES = 3
+
+# Indikator-Familien, die im Preis-Pane liegen (gleiche Skala wie der Preis)
+OVERLAY_FAMILIES = ('ma', 'sma', 'ema', 'wma', 'bbands', 'vwap', 'kc')
+
+
+def _bar_width(x):
+    """Körper-Breite aus dem typischen Abstand der X-Werte"""
+    if len(x) < 2:
+        return BODY_WIDTH
+    return float(np.median(np.diff(x))) * BODY_WIDTH
+
+
+def candle_geometry(x, open_, high, low, close, width=BODY_WIDTH):
+    """
+    Vertices aller Kerzen
+
+    Returns:
+        (Dochte (n, 2, 2), Körper (n, 4, 2), Aufwärts-Maske)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    open_ = np.asarray(open_, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    half = np.broadcast_to(np.asarray(width, dtype=np.float64) / 2, x.shape)
+
+    wicks = np.empty((len(x), 2, 2))
+    wicks[:, :, 0] = x[:, None]
+    wicks[:, 0, 1] = low
+    wicks[:, 1, 1] = high
+
+    body_low = np.minimum(open_, close)
+    body_high = np.maximum(open_, close)
+    bodies = np.empty((len(x), 4, 2))
+    bodies[:, 0, 0] = bodies[:, 1, 0] = x - half
+    bodies[:, 2, 0] = bodies[:, 3, 0] = x + half
+    bodies[:, 0, 1] = bodies[:, 3, 1] = body_low
+    bodies[:, 1, 1] = bodies[:, 2, 1] = body_high
+
+    return wicks, bodies, close >= open_
+
+
+def _colors(up, up_color=UP_COLOR, down_color=DOWN_COLOR):
+    """RGBA-Farben pro Kerze"""
+    return np.where(up[:, None], np.array(to_rgba(up_color)), np.array(to_rgba(down_color)))
+
+
+def candlestick_collections(x, open_, high, low, close, width=BODY_WIDTH):
+    """Dochte und Körper als je eine Collection"""
+    wicks, bodies, up = candle_geometry(x, open_, high, low, close, width)
+    colors = _colors(up)
+    # Kanten in Körperfarbe → Doji (Open = Close) bleiben als Strich sichtbar
+    return (
+        LineCollection(wicks, colors=colors, linewidths=0.8),
+        PolyCollection(bodies, facecolors=colors, edgecolors=colors, linewidths=0.5)
+    )
+
+
+def volume_geometry(x, volume, width=BODY_WIDTH):
+    """Vertices aller Volumen-Balken (n, 4, 2)"""
+    x = np.asarray(x, dtype=np.float64)
+    volume = np.nan_to_num(np.asarray(volume, dtype=np.float64))
+    half = np.broadcast_to(np.asarray(width, dtype=np.float64) / 2, x.shape)
+
+    bars = np.zeros((len(x), 4, 2))
+    bars[:, 0, 0] = bars[:, 1, 0] = x - half
+    bars[:, 2, 0] = bars[:, 3, 0] = x + half
+    bars[:, 1, 1] = bars[:, 2, 1] = volume
+    return bars
+
+
+def _volume_colors(up):
+    colors = _colors(up)
+    colors[:, 3] = 0.6
+    return colors
+
+
+def volume_collection(x, volume, up, width=BODY_WIDTH):
+    """Volumen-Balken als eine PolyCollection"""
+    return PolyCollection(volume_geometry(x, volume, width), facecolors=_volume_colors(up), edgecolors='none')
+
+
+def _candle_limits(ax, ohlc, x, width):
+    """Collections lösen kein Autoscaling aus → Grenzen direkt setzen"""
+    if not len(x):
+        return
+    low, high = np.nanmin(ohlc['low'].to_numpy()), np.nanmax(ohlc['high'].to_numpy())
+    if np.isfinite(low) and np.isfinite(high):
+        margin = (high - low) * 0.05 or abs(high) * 0.01 or 1.0
+        ax.set_ylim(low - margin, high + margin)
+    pad = np.max(width)
+    ax.set_xlim(x[0] - pad, x[-1] + pad)
+
+
+def draw_candles(ax, ohlc, x=None, width=None, existing=None):
+    """
+    Kerzen in eine Achse zeichnen
+
+    Args:
+        ohlc: DataFrame mit open/high/low/close
+        x: X-Werte (Standard: Index von ohlc)
+        width: Körper-Breite (Standard: aus dem Abstand der X-Werte)
+        existing: Bereits vorhandene [Dochte, Körper] → Vertices in-place ersetzen
+
+    Returns:
+        Liste der Artists
+    """
+    x = np.asarray(ohlc.index if x is None else x, dtype=np.float64)
+    width = _bar_width(x) if width is None else width
+    columns = (ohlc['open'].to_numpy(), ohlc['high'].to_numpy(), ohlc['low'].to_numpy(), ohlc['close'].to_numpy())
+
+    if existing is None:
+        wicks, bodies = candlestick_collections(x, *columns, width)
+        ax.add_collection(wicks, autolim=False)
+        ax.add_collection(bodies, autolim=False)
+    else:
+        wicks, bodies = existing
+        wick_vertices, body_vertices, up = candle_geometry(x, *columns, width)
+        colors = _colors(up)
+        wicks.set_segments(wick_vertices)
+        wicks.set_colors(colors)
+        bodies.set_verts(body_vertices)
+        bodies.set_facecolors(colors)
+        bodies.set_edgecolors(colors)
+
+    _candle_limits(ax, ohlc, x, width)
+    return [wicks, bodies]
+
+
+def draw_volume(ax, ohlc, x=None, width=None, existing=None):
+    """Volumen-Balken zeichnen (Farbe nach Kerzenrichtung; existing → in-place)"""
+    x = np.asarray(ohlc.index if x is None else x, dtype=np.float64)
+    width = _bar_width(x) if width is None else width
+    up = ohlc['close'].to_numpy() >= ohlc['open'].to_numpy()
+    if existing is None:
+        bars = volume_collection(x, ohlc['volume'].to_numpy(), up, width)
+        ax.add_collection(bars, autolim=False)
+    else:
+        bars = existing[0]
+        bars.set_verts(volume_geometry(x, ohlc['volume'].to_numpy(), width))
+        bars.set_facecolors(_volume_colors(up))
+    if len(x):
+        ax.set_ylim(0, max(np.nanmax(np.nan_to_num(ohlc['volume'].to_numpy())), 1) * 1.05)
+    return [bars]
+
+
+def draw_candles_window(ax, window, level_no=0):
+    """Renderer für den PyramidNavigator (Kerzen statt Close-Linie)"""
+    return draw_candles(ax, window)
+
+
+def indicator_family(column):
+    """Indikator-Familie aus dem Spaltennamen (z.B. 'MACD_signal' → 'macd')"""
+    return str(column).split('@')[0].split('_')[0].lower()
+
+
+def indicator_panes(columns):
+    """
+    Indikator-Spalten auf Panes verteilen
+
+    Returns:
+        (Overlay-Spalten für den Preis-Pane, Liste von Spalten-Listen je Pane)
+    """
+    overlays = []
+    panes = {}
+    for column in columns:
+        family = indicator_family(column)
+        if family in OVERLAY_FAMILIES:
+            overlays.append(column)
+        else:
+            panes.setdefault(family, []).append(column)
+    return overlays, list(panes.values())
+
+
+def prepare_ohlc(data, pixel_width=None):
+    """
+    OHLCV auf Bar-Positionen bringen, bei Bedarf pro Pixel-Bucket aggregiert
+
+    Returns:
+        (DataFrame mit Index = Bar-Mitte in Positionen, Körper-Breiten)
+    """
+    positional = data.reset_index(drop=True)
+    if pixel_width is None:
+        return positional, BODY_WIDTH
+
+    aggregated = aggregate_ohlc(positional, max(int(pixel_width) // 2, 1))
+    if aggregated is positional:
+        return positional, BODY_WIDTH
+
+    starts = aggregated.index.to_numpy(dtype=np.float64)
+    spans = np.diff(np.append(starts, len(positional)))
+    aggregated.index = starts + (spans - 1) / 2
+    return aggregated, spans * BODY_WIDTH
+
+
+def position_formatter(index):
+    """Achsen-Beschriftung: Bar-Position → Zeitstempel"""
+    def format_position(position, pos=None):
+        if len(index) == 0:
+            return ''
+        timestamp = index[min(max(int(round(position)), 0), len(index) - 1)]
+        if isinstance(timestamp, pd.Timestamp):
+            return timestamp.strftime('%Y-%m-%d\n%H:%M')
+        return str(timestamp)
+    return FuncFormatter(format_position)
+
+
+def chart_layout(data, show_volume=True):
+    """Layout-Schlüssel eines Charts (gleicher Schlüssel → Achsen wiederverwendbar)"""
+    overlays, panes = indicator_panes(indicator_columns_of(data))
+    has_volume = show_volume and 'volume' in data.columns
+    return tuple(overlays), tuple(tuple(columns) for columns in panes[:MAX_INDICATOR_PANES]), has_volume
+
+
+def render_chart(fig, spec, data, title=None, widget=None, show_volume=True, axes=None, artists=None, prefix=''):
+    """
+    Vollständigen Chart (Preis, Volumen, Indikator-Panes) in einen Gridspec-Bereich zeichnen
+
+    Args:
+        fig: Matplotlib-Figure
+        spec: SubplotSpec des Bereichs (nur beim Neuaufbau nötig)
+        data: DataFrame mit OHLCV (+ Indikator-Spalten)
+        widget: Tk-Frame des Canvas (für die Pixel-Breite)
+        axes: Achsen eines früheren Aufrufs mit gleichem chart_layout → Wiederverwendung
+        artists: Dict für Artists (z.B. ChartPanel.artists) → Updates in-place
+        prefix: Namens-Präfix der Artists (ein Präfix pro Chart)
+
+    Returns:
+        Liste der Achsen (Preis zuerst)
+    """
+    overlays, panes, has_volume = chart_layout(data, show_volume)
+    if len(indicator_panes(indicator_columns_of(data))[1]) > MAX_INDICATOR_PANES:
+        print(f"⚠️ Zu viele Indikator-Panes - nur die ersten {MAX_INDICATOR_PANES} werden angezeigt")
+
+    artists = {} if artists is None else artists
+    if axes is None:
+        ratios = [4] + ([1] if has_volume else []) + [1.5] * len(panes)
+        grid = spec.subgridspec(len(ratios), 1, height_ratios=ratios, hspace=0.05)
+        price_ax = fig.add_subplot(grid[0])
+        axes = [price_ax] + [fig.add_subplot(grid[i], sharex=price_ax) for i in range(1, len(ratios))]
+        for ax in axes:
+            ax.grid(True, alpha=0.3)
+    price_ax = axes[0]
+
+    pixel_width = axis_pixel_width(price_ax, widget)
+    ohlc, width = prepare_ohlc(data[['open', 'high', 'low', 'close'] + (['volume'] if has_volume else [])], pixel_width)
+    artists[prefix + 'candles'] = draw_candles(price_ax, ohlc, width=width, existing=artists.get(prefix + 'candles'))
+
+    # Indikator-Linien über Positionen (LTTB auf Pixel-Breite)
+    def plot_line(ax, column):
+        line = downsample_line(pd.Series(data[column].to_numpy(), index=np.arange(len(data))), pixel_width)
+        key = f"{prefix}line:{column}"
+        if key in artists:
+            artists[key].set_data(line.index, line.to_numpy())
+        else:
+            artists[key], = ax.plot(line.index, line.to_numpy(), linewidth=1, alpha=0.8, label=str(column))
+
+    for column in overlays:
+        plot_line(price_ax, column)
+
+    pane_axes = axes[1:]
+    if has_volume:
+        artists[prefix + 'volume'] = draw_volume(pane_axes[0], ohlc, width=width, existing=artists.get(prefix + 'volume'))
+        pane_axes[0].set_ylabel('Vol')
+        pane_axes = pane_axes[1:]
+
+    for ax, columns in zip(pane_axes, panes):
+        for column in columns:
+            plot_line(ax, column)
+        ax.relim()
+        ax.autoscale_view(scalex=False)
+        if ax.get_legend() is None:
+            ax.legend(loc='upper left', fontsize=7)
+
+    if title:
+        price_ax.set_title(title)
+    if overlays and price_ax.get_legend() is None:
+        price_ax.legend(loc='upper left', fontsize=7)
+
+    formatter = position_formatter(data.index)
+    for ax in axes:
+        ax.xaxis.set_major_formatter(formatter)
+        ax.tick_params(axis='x', labelbottom=ax is axes[-1])
+    return axes
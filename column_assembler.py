@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+🧱 COLUMN ASSEMBLER - VectorBT Pro GUI System
+Zusammensetzen von Indikator-Outputs ohne Kopien der Basisdaten
+- Ein vorab allokierter, zusammenhängender Float-Block pro Timeframe und Datentyp (Grids bleiben float32)
+- Outputs eines Indikators liegen nebeneinander (z.B. MACD macd/signal/histogram)
+- Spaltenweise C-zusammenhängend (jede Spalte ein durchgehender Speicherbereich)
+- Verbindung mit dem OHLCV-Block ohne Kopie der Basisdaten
+"""
+
+import numpy as np
+import pandas as pd
+
+# Pandas < 3: Kopie bei concat explizit abschalten (ab 3.0 Copy-on-Write)
+_CONCAT_KWARGS = {} if int(pd.__version__.split('.')[0]) >= 3 else {'copy': False}
+
+
+def _grid_columns(short_name, grid_result, index):
+    """Grid-Ergebnis als (Spaltenname, Werte)-Paare (Namen wie flatten_grid_block)"""
+    multi_output = len(grid_result) > 1
+    for output_name, block in grid_result.items():
+        prefix = f"{short_name}_{output_name}" if multi_output else short_name
+        if not block.index.equals(index):
+            block = block.reindex(index)
+        values = block.to_numpy()
+        for j, column in enumerate(block.columns):
+            labels = column if isinstance(column, tuple) else (column,)
+            yield prefix + "_" + "_".join(str(v) for v in labels), values[:, j]
+
+
+def indicator_columns(indicator_result, index):
+    """
+    Spalten eines Ergebnis-Eintrags (Format von calculated_indicators)
+
+    Returns:
+        Liste (Spaltenname, 1D-Werte) – an index ausgerichtet
+    """
+    indicator_data = indicator_result['data']
+    short_name = indicator_result['indicator'].replace("vbt:", "")
+
+    def aligned(values):
+        if isinstance(values, (pd.Series, pd.DataFrame)):
+            if not values.index.equals(index):
+                values = values.reindex(index)
+            values = values.to_numpy()
+        return np.asarray(values).reshape(len(index), -1)[:, 0]
+
+    if indicator_result.get('param_grid'):
+        return list(_grid_columns(short_name, indicator_data, index))
+    if isinstance(indicator_data, dict):
+        return [(f"{short_name}_{output_name}", aligned(values)) for output_name, values in indicator_data.items()]
+    return [(short_name, aligned(indicator_data))]
+
+
+def _column_block(index, columns, dtype):
+    """Spalten in einen vorab allokierten Block schreiben"""
+    # (Spalten, Zeilen) C-zusammenhängend → jede Spalte durchgehend im Speicher
+    storage = np.empty((len(columns), len(index)), dtype=dtype)
+    for j, values in enumerate(columns.values()):
+        storage[j] = values
+    return pd.DataFrame(storage.T, index=index, columns=list(columns), copy=False)
+
+
+def assemble_indicator_block(index, indicator_results, dtype=None):
+    """
+    Alle Indikator-Outputs eines Timeframes in Blöcke schreiben
+
+    Args:
+        index: Index der Basisdaten
+        indicator_results: Ergebnis-Einträge dieses Timeframes (Reihenfolge = Spalten)
+        dtype: Einheitlicher Block-Datentyp (Standard: ein Block pro Datentyp, float32-Outputs
+               wie Grids bleiben float32, alle übrigen float64)
+
+    Returns:
+        DataFrame mit einem Float-Block pro Datentyp (Spalten nach Datentyp gruppiert)
+    """
+    # Spätere Einträge überschreiben gleichnamige frühere (wie Spalten-Zuweisung)
+    columns = {}
+    for indicator_result in indicator_results:
+        for name, values in indicator_columns(indicator_result, index):
+            columns.pop(name, None)
+            columns[name] = values
+
+    if dtype is not None:
+        return _column_block(index, columns, dtype)
+
+    groups = {}
+    for name, values in columns.items():
+        group_dtype = np.float32 if values.dtype == np.float32 else np.float64
+        groups.setdefault(group_dtype, {})[name] = values
+    if len(groups) <= 1:
+        return _column_block(index, columns, next(iter(groups), np.float64))
+
+    blocks = [_column_block(index, group, group_dtype) for group_dtype, group in groups.items()]
+    return pd.concat(blocks, axis=1, **_CONCAT_KWARGS)
+
+
+def join_block(base, block):
+    """Basisdaten und Indikator-Block verbinden (Basisdaten werden nicht kopiert)"""
+    overlapping = [column for column in block.columns if column in base.columns]
+    if overlapping:
+        # Neue Indikator-Werte ersetzen gleichnamige Spalten der Basis
+        base = base.drop(columns=overlapping)
+    return pd.concat([base, block], axis=1, **_CONCAT_KWARGS)
+
+
+def assemble_timeframe(base, indicator_results, dtype=None):
+    """
+    Basisdaten + Indikatoren eines Timeframes
+
+    Returns:
+        (kombinierter DataFrame, Indikator-Block)
+    """
+    block = assemble_indicator_block(base.index, indicator_results, dtype)
+    return join_block(base, block), block
@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+"""
+🧭 CONDITION ENGINE - VectorBT Pro GUI System
+Kompilierte Auswertung der Strategie-Bedingungen (App 6 → App 7)
+- Entry/Exit-Bedingungen + Logik werden einmal in Tabellen übersetzt
+- Vergleiche gegen Konstanten oder andere Spalten (close > SMA_50)
+- Crossover ohne verschobene Arrays, rising/falling über N Bars
+- Zeitfenster: Bedingung innerhalb der letzten N Bars (any) bzw. durchgehend (all)
+- Ein fusionierter Numba-Kernel: ein Durchlauf in cache-großen Blöcken über die Indikator-Arrays
+- Entries und Exits gleichzeitig, Ergebnis als gepackte Bits (1 Bit pro Bar)
+- NumPy-Fallback ohne Numba (gleiche Semantik)
+- Custom Logic (C1..Cn, Ausdrücke) über strategy_expression
+- Benchmark gegen die bisherige Pandas-Auswertung
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+# Numba für den fusionierten Kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Operator-Codes (Reihenfolge = Kernel-Codes)
+COMPARISON_OPERATORS = ('>', '<', '>=', '<=', '==', '!=')
+OPERATORS = COMPARISON_OPERATORS + ('crosses_above', 'crosses_below', 'rising', 'falling')
+OPERATOR_CODES = {op: code for code, op in enumerate(OPERATORS)}
+OP_CROSSES_ABOVE = OPERATOR_CODES['crosses_above']
+OP_CROSSES_BELOW = OPERATOR_CODES['crosses_below']
+OP_RISING = OPERATOR_CODES['rising']
+OP_FALLING = OPERATOR_CODES['falling']
+
+# Zeitfenster-Modi: Bedingung in mindestens einem / allen der letzten N Bars
+WINDOW_MODES = ('any', 'all')
+
+LOGIC_AND = 0
+LOGIC_OR = 1
+
+# Anzahl gesetzter Bits pro Byte (Zählen gepackter Signale)
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+def packed_length(n_bars):
+    """Bytes für n_bars gepackte Signale"""
+    return (n_bars + 7) // 8
+
+
+def unpack_signals(packed, n_bars, index=None):
+    """
+    Gepackte Signale entpacken
+
+    Returns:
+        Bool-Array (oder Series, wenn index angegeben)
+    """
+    signals = np.unpackbits(packed, count=n_bars).view(bool)
+    if index is not None:
+        return pd.Series(signals, index=index)
+    return signals
+
+
+def count_signals(packed):
+    """Gesetzte Signale zählen, ohne zu entpacken"""
+    return int(_POPCOUNT[packed].sum())
+
+
+def _comparison(values, code, value):
+    """Vektorisierter Vergleich (NaN-Semantik wie Pandas: nur != ist wahr)"""
+    if code == 0:
+        return values > value
+    if code == 1:
+        return values < value
+    if code == 2:
+        return values >= value
+    if code == 3:
+        return values <= value
+    if code == 4:
+        return values == value
+    return values != value
+
+
+def _condition_numpy(x, rhs, code):
+    """
+    Roh-Signal einer Bedingung (NumPy)
+
+    Args:
+        x: Linker Operand (Array)
+        rhs: Rechter Operand (Array oder Konstante; bei rising/falling Anzahl Bars)
+        code: Operator-Code
+    """
+    n = len(x)
+    if code < OP_CROSSES_ABOVE:
+        return np.asarray(_comparison(x, code, rhs), dtype=bool)
+
+    result = np.zeros(n, dtype=bool)
+    if code in (OP_CROSSES_ABOVE, OP_CROSSES_BELOW):
+        # Kreuzung über Slices statt verschobener Kopien: jetzt über/unter, vorher nicht
+        rhs = np.broadcast_to(rhs, x.shape)
+        now, prev = (0, 3) if code == OP_CROSSES_ABOVE else (1, 2)
+        if n > 1:
+            result[1:] = _comparison(x[1:], now, rhs[1:]) & _comparison(x[:-1], prev, rhs[:-1])
+        return result
+
+    # rising/falling: Wert gegenüber vor period Bars
+    period = int(rhs)
+    if n > period:
+        result[period:] = _comparison(x[period:], 0 if code == OP_RISING else 1, x[:-period])
+    return result
+
+
+def _window_numpy(signal, window, require_all):
+    """Rolling any/all über window Bars (kumulative Summe statt Rolling-Objekt)"""
+    counts = np.cumsum(signal, dtype=np.int64)
+    in_window = counts.copy()
+    in_window[window:] -= counts[:-window]
+    if require_all:
+        result = in_window == window
+        result[:window - 1] = False
+        return result
+    return in_window > 0
+
+
+# Zeilen pro Block: Block bleibt im L1/L2-Cache, alle Bedingungen laufen über denselben Block
+BLOCK_ROWS = 4096
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True, inline='always')
+    def _compare_nb(a, b, code):
+        if code == 0:
+            return a > b
+        if code == 1:
+            return a < b
+        if code == 2:
+            return a >= b
+        if code == 3:
+            return a <= b
+        if code == 4:
+            return a == b
+        return a != b
+
+    @njit(cache=True, nogil=True)
+    def _compare_constant_nb(xs, value, code, out):
+        # Eigene kleine Schleife: Operator-Verzweigung wird herausgezogen → SIMD
+        for j in range(out.shape[0]):
+            out[j] = _compare_nb(xs[j], value, code)
+
+    @njit(cache=True, nogil=True)
+    def _compare_columns_nb(xs, ys, code, out):
+        for j in range(out.shape[0]):
+            out[j] = _compare_nb(xs[j], ys[j], code)
+
+    @njit(cache=True, nogil=True)
+    def _condition_nb(x, y, use_column, value, code, start, out):
+        # Roh-Signal für Zeilen [start, start + len(out))
+        m = out.shape[0]
+        if code <= 5:
+            if use_column:
+                _compare_columns_nb(x[start:start + m], y[start:start + m], code, out)
+            else:
+                _compare_constant_nb(x[start:start + m], value, code, out)
+        elif code <= 7:
+            # Kreuzung: direkter Zugriff auf Vorgänger-Zeile (auch über Blockgrenzen), keine Kopie
+            now = 0 if code == 6 else 1
+            prev = 3 if code == 6 else 2
+            first = 0
+            if start == 0:
+                out[0] = False
+                first = 1
+            for j in range(first, m):
+                i = start + j
+                if use_column:
+                    out[j] = _compare_nb(x[i], y[i], now) and _compare_nb(x[i - 1], y[i - 1], prev)
+                else:
+                    out[j] = _compare_nb(x[i], value, now) and _compare_nb(x[i - 1], value, prev)
+        else:
+            period = int(value)
+            direction = 0 if code == 8 else 1
+            for j in range(m):
+                i = start + j
+                out[j] = i >= period and _compare_nb(x[i], x[i - period], direction)
+
+    @njit(cache=True, nogil=True)
+    def _window_nb(out, start, window, require_all, state, c):
+        # state[c]: letzte Zeile mit wahrem (any) bzw. falschem (all) Roh-Signal, blockübergreifend
+        last = state[c]
+        for j in range(out.shape[0]):
+            i = start + j
+            if require_all:
+                if not out[j]:
+                    last = i
+                out[j] = i - last >= window
+            else:
+                if out[j]:
+                    last = i
+                out[j] = i - last < window
+        state[c] = last
+
+    @njit(cache=True, nogil=True)
+    def _pack_nb(acc, out):
+        # Bit-Reihenfolge wie np.packbits (erstes Bar = höchstes Bit)
+        m = acc.shape[0]
+        full = m // 8
+        for b in range(full):
+            k = b * 8
+            out[b] = ((np.uint8(acc[k]) << 7) | (np.uint8(acc[k + 1]) << 6) | (np.uint8(acc[k + 2]) << 5)
+                      | (np.uint8(acc[k + 3]) << 4) | (np.uint8(acc[k + 4]) << 3) | (np.uint8(acc[k + 5]) << 2)
+                      | (np.uint8(acc[k + 6]) << 1) | np.uint8(acc[k + 7]))
+        if full * 8 < m:
+            last = np.uint8(0)
+            for j in range(m - full * 8):
+                last |= np.uint8(acc[full * 8 + j]) << (7 - j)
+            out[full] = last
+
+    @njit(cache=True, nogil=True)
+    def _evaluate_nb(columns, n, cond_column, cond_op, cond_right, cond_value, cond_window, cond_all,
+                     n_entry, entry_logic, exit_logic):
+        n_cond = cond_column.shape[0]
+        entries = np.zeros((n + 7) // 8, dtype=np.uint8)
+        exits = np.zeros((n + 7) // 8, dtype=np.uint8)
+        acc_buffer = np.empty(BLOCK_ROWS, dtype=np.bool_)
+        raw_buffer = np.empty(BLOCK_ROWS, dtype=np.bool_)
+
+        # Fenster-Zustand: "nie wahr" (any) bzw. "vor Datenbeginn falsch" (all)
+        state = np.empty(n_cond, dtype=np.int64)
+        for c in range(n_cond):
+            state[c] = -1 if cond_all[c] else -cond_window[c] - 1
+
+        for start in range(0, n, BLOCK_ROWS):
+            m = min(BLOCK_ROWS, n - start)
+            acc = acc_buffer[:m]
+            raw = raw_buffer[:m]
+            for side in range(2):
+                first = 0 if side == 0 else n_entry
+                last = n_entry if side == 0 else n_cond
+                logic = entry_logic if side == 0 else exit_logic
+                # Keine Bedingungen → kein Signal (Ausgabe bleibt 0)
+                if first == last:
+                    continue
+                for c in range(first, last):
+                    right = cond_right[c]
+                    x = columns[cond_column[c]]
+                    y = columns[right] if right >= 0 else x
+                    target = acc if c == first else raw
+                    _condition_nb(x, y, right >= 0, cond_value[c], cond_op[c], start, target)
+                    if cond_window[c] > 1:
+                        _window_nb(target, start, cond_window[c], cond_all[c], state, c)
+                    if c == first:
+                        continue
+                    if logic == 0:
+                        for j in range(m):
+                            acc[j] &= raw[j]
+                    else:
+                        for j in range(m):
+                            acc[j] |= raw[j]
+                out = entries if side == 0 else exits
+                _pack_nb(acc, out[start // 8:(start + m + 7) // 8])
+        return entries, exits
+
+
+class CompiledConditions:
+    """
+    ⚙️ KOMPILIERTE BEDINGUNGEN
+    Bedingungstabellen (Spalte, Operator, Operand, Fenster) für Entries und Exits
+    """
+
+    def __init__(self, columns, cond_column, cond_op, cond_value, n_entry, entry_logic, exit_logic, skipped=(),
+                 cond_right=None, cond_window=None, cond_all=None):
+        self.columns = list(columns)
+        self.cond_column = np.asarray(cond_column, dtype=np.int64)
+        self.cond_op = np.asarray(cond_op, dtype=np.int64)
+        self.cond_value = np.asarray(cond_value, dtype=np.float64)
+        n_cond = len(self.cond_column)
+        # Rechter Operand: Spalten-Slot oder -1 (Konstante in cond_value)
+        self.cond_right = np.asarray(cond_right if cond_right is not None else [-1] * n_cond, dtype=np.int64)
+        self.cond_window = np.asarray(cond_window if cond_window is not None else [1] * n_cond, dtype=np.int64)
+        self.cond_all = np.asarray(cond_all if cond_all is not None else [False] * n_cond, dtype=np.bool_)
+        self.n_entry = int(n_entry)
+        self.entry_logic = int(entry_logic)
+        self.exit_logic = int(exit_logic)
+        self.skipped = list(skipped)
+
+    @property
+    def lookback(self):
+        """Bars vor dem aktuellen Bar, die das Ergebnis beeinflussen (Kreuzung, rising/falling, Fenster)"""
+        lookback = 0
+        for c in range(len(self.cond_column)):
+            code = self.cond_op[c]
+            if code in (OP_CROSSES_ABOVE, OP_CROSSES_BELOW):
+                reach = 1
+            elif code in (OP_RISING, OP_FALLING):
+                reach = int(self.cond_value[c])
+            else:
+                reach = 0
+            lookback = max(lookback, reach + int(self.cond_window[c]) - 1)
+        return lookback
+
+    def _arrays(self, data):
+        # Nur nicht-float64 Spalten werden konvertiert (sonst Sicht auf die Daten)
+        return tuple(np.ascontiguousarray(data[column].to_numpy(), dtype=np.float64) for column in self.columns)
+
+    def evaluate(self, data):
+        """
+        Entries/Exits in einem Durchlauf berechnen
+
+        Returns:
+            (entries, exits) als gepackte uint8-Arrays (np.packbits-Layout)
+        """
+        n = len(data)
+        if not self.columns:
+            return np.zeros(packed_length(n), dtype=np.uint8), np.zeros(packed_length(n), dtype=np.uint8)
+
+        arrays = self._arrays(data)
+        if NUMBA_AVAILABLE:
+            return _evaluate_nb(arrays, n, self.cond_column, self.cond_op, self.cond_right, self.cond_value,
+                                self.cond_window, self.cond_all, self.n_entry, self.entry_logic, self.exit_logic)
+        return self._evaluate_numpy(arrays, n)
+
+    def _evaluate_numpy(self, arrays, n):
+        """NumPy-Fallback: ein Array pro Bedingung, in-place kombiniert"""
+        def condition(c):
+            right = self.cond_right[c]
+            rhs = arrays[right] if right >= 0 else self.cond_value[c]
+            signal = _condition_numpy(arrays[self.cond_column[c]], rhs, self.cond_op[c])
+            if self.cond_window[c] > 1:
+                signal = _window_numpy(signal, int(self.cond_window[c]), bool(self.cond_all[c]))
+            return signal
+
+        def combine(first, last, logic):
+            if first == last:
+                return np.zeros(n, dtype=bool)
+            result = None
+            for c in range(first, last):
+                signal = condition(c)
+                if result is None:
+                    result = signal
+                elif logic == LOGIC_AND:
+                    np.logical_and(result, signal, out=result)
+                else:
+                    np.logical_or(result, signal, out=result)
+            return result
+
+        entries = combine(0, self.n_entry, self.entry_logic)
+        exits = combine(self.n_entry, len(self.cond_column), self.exit_logic)
+        return np.packbits(entries), np.packbits(exits)
+
+    def signals(self, data):
+        """Entries/Exits als Bool-Series (entpackt)"""
+        entries, exits = self.evaluate(data)
+        return unpack_signals(entries, len(data), data.index), unpack_signals(exits, len(data), data.index)
+
+
+def _logic_code(logic):
+    if logic == 'OR':
+        return LOGIC_OR
+    if logic not in ('AND', None):
+        print(f"⚠️ Logik '{logic}' wird als AND ausgewertet")
+    return LOGIC_AND
+
+
+def parse_operand(value, columns):
+    """
+    Rechten Operand deuten: Zahl → Konstante, sonst Spaltenname
+
+    Returns:
+        (float, None) oder (None, Spaltenname); (None, None) wenn unbekannt
+    """
+    if isinstance(value, (int, float, np.number)):
+        return float(value), None
+    text = str(value).strip()
+    try:
+        return float(text), None
+    except ValueError:
+        pass
+    if text in columns:
+        return None, text
+    return None, None
+
+
+def condition_text(condition):
+    """Anzeige-Text einer Bedingung (z.B. 'RSI crosses_below 30 [any 5]')"""
+    text = f"{condition['indicator']} {condition['operator']} {condition['value']}"
+    window = int(condition.get('window', 1) or 1)
+    if window > 1:
+        text += f" [{condition.get('window_mode', 'any')} {window}]"
+    return text
+
+
+def compile_conditions(strategy_config, columns):
+    """
+    Strategie-Konfiguration (App 6) kompilieren
+
+    Bedingung: {'indicator', 'operator', 'value', optional 'window', 'window_mode'}
+    - value: Konstante oder Spaltenname (bei rising/falling: Anzahl Bars)
+    - window > 1: Bedingung in einem (any) bzw. allen (all) der letzten window Bars
+
+    Args:
+        strategy_config: Dict mit entry_conditions, exit_conditions, logic
+        columns: Verfügbare Spalten der Daten
+
+    Returns:
+        CompiledConditions (bzw. ExpressionRules bei logic == 'CUSTOM')
+    """
+    if strategy_config.get('logic') == 'CUSTOM':
+        from strategy_expression import compile_rules
+        return compile_rules(strategy_config, columns)
+
+    available = set(columns)
+    used_columns = []
+    column_slots = {}
+    cond_column, cond_op, cond_right, cond_value, cond_window, cond_all = [], [], [], [], [], []
+    skipped = []
+
+    def slot(column):
+        if column not in column_slots:
+            column_slots[column] = len(used_columns)
+            used_columns.append(column)
+        return column_slots[column]
+
+    def add(conditions):
+        added = 0
+        for condition in conditions:
+            indicator = condition['indicator']
+            operator = condition['operator']
+            if operator not in OPERATOR_CODES:
+                raise ValueError(f"Unbekannter Operator: {operator}")
+            code = OPERATOR_CODES[operator]
+
+            window = int(condition.get('window', 1) or 1)
+            window_mode = condition.get('window_mode', 'any')
+            if window < 1 or window_mode not in WINDOW_MODES:
+                raise ValueError(f"Ungültiges Zeitfenster: {window} ({window_mode})")
+
+            if code in (OP_RISING, OP_FALLING):
+                constant, right = float(int(float(condition.get('value') or 1))), None
+                if constant < 1:
+                    raise ValueError(f"{operator}: Anzahl Bars muss >= 1 sein")
+            else:
+                constant, right = parse_operand(condition['value'], available)
+
+            # Fehlende Indikatoren/Operanden werden wie bisher übersprungen
+            if indicator not in available or (constant is None and right is None):
+                skipped.append(indicator if indicator not in available else str(condition['value']))
+                continue
+
+            cond_column.append(slot(indicator))
+            cond_op.append(code)
+            cond_right.append(slot(right) if right is not None else -1)
+            cond_value.append(constant if constant is not None else np.nan)
+            cond_window.append(window)
+            cond_all.append(window_mode == 'all')
+            added += 1
+        return added
+
+    n_entry = add(strategy_config.get('entry_conditions', []))
+    add(strategy_config.get('exit_conditions', []))
+
+    if skipped:
+        print(f"⚠️ Spalten nicht in den Daten, Bedingungen übersprungen: {', '.join(skipped)}")
+
+    logic = _logic_code(strategy_config.get('logic', 'AND'))
+    return CompiledConditions(used_columns, cond_column, cond_op, cond_value, n_entry, logic, logic, skipped,
+                              cond_right, cond_window, cond_all)
+
+
+def evaluate_strategy(strategy_config, data):
+    """
+    Entries/Exits einer Strategie berechnen
+
+    Returns:
+        (entries, exits) als Bool-Series
+    """
+    return compile_conditions(strategy_config, data.columns).signals(data)
+
+
+def _condition_pandas(condition, data):
+    """Einzelne Bedingung mit Pandas (shift/rolling) – Referenz"""
+    x = data[condition['indicator']]
+    code = OPERATOR_CODES[condition['operator']]
+
+    if code in (OP_RISING, OP_FALLING):
+        period = int(float(condition.get('value') or 1))
+        signal = _comparison(x, 0 if code == OP_RISING else 1, x.shift(period))
+    else:
+        constant, right = parse_operand(condition['value'], data.columns)
+        rhs = data[right] if right is not None else constant
+        if code < OP_CROSSES_ABOVE:
+            signal = _comparison(x, code, rhs)
+        else:
+            rhs_prev = rhs.shift(1) if right is not None else constant
+            now, prev = (0, 3) if code == OP_CROSSES_ABOVE else (1, 2)
+            signal = _comparison(x, now, rhs) & _comparison(x.shift(1), prev, rhs_prev)
+
+    window = int(condition.get('window', 1) or 1)
+    if window > 1:
+        if condition.get('window_mode', 'any') == 'all':
+            signal = signal.astype(float).rolling(window).min() == 1
+        else:
+            signal = signal.astype(float).rolling(window, min_periods=1).max() == 1
+    return signal
+
+
+def evaluate_conditions_pandas(strategy_config, data):
+    """Bisherige Auswertung (eine Series pro Bedingung, kombiniert mit &/|) – Referenz für den Benchmark"""
+    logic = strategy_config.get('logic', 'AND')
+
+    def combine(conditions):
+        result = None
+        for condition in conditions:
+            if condition['indicator'] not in data.columns:
+                continue
+            if condition['operator'] not in ('rising', 'falling') and parse_operand(condition['value'], data.columns) == (None, None):
+                continue
+            signal = _condition_pandas(condition, data)
+            if result is None:
+                result = signal
+            elif logic == 'OR':
+                result = result | signal
+            else:
+                result = result & signal
+        return result if result is not None else pd.Series(False, index=data.index)
+
+    return combine(strategy_config.get('entry_conditions', [])), combine(strategy_config.get('exit_conditions', []))
+
+
+def _synthetic_indicators(n_bars, n_indicators=6, seed=42):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2020-01-01', periods=n_bars, freq='1min')
+    values = rng.uniform(0, 100, size=(n_bars, n_indicators))
+    return pd.DataFrame(values, index=index, columns=[f"ind_{i}" for i in range(n_indicators)])
+
+
+def benchmark_conditions(data=None, strategy_config=None, n_bars=1_000_000, repeat=3):
+    """
+    Kompilierten Kernel gegen die Pandas-Auswertung messen
+
+    Returns:
+        Dict mit pandas_ms, compiled_ms, speedup, identical
+    """
+    if data is None:
+        data = _synthetic_indicators(n_bars)
+    if strategy_config is None:
+        columns = list(data.columns)
+        strategy_config = {
+            'entry_conditions': [{'indicator': col, 'operator': '>', 'value': 20} for col in columns[:3]],
+            'exit_conditions': [{'indicator': col, 'operator': '<', 'value': 10} for col in columns[3:]],
+            'logic': 'AND'
+        }
+
+    def timed(func):
+        best = np.inf
+        result = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+        return result, best * 1000.0
+
+    compiled = compile_conditions(strategy_config, data.columns)
+    compiled.evaluate(data.iloc[:100])  # Kernel vorab kompilieren
+
+    (ref_entries, ref_exits), pandas_ms = timed(lambda: evaluate_conditions_pandas(strategy_config, data))
+    (entries, exits), compiled_ms = timed(lambda: compiled.evaluate(data))
+
+    identical = (
+        np.array_equal(np.packbits(ref_entries.to_numpy(dtype=bool)), entries)
+        and np.array_equal(np.packbits(ref_exits.to_numpy(dtype=bool)), exits)
+    )
+    return {
+        'bars': len(data),
+        'pandas_ms': pandas_ms,
+        'compiled_ms': compiled_ms,
+        'speedup': pandas_ms / compiled_ms if compiled_ms > 0 else None,
+        'identical': identical
+    }
+
+
+if __name__ == "__main__":
+    print(f"🧭 Bedingungs-Benchmark (Numba: {'✅' if NUMBA_AVAILABLE else '❌'})")
+    result = benchmark_conditions()
+    print(f"  {result['bars']:,} Bars | Pandas {result['pandas_ms']:8.2f} ms | kompiliert {result['compiled_ms']:8.2f} ms"
+          f" | x{result['speedup']:.1f} | identisch: {'✅' if result['identical'] else '❌'}")
@@ -27,6 +27,7 @@ class DataManager:
     def __init__(self):
         self.performance_handler = PerformanceHandler()
         self.current_data = None
+        self.signals = None
         self.data_history = []
         self.app_configs = {}
         self.metadata = {}
@@ -72,6 +73,7 @@ class DataManager:
         
         # Neue Daten setzen
         self.current_data = data
+        self.signals = None
         self.workflow_state['current_app'] = source_app
         
         # Metadaten aktualisieren
@@ -96,6 +98,19 @@ class DataManager:
         
         print(f"📊 Daten aktualisiert von {source_app}: {self.metadata.get('data_shape', 'Unknown shape')}")
     
+    def set_signals(self, signals):
+        """
+        Bereinigte Signale zu den aktuellen Daten setzen
+
+        Args:
+            signals: SparseSignals (Entry/Exit-Positionen aus App 7)
+        """
+        self.signals = signals
+
+    def get_signals(self):
+        """Bereinigte Signale (None falls nicht berechnet)"""
+        return self.signals
+
     def get_current_data(self):
         """Aktuelle Daten abrufen"""
         return self.current_data
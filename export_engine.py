@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+📤 EXPORT ENGINE - VectorBT Pro GUI System
+Streaming-Export großer DataFrames in Blöcken
+- Zeilen-Blöcke mit begrenztem Speicher (nie der ganze Frame als String)
+- CSV: Blöcke parallel formatiert, in Reihenfolge geschrieben (optional gzip)
+- Parquet (Row Groups), Feather (Arrow IPC File), Arrow IPC Stream über PyArrow
+- Spalten-Auswahl, Kompression, Fortschritt und Durchsatz
+"""
+
+import gzip
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+# PyArrow für Parquet/Feather/Arrow und schnelles CSV
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pa_parquet
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+EXPORT_FORMATS = {
+    'csv': {'extension': '.csv', 'compressions': ('none', 'gzip'), 'needs_arrow': False},
+    'parquet': {'extension': '.parquet', 'compressions': ('snappy', 'zstd', 'gzip', 'none'), 'needs_arrow': True},
+    'feather': {'extension': '.feather', 'compressions': ('lz4', 'zstd', 'none'), 'needs_arrow': True},
+    'arrow': {'extension': '.arrows', 'compressions': ('lz4', 'zstd', 'none'), 'needs_arrow': True},
+}
+
+DEFAULT_CHUNK_ROWS = 250_000
+
+
+def available_formats():
+    """Formate, die in dieser Umgebung exportiert werden können"""
+    return [name for name, info in EXPORT_FORMATS.items() if PYARROW_AVAILABLE or not info['needs_arrow']]
+
+
+def format_from_path(file_path):
+    """Export-Format aus der Dateiendung ('.csv.gz' → csv)"""
+    path = file_path.lower()
+    if path.endswith('.gz'):
+        path = path[:-3]
+    for name, info in EXPORT_FORMATS.items():
+        if path.endswith(info['extension']) or path.endswith('.' + name):
+            return name
+    return 'csv'
+
+
+def select_columns(data, columns=None):
+    """Spalten-Auswahl prüfen (Reihenfolge wie angegeben)"""
+    if not columns:
+        return data
+    missing = [column for column in columns if column not in data.columns]
+    if missing:
+        raise ValueError(f"Unbekannte Spalten: {', '.join(map(str, missing))}")
+    return data[list(columns)]
+
+
+class ExportProgress:
+    """
+    📈 EXPORT-FORTSCHRITT
+    Zeilen/Bytes, Dauer und Durchsatz
+    """
+
+    def __init__(self, total_rows, callback=None):
+        self.total_rows = total_rows
+        self.callback = callback
+        self.rows = 0
+        self.bytes = 0
+        self.start = time.perf_counter()
+
+    def advance(self, rows, written_bytes):
+        self.rows += rows
+        self.bytes += written_bytes
+        if self.callback:
+            self.callback(self.snapshot())
+
+    def snapshot(self):
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        return {
+            'rows': self.rows,
+            'total_rows': self.total_rows,
+            'percent': 100.0 * self.rows / self.total_rows if self.total_rows else 100.0,
+            'bytes': self.bytes,
+            'seconds': elapsed,
+            'rows_per_sec': self.rows / elapsed,
+            'mb_per_sec': self.bytes / elapsed / (1024 * 1024)
+        }
+
+
+def _named_index(data):
+    """Unbenannten Index benennen (Spaltenname in CSV/Arrow statt leer/__index_level_0__)"""
+    if data.index.name is not None or isinstance(data.index, pd.MultiIndex):
+        return data
+    return data.rename_axis('timestamp' if isinstance(data.index, pd.DatetimeIndex) else 'index')
+
+
+def _chunks(data, chunk_rows):
+    """Zeilen-Blöcke als Sichten (keine Kopie der Daten)"""
+    for start in range(0, len(data), chunk_rows):
+        yield data.iloc[start:start + chunk_rows]
+
+
+def _arrow_batch(chunk, schema=None):
+    """DataFrame-Block als Arrow RecordBatch (Index als Spalte)"""
+    return pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=True)
+
+
+def _write_csv_pandas(data, file_path, compression, chunk_rows, max_workers, progress):
+    """CSV über pandas: Blöcke parallel formatieren, geordnet schreiben"""
+    opener = gzip.open if compression == 'gzip' else open
+
+    def format_chunk(args):
+        chunk, header = args
+        return chunk.to_csv(None, header=header, index=True).encode('utf-8')
+
+    with opener(file_path, 'wb') as f, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Höchstens 2 Blöcke pro Worker gleichzeitig im Speicher
+        in_flight = deque()
+        for i, chunk in enumerate(_chunks(data, chunk_rows)):
+            in_flight.append((len(chunk), executor.submit(format_chunk, (chunk, i == 0))))
+            if len(in_flight) >= 2 * max_workers:
+                rows, future = in_flight.popleft()
+                encoded = future.result()
+                f.write(encoded)
+                progress.advance(rows, len(encoded))
+        while in_flight:
+            rows, future = in_flight.popleft()
+            encoded = future.result()
+            f.write(encoded)
+            progress.advance(rows, len(encoded))
+
+
+def _write_csv_arrow(data, file_path, compression, chunk_rows, progress):
+    """CSV über PyArrow (Formatierung in C++, mehrere Threads)"""
+    # Index als erste Spalte wie bei pandas.to_csv
+    def csv_batch(chunk, schema=None):
+        return pa.RecordBatch.from_pandas(chunk.reset_index(), schema=schema, preserve_index=False)
+
+    schema = csv_batch(data.iloc[:0]).schema
+    options = pa_csv.WriteOptions(quoting_style='needed')
+    sink = pa.CompressedOutputStream(file_path, 'gzip') if compression == 'gzip' else pa.OSFile(file_path, 'wb')
+    with sink, pa_csv.CSVWriter(sink, schema, write_options=options) as writer:
+        for chunk in _chunks(data, chunk_rows):
+            before = sink.tell()
+            writer.write_batch(csv_batch(chunk, schema))
+            progress.advance(len(chunk), sink.tell() - before)
+
+
+def _write_parquet(data, file_path, compression, chunk_rows, progress):
+    """Parquet: ein Row Group pro Block"""
+    schema = _arrow_batch(data.iloc[:0]).schema
+    codec = None if compression == 'none' else compression
+    with pa.OSFile(file_path, 'wb') as sink, pa_parquet.ParquetWriter(sink, schema, compression=codec) as writer:
+        for chunk in _chunks(data, chunk_rows):
+            before = sink.tell()
+            writer.write_batch(_arrow_batch(chunk, schema), row_group_size=len(chunk))
+            progress.advance(len(chunk), sink.tell() - before)
+
+
+def _write_ipc(data, file_path, compression, chunk_rows, progress, stream):
+    """Arrow IPC: File-Format (Feather V2) oder Stream-Format"""
+    schema = _arrow_batch(data.iloc[:0]).schema
+    options = pa_ipc.IpcWriteOptions(compression=None if compression == 'none' else compression)
+    new_writer = pa_ipc.new_stream if stream else pa_ipc.new_file
+    with pa.OSFile(file_path, 'wb') as sink, new_writer(sink, schema, options=options) as writer:
+        for chunk in _chunks(data, chunk_rows):
+            before = sink.tell()
+            writer.write_batch(_arrow_batch(chunk, schema))
+            progress.advance(len(chunk), sink.tell() - before)
+
+
+def export_dataframe(data, file_path, export_format=None, columns=None, compression=None,
+                     chunk_rows=DEFAULT_CHUNK_ROWS, max_workers=None, progress_callback=None):
+    """
+    DataFrame blockweise exportieren
+
+    Args:
+        data: DataFrame (Index wird als Spalte geschrieben)
+        file_path: Ziel-Datei
+        export_format: 'csv', 'parquet', 'feather', 'arrow' (Standard: aus Dateiendung)
+        columns: Zu exportierende Spalten (Standard: alle)
+        compression: Kompression (Standard: erste des Formats, siehe EXPORT_FORMATS)
+        chunk_rows: Zeilen pro Block (bestimmt den Speicherbedarf)
+        max_workers: Threads für die CSV-Formatierung
+        progress_callback: Funktion(snapshot) nach jedem Block
+
+    Returns:
+        Dict mit rows, bytes, seconds, rows_per_sec, mb_per_sec, path, format
+    """
+    export_format = export_format or format_from_path(file_path)
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unbekanntes Export-Format: {export_format}")
+
+    info = EXPORT_FORMATS[export_format]
+    if info['needs_arrow'] and not PYARROW_AVAILABLE:
+        raise ImportError(f"Export als {export_format} benötigt pyarrow")
+
+    compression = compression or info['compressions'][0]
+    if compression not in info['compressions']:
+        raise ValueError(f"Kompression '{compression}' für {export_format} nicht unterstützt: {', '.join(info['compressions'])}")
+
+    data = _named_index(select_columns(data, columns))
+    chunk_rows = max(int(chunk_rows), 1)
+    max_workers = max_workers or min(4, os.cpu_count() or 1)
+    progress = ExportProgress(len(data), progress_callback)
+
+    if export_format == 'csv':
+        if PYARROW_AVAILABLE:
+            _write_csv_arrow(data, file_path, compression, chunk_rows, progress)
+        else:
+            _write_csv_pandas(data, file_path, compression, chunk_rows, max_workers, progress)
+    elif export_format == 'parquet':
+        _write_parquet(data, file_path, compression, chunk_rows, progress)
+    else:
+        _write_ipc(data, file_path, compression, chunk_rows, progress, stream=(export_format == 'arrow'))
+
+    result = progress.snapshot()
+    result['bytes'] = os.path.getsize(file_path)
+    result.update({'path': file_path, 'format': export_format, 'compression': compression})
+    print(f"✅ Export {export_format}: {result['rows']:,} Zeilen, {result['bytes'] / (1024 * 1024):.1f} MB "
+          f"in {result['seconds']:.2f}s ({result['rows_per_sec']:,.0f} Zeilen/s)")
+    return result
@@ -0,0 +1,677 @@
+#!/usr/bin/env python3
+"""
+🔄 INCREMENTAL INDICATORS - VectorBT Pro GUI System
+Zustandsbehaftete Indikatoren für neu angehängte Bars
+- Initialisierung einmalig aus der Historie (verzögert bis zum ersten Update)
+- O(1) Update pro neuer Bar (EMA-/Wilder-Zustand, kumulative Summen und Welford-Fenster im Ringpuffer)
+- Gleiche Rechenschritte wie die Batch-Kernels → identische Werte
+- Zustand als JSON neben dem Datensatz speicherbar
+- Unterstützt: MA/SMA/EMA, RSI, MACD, BBANDS, ATR, ADX
+"""
+
+import json
+import math
+import os
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+import indicator_kernels as kernels
+from indicator_library import compute_native_indicator
+
+NAN = float('nan')
+
+
+def state_path_for(data_path):
+    """Pfad der Zustands-Datei neben dem Datensatz"""
+    return data_path.replace('.h5', '_indicator_state.json')
+
+
+def _div(a, b):
+    """Division mit NumPy-Semantik (x/0 → inf/NaN statt Exception)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(np.float64(a) / np.float64(b))
+
+
+def _fmax(a, b):
+    """Maximum mit NaN-Ignorierung (wie np.fmax)"""
+    if math.isnan(a):
+        return b
+    if math.isnan(b):
+        return a
+    return a if a >= b else b
+
+
+# === ZUSTANDS-BAUSTEINE ===
+
+class _EwmState:
+    """EMA/Wilder-Zustand (adjust=False, NaN wird übersprungen)"""
+
+    def __init__(self, alpha, minp):
+        self.alpha = float(alpha)
+        self.minp = int(minp)
+        self.value = NAN
+        self.count = 0
+
+    def seed(self, x):
+        x = kernels.to_float_array(x)
+        self.count = int(np.count_nonzero(~np.isnan(x)))
+        self.value = float(kernels.ewm_mean(x, [self.alpha], minp=1)[-1, 0]) if len(x) else NAN
+
+    def update(self, x):
+        if not math.isnan(x):
+            if self.count == 0:
+                self.value = x
+            else:
+                self.value = self.alpha * x + (1.0 - self.alpha) * self.value
+            self.count += 1
+        return self.value if self.count >= self.minp else NAN
+
+    def get_state(self):
+        return {'value': self.value, 'count': self.count}
+
+    def set_state(self, state):
+        self.value = float(state['value'])
+        self.count = int(state['count'])
+
+
+class _RollingSums:
+    """
+    Rolling Mean über laufende kumulative Summen
+    Ringpuffer hält die Summen von vor `window` Bars (wie indicator_kernels.valid_cumsums)
+    """
+
+    def __init__(self, window):
+        self.window = int(window)
+        self.shift = None
+        self.totals = (0.0, 0.0, 0)
+        self.history = deque([self.totals], maxlen=self.window + 1)
+
+    def seed(self, x):
+        x = kernels.to_float_array(x)
+        csum, csum_sq, ccount, shift = kernels.valid_cumsums(x)
+        self.shift = float(shift) if (~np.isnan(x)).any() else None
+        tail = slice(max(len(csum) - self.window - 1, 0), None)
+        self.history = deque(
+            zip(csum[tail].tolist(), csum_sq[tail].tolist(), ccount[tail].tolist()),
+            maxlen=self.window + 1
+        )
+        self.totals = self.history[-1]
+
+    def update(self, x):
+        valid = not math.isnan(x)
+        if valid and self.shift is None:
+            self.shift = x
+        filled = x - self.shift if valid else 0.0
+        csum, csum_sq, ccount = self.totals
+        self.totals = (csum + filled, csum_sq + filled * filled, ccount + int(valid))
+        self.history.append(self.totals)
+
+    def _window_sums(self):
+        if len(self.history) <= self.window:
+            return None
+        csum, csum_sq, ccount = self.totals
+        old_csum, old_csum_sq, old_ccount = self.history[0]
+        if ccount - old_ccount != self.window:
+            return None
+        return csum - old_csum, csum_sq - old_csum_sq
+
+    def mean(self):
+        sums = self._window_sums()
+        if sums is None:
+            return NAN
+        return sums[0] / self.window + self.shift
+
+    def get_state(self):
+        return {'shift': self.shift, 'history': [list(item) for item in self.history]}
+
+    def set_state(self, state):
+        self.shift = state['shift']
+        self.history = deque((tuple(item) for item in state['history']), maxlen=self.window + 1)
+        self.totals = self.history[-1]
+
+
+class _RollingWelford:
+    """
+    Rolling Std als gleitender Welford-Zustand (wie indicator_kernels._rolling_var_nb)
+    Ringpuffer hält die letzten `window` Werte für das Entfernen und das exakte Neuaufsetzen
+    """
+
+    def __init__(self, window):
+        self.window = int(window)
+        self.ref = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.count = 0
+        self.bars = 0
+        self.values = deque(maxlen=self.window)
+
+    def seed(self, x):
+        x = kernels.to_float_array(x)
+        self.ref, self.mean, self.m2, self.count = kernels.rolling_var_state(x, self.window)
+        self.bars = len(x)
+        self.values = deque(x[-self.window:].tolist(), maxlen=self.window)
+
+    def update(self, x):
+        old = self.values[0] if len(self.values) == self.window else NAN
+        self.values.append(x)
+        if not math.isnan(x):
+            if self.count == 0:
+                self.ref = x
+            self.count += 1
+            delta = (x - self.ref) - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * ((x - self.ref) - self.mean)
+        if not math.isnan(old):
+            self.count -= 1
+            if self.count == 0:
+                self.mean = 0.0
+                self.m2 = 0.0
+            else:
+                delta = (old - self.ref) - self.mean
+                self.mean -= delta / self.count
+                self.m2 -= delta * ((old - self.ref) - self.mean)
+        self.bars += 1
+        if self.bars % self.window == 0 and self.count > 0:
+            self.ref += self.mean
+            total = 0.0
+            for value in self.values:
+                if not math.isnan(value):
+                    total += value - self.ref
+            self.mean = total / self.count
+            self.m2 = 0.0
+            for value in self.values:
+                if not math.isnan(value):
+                    delta = (value - self.ref) - self.mean
+                    self.m2 += delta * delta
+
+    def std(self, ddof=0):
+        if self.count != self.window or self.window <= ddof:
+            return NAN
+        return math.sqrt(max(self.m2, 0.0) / (self.window - ddof))
+
+    def get_state(self):
+        return {'ref': self.ref, 'mean': self.mean, 'm2': self.m2, 'count': self.count, 'bars': self.bars,
+                'values': list(self.values)}
+
+    def set_state(self, state):
+        self.ref = float(state['ref'])
+        self.mean = float(state['mean'])
+        self.m2 = float(state['m2'])
+        self.count = int(state['count'])
+        self.bars = int(state['bars'])
+        self.values = deque((float(value) for value in state['values']), maxlen=self.window)
+
+
+# === INDIKATOREN ===
+
+class IncrementalIndicator:
+    """
+    🔄 BASIS FÜR INKREMENTELLE INDIKATOREN
+    initialize() rechnet die Historie (Batch), update() jede neue Bar in O(1)
+    """
+
+    indicator = None
+    outputs = None          # None = Single-Output
+    scalar_fields = ()      # Skalare Zustandsfelder (z.B. prev_close)
+
+    def __init__(self, parameters=None):
+        self.parameters = dict(parameters or {})
+        self.components = {}
+
+    def initialize(self, data):
+        """Historie berechnen (Batch) und Zustand setzen"""
+        result = compute_native_indicator(self.indicator, data, self.parameters)
+        self.seed(data)
+        return result
+
+    def seed(self, data):
+        """Nur den Zustand aus der Historie setzen"""
+        raise NotImplementedError
+
+    def update(self, bar):
+        """Eine neue Bar verarbeiten (Mapping mit open/high/low/close)"""
+        raise NotImplementedError
+
+    def append(self, data):
+        """
+        Mehrere neue Bars nacheinander verarbeiten
+
+        Returns:
+            Series oder Dict Output-Name → Series (nur neue Zeilen)
+        """
+        columns = {name: data[name].to_numpy(dtype=np.float64) for name in ('high', 'low', 'close') if name in data}
+        rows = [self.update({name: float(values[i]) for name, values in columns.items()}) for i in range(len(data))]
+
+        if self.outputs:
+            return {
+                name: pd.Series([row[name] for row in rows], index=data.index, name=name, dtype=np.float64)
+                for name in self.outputs
+            }
+        return pd.Series(rows, index=data.index, name=self.indicator.lower(), dtype=np.float64)
+
+    def get_state(self):
+        """JSON-fähiger Zustand"""
+        return {
+            'indicator': self.indicator,
+            'parameters': self.parameters,
+            'components': {name: component.get_state() for name, component in self.components.items()},
+            'fields': {name: getattr(self, name) for name in self.scalar_fields}
+        }
+
+    def set_state(self, state):
+        missing = set(self.components) - set(state['components'])
+        if missing:
+            raise ValueError(f"Zustand von {self.indicator} unvollständig: {', '.join(sorted(missing))}")
+        for name, component_state in state['components'].items():
+            self.components[name].set_state(component_state)
+        for name, value in state['fields'].items():
+            setattr(self, name, float(value))
+
+
+class IncrementalMA(IncrementalIndicator):
+    """Gleitender Durchschnitt (simple, exp, wilder)"""
+
+    indicator = 'MA'
+
+    def __init__(self, parameters=None):
+        super().__init__(parameters)
+        window = self.parameters.get('window', 14)
+        self.wtype = self.parameters.get('wtype', 'simple')
+
+        if self.wtype == 'simple':
+            self.components['ma'] = _RollingSums(window)
+        elif self.wtype == 'exp':
+            self.components['ma'] = _EwmState(kernels.alpha_ema(window)[0], window)
+        elif self.wtype == 'wilder':
+            self.components['ma'] = _EwmState(kernels.alpha_wilder(window)[0], window)
+        else:
+            raise ValueError(f"Glättungsart {self.wtype} nicht inkrementell verfügbar")
+
+    def seed(self, data):
+        self.components['ma'].seed(data['close'])
+
+    def update(self, bar):
+        ma = self.components['ma']
+        if self.wtype == 'simple':
+            ma.update(bar['close'])
+            return ma.mean()
+        return ma.update(bar['close'])
+
+
+class IncrementalSMA(IncrementalMA):
+    indicator = 'SMA'
+
+    def __init__(self, parameters=None):
+        super().__init__({**(parameters or {}), 'wtype': 'simple'})
+
+
+class IncrementalEMA(IncrementalMA):
+    indicator = 'EMA'
+
+    def __init__(self, parameters=None):
+        super().__init__({**(parameters or {}), 'wtype': 'exp'})
+
+
+class IncrementalRSI(IncrementalIndicator):
+    """RSI mit Wilder-geglätteten Gewinnen/Verlusten"""
+
+    indicator = 'RSI'
+    scalar_fields = ('prev_close',)
+
+    def __init__(self, parameters=None):
+        super().__init__(parameters)
+        window = self.parameters.get('window', 14)
+        alpha = kernels.alpha_wilder(window)[0]
+        self.components = {'gain': _EwmState(alpha, window), 'loss': _EwmState(alpha, window)}
+        self.prev_close = NAN
+
+    def seed(self, data):
+        close = kernels.to_float_array(data['close'])
+        gain, loss = kernels.gain_loss(close)
+        self.components['gain'].seed(gain)
+        self.components['loss'].seed(loss)
+        self.prev_close = float(close[-1]) if len(close) else NAN
+
+    def update(self, bar):
+        delta = bar['close'] - self.prev_close
+        self.prev_close = bar['close']
+        if math.isnan(delta):
+            gain = loss = NAN
+        else:
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+
+        avg_gain = self.components['gain'].update(gain)
+        avg_loss = self.components['loss'].update(loss)
+        return _div(100.0 * avg_gain, avg_gain + avg_loss)
+
+
+class IncrementalMACD(IncrementalIndicator):
+    """MACD mit EMA-Zuständen für Fast, Slow und Signal"""
+
+    indicator = 'MACD'
+    outputs = ('macd', 'signal', 'histogram')
+
+    def __init__(self, parameters=None):
+        super().__init__(parameters)
+        fast = self.parameters.get('fast_window', 12)
+        slow = self.parameters.get('slow_window', 26)
+        signal = self.parameters.get('signal_window', 9)
+        self.components = {
+            'fast': _EwmState(kernels.alpha_ema(fast)[0], fast),
+            'slow': _EwmState(kernels.alpha_ema(slow)[0], slow),
+            'signal': _EwmState(kernels.alpha_ema(signal)[0], signal)
+        }
+
+    def seed(self, data):
+        close = kernels.to_float_array(data['close'])
+        fast, slow = self.components['fast'], self.components['slow']
+        fast.seed(close)
+        slow.seed(close)
+        emas = kernels.ewm_mean(close, [fast.alpha, slow.alpha], minp=[fast.minp, slow.minp])
+        self.components['signal'].seed(emas[:, 0] - emas[:, 1])
+
+    def update(self, bar):
+        macd = self.components['fast'].update(bar['close']) - self.components['slow'].update(bar['close'])
+        signal = self.components['signal'].update(macd)
+        return {'macd': macd, 'signal': signal, 'histogram': macd - signal}
+
+
+class IncrementalBBANDS(IncrementalIndicator):
+    """Bollinger Bands über laufende Summen"""
+
+    indicator = 'BBANDS'
+    outputs = ('upper', 'middle', 'lower')
+
+    def __init__(self, parameters=None):
+        super().__init__(parameters)
+        self.alpha = self.parameters.get('alpha', 2)
+        window = self.parameters.get('window', 20)
+        self.components = {'sums': _RollingSums(window), 'std': _RollingWelford(window)}
+
+    def seed(self, data):
+        self.components['sums'].seed(data['close'])
+        self.components['std'].seed(data['close'])
+
+    def update(self, bar):
+        sums = self.components['sums']
+        sums.update(bar['close'])
+        self.components['std'].update(bar['close'])
+        middle = sums.mean()
+        std = self.components['std'].std(ddof=0)
+        return {'upper': middle + self.alpha * std, 'middle': middle, 'lower': middle - self.alpha * std}
+
+
+def _true_range(high, low, prev_close):
+    tr = high - low
+    tr = _fmax(tr, abs(high - prev_close))
+    return _fmax(tr, abs(low - prev_close))
+
+
+class IncrementalATR(IncrementalIndicator):
+    """ATR (Wilder-geglättete True Range)"""
+
+    indicator = 'ATR'
+    scalar_fields = ('prev_close',)
+
+    def __init__(self, parameters=None):
+        super().__init__(parameters)
+        window = self.parameters.get('window', 14)
+        self.components = {'atr': _EwmState(kernels.alpha_wilder(window)[0], window)}
+        self.prev_close = NAN
+
+    def seed(self, data):
+        self.components['atr'].seed(kernels.true_range(data['high'], data['low'], data['close']))
+        self.prev_close = float(data['close'].iloc[-1]) if len(data) else NAN
+
+    def update(self, bar):
+        tr = _true_range(bar['high'], bar['low'], self.prev_close)
+        self.prev_close = bar['close']
+        return self.components['atr'].update(tr)
+
+
+class IncrementalADX(IncrementalIndicator):
+    """ADX mit Wilder-Zuständen für TR, +DM, -DM und DX"""
+
+    indicator = 'ADX'
+    scalar_fields = ('prev_high', 'prev_low', 'prev_close')
+
+    def __init__(self, parameters=None):
+        super().__init__(parameters)
+        window = self.parameters.get('window', 14)
+        alpha = kernels.alpha_wilder(window)[0]
+        self.components = {name: _EwmState(alpha, window) for name in ('tr', 'plus_dm', 'minus_dm', 'dx')}
+        self.prev_high = self.prev_low = self.prev_close = NAN
+
+    def seed(self, data):
+        high = kernels.to_float_array(data['high'])
+        low = kernels.to_float_array(data['low'])
+        close = kernels.to_float_array(data['close'])
+        up = kernels.diff(high)
+        down = -kernels.diff(low)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            missing = np.isnan(up) | np.isnan(down)
+            plus_dm = np.where(missing, np.nan, np.where((up > down) & (up > 0), up, 0.0))
+            minus_dm = np.where(missing, np.nan, np.where((down > up) & (down > 0), down, 0.0))
+            tr = kernels.true_range(high, low, close)
+
+            for name, values in (('tr', tr), ('plus_dm', plus_dm), ('minus_dm', minus_dm)):
+                self.components[name].seed(values)
+
+            window = self.components['dx'].minp
+            smoothed = kernels.ewm_mean(
+                np.column_stack([tr, plus_dm, minus_dm]),
+                kernels.alpha_wilder([window] * 3),
+                minp=window
+            )
+            plus_di = 100.0 * smoothed[:, 1] / smoothed[:, 0]
+            minus_di = 100.0 * smoothed[:, 2] / smoothed[:, 0]
+            self.components['dx'].seed(100.0 * np.abs(plus_di - minus_di) / (plus_di + minus_di))
+
+        if len(close):
+            self.prev_high, self.prev_low, self.prev_close = float(high[-1]), float(low[-1]), float(close[-1])
+
+    def update(self, bar):
+        high, low = bar['high'], bar['low']
+        up = high - self.prev_high
+        down = -(low - self.prev_low)
+        tr = _true_range(high, low, self.prev_close)
+        self.prev_high, self.prev_low, self.prev_close = high, low, bar['close']
+
+        if math.isnan(up) or math.isnan(down):
+            plus_dm = minus_dm = NAN
+        else:
+            plus_dm = up if (up > down and up > 0) else 0.0
+            minus_dm = down if (down > up and down > 0) else 0.0
+
+        atr = self.components['tr'].update(tr)
+        plus_di = _div(100.0 * self.components['plus_dm'].update(plus_dm), atr)
+        minus_di = _div(100.0 * self.components['minus_dm'].update(minus_dm), atr)
+        dx = _div(100.0 * abs(plus_di - minus_di), plus_di + minus_di)
+        return self.components['dx'].update(dx)
+
+
+# Inkrementell verfügbare Indikatoren: Name → Klasse
+INCREMENTAL_INDICATORS = {
+    'MA': IncrementalMA,
+    'SMA': IncrementalSMA,
+    'EMA': IncrementalEMA,
+    'RSI': IncrementalRSI,
+    'MACD': IncrementalMACD,
+    'BBANDS': IncrementalBBANDS,
+    'ATR': IncrementalATR,
+    'ADX': IncrementalADX,
+}
+
+
+def supports_incremental(indicator_name, parameters=None):
+    """Prüfen ob ein Indikator inkrementell aktualisiert werden kann"""
+    short_name = indicator_name.replace("vbt:", "")
+    if short_name == 'MA':
+        return (parameters or {}).get('wtype', 'simple') in ('simple', 'exp', 'wilder')
+    return short_name in INCREMENTAL_INDICATORS
+
+
+def create_incremental(indicator_name, parameters=None):
+    """Inkrementellen Indikator erzeugen"""
+    short_name = indicator_name.replace("vbt:", "")
+    if short_name not in INCREMENTAL_INDICATORS:
+        raise ValueError(f"Indikator {short_name} nicht inkrementell verfügbar")
+    return INCREMENTAL_INDICATORS[short_name](parameters)
+
+
+class IncrementalIndicatorSet:
+    """
+    🔄 INKREMENTELLE INDIKATOREN EINER KONFIGURATION
+    Hält pro config_key Zustand und Timeframe; hängt nur neue Bars an
+    """
+
+    def __init__(self):
+        self.indicators = {}     # config_key → (Timeframe, IncrementalIndicator)
+        self.last_index = {}     # Timeframe → letzter verarbeiteter Zeitstempel
+        self.n_bars = {}         # Timeframe → Anzahl verarbeiteter Bars
+        self._pending = None     # Historie für verzögertes Seeding
+
+    @classmethod
+    def from_config(cls, indicators_config):
+        """Alle inkrementell unterstützten Einträge (ohne Grids) übernehmen"""
+        indicator_set = cls()
+        for config_key, config in indicators_config.items():
+            if config.get('param_grid') or not supports_incremental(config['indicator'], config['parameters']):
+                continue
+            indicator_set.indicators[config_key] = (
+                config['timeframe'],
+                create_incremental(config['indicator'], config['parameters'])
+            )
+        return indicator_set
+
+    def seed(self, datasets, lazy=False):
+        """
+        Zustände aus der Historie setzen (Dict Timeframe → DataFrame)
+
+        Mit lazy=True wird nur die Historie gemerkt und erst beim ersten append()/save()
+        durchlaufen, d.h. eine gerade berechnete Historie wird nicht sofort ein zweites Mal gerechnet.
+        """
+        for timeframe in {timeframe for timeframe, _ in self.indicators.values()}:
+            if len(datasets[timeframe]):
+                self.last_index[timeframe] = datasets[timeframe].index[-1]
+                self.n_bars[timeframe] = len(datasets[timeframe])
+        self._pending = datasets
+        if not lazy:
+            self._ensure_seeded()
+
+    def _ensure_seeded(self):
+        """Verzögertes Seeding nachholen"""
+        if self._pending is None:
+            return
+        for timeframe, indicator in self.indicators.values():
+            indicator.seed(self._pending[timeframe])
+        self._pending = None
+
+    def matches(self, datasets, indicators_config):
+        """
+        Prüfen ob ein geladener Zustand zu Datensatz und Konfiguration passt
+
+        Gleiche inkrementelle config_keys (Indikator, Timeframe, Parameter) und pro Timeframe
+        der gespeicherte letzte Zeitstempel an der gespeicherten Position.
+        """
+        expected = IncrementalIndicatorSet.from_config(indicators_config or {}).indicators
+        if set(expected) != set(self.indicators):
+            return False
+        for config_key, (timeframe, indicator) in self.indicators.items():
+            expected_timeframe, expected_indicator = expected[config_key]
+            expected_parameters = json.loads(json.dumps(expected_indicator.parameters, default=str))
+            if (expected_timeframe != timeframe or expected_indicator.indicator != indicator.indicator
+                    or expected_parameters != indicator.parameters):
+                return False
+
+        for timeframe, last in self.last_index.items():
+            data = datasets.get(timeframe)
+            if data is None:
+                return False
+            n_bars = self.n_bars.get(timeframe)
+            if n_bars is None:
+                # Ältere Zustands-Dateien ohne Bar-Anzahl
+                n_bars = int(data.index.get_indexer([last])[0]) + 1
+            if n_bars < 1 or len(data) < n_bars or data.index[n_bars - 1] != last:
+                return False
+            self.n_bars[timeframe] = n_bars
+        return True
+
+    def history(self, datasets):
+        """Bereits verarbeiteter Teil der Daten (Dict Timeframe → DataFrame)"""
+        return {
+            timeframe: data.iloc[:self.n_bars[timeframe]] if timeframe in self.n_bars else data
+            for timeframe, data in datasets.items()
+        }
+
+    def new_rows(self, timeframe, data):
+        """Zeilen nach dem letzten verarbeiteten Zeitstempel"""
+        last = self.last_index.get(timeframe)
+        return data if last is None else data[data.index > last]
+
+    def append(self, datasets):
+        """
+        Neue Bars anhängen (Dict Timeframe → vollständiger oder nur neuer DataFrame)
+
+        Returns:
+            Dict config_key → Ergebnis nur für die neuen Zeilen
+        """
+        self._ensure_seeded()
+        new_data = {timeframe: self.new_rows(timeframe, data) for timeframe, data in datasets.items()}
+        results = {}
+
+        for config_key, (timeframe, indicator) in self.indicators.items():
+            rows = new_data.get(timeframe)
+            if rows is not None and len(rows):
+                results[config_key] = indicator.append(rows)
+
+        for timeframe, rows in new_data.items():
+            if len(rows):
+                self.last_index[timeframe] = rows.index[-1]
+                self.n_bars[timeframe] = self.n_bars.get(timeframe, 0) + len(rows)
+        return results
+
+    def save(self, data_path):
+        """Zustand als JSON neben dem Datensatz speichern"""
+        self._ensure_seeded()
+        state = {
+            'last_index': {timeframe: str(ts) for timeframe, ts in self.last_index.items()},
+            'n_bars': self.n_bars,
+            'indicators': {
+                config_key: {'timeframe': timeframe, **indicator.get_state()}
+                for config_key, (timeframe, indicator) in self.indicators.items()
+            }
+        }
+        state_path = state_path_for(data_path)
+        with open(state_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        print(f"💾 Indikator-Zustand gespeichert: {state_path}")
+        return state_path
+
+    @classmethod
+    def load(cls, data_path):
+        """Zustand neben dem Datensatz laden (None falls nicht vorhanden)"""
+        state_path = state_path_for(data_path)
+        if not os.path.exists(state_path):
+            return None
+
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+
+        indicator_set = cls()
+        indicator_set.last_index = {timeframe: pd.Timestamp(ts) for timeframe, ts in state['last_index'].items()}
+        indicator_set.n_bars = {timeframe: int(n) for timeframe, n in state.get('n_bars', {}).items()}
+        try:
+            for config_key, entry in state['indicators'].items():
+                indicator = create_incremental(entry['indicator'], entry['parameters'])
+                indicator.set_state(entry)
+                indicator_set.indicators[config_key] = (entry['timeframe'], indicator)
+        except (KeyError, ValueError) as e:
+            # Z.B. Zustand aus einer älteren Version ohne alle Komponenten
+            print(f"⚠️ Indikator-Zustand {state_path} nicht verwendbar: {e}")
+            return None
+        return indicator_set
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+🧭 INDICATOR DISPATCH - VectorBT Pro GUI System
+Generische Ausführung aller katalogisierten Indikatoren
+- Runner pro Indikator: aufgelöste Klasse, Inputs, Parameter-Konvertierung, Outputs
+- Runner werden einmal aufgelöst und gecacht → spätere Aufrufe nur noch Berechnung
+- Parameter-Typen aus run_params des Katalogs (vectorbt_all_indicators_params.json)
+- Namen wie 'vbt:RSI', 'talib:SMA', 'pandas_ta:...' über die VBT Indicator Factory
+"""
+
+import threading
+
+from indicator_registry import indicator_registry
+
+# Spalten, die als Daten-Inputs (nicht als Parameter) gelten
+DATA_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Zusätzliche Outputs, die aus den VBT-Outputs abgeleitet werden:
+# Name → (benötigte Quell-Outputs, Ableitung). Angewendet nur, wenn alle
+# Quell-Outputs existieren (talib:MACD heißt z.B. macd/macdsignal/macdhist)
+DERIVED_OUTPUTS = {
+    'MACD': {'histogram': (('macd', 'signal'), lambda outputs: outputs['macd'] - outputs['signal'])},
+}
+
+
+def _parse_default(text):
+    """Katalog-Default ('Default(value=14)' oder '14') als Text"""
+    text = str(text or '')
+    if text.startswith('Default(value='):
+        text = text[len('Default(value='):].rstrip(')').strip("'\"")
+    return text
+
+
+def _to_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', '1', 'yes', 'ja')
+    return bool(value)
+
+
+def _make_coercer(type_name):
+    """Konvertierungs-Funktion für einen Parameter-Typ (einmal pro Runner)"""
+    type_name = str(type_name or '').lower()
+    if type_name == 'int':
+        convert = lambda value: int(float(value))
+    elif type_name == 'float':
+        convert = float
+    elif type_name == 'bool':
+        convert = _to_bool
+    else:
+        convert = None
+
+    def coerce(value):
+        if isinstance(value, str):
+            text = value.strip()
+            if text in ('', 'None'):
+                return None
+            if convert is None:
+                return text
+            return convert(text)
+        if convert is None or value is None:
+            return value
+        return convert(value)
+
+    return coerce
+
+
+def _resolve_indicator_class(indicator_name):
+    """VBT-Indikator-Klasse zum Katalog-Namen auflösen"""
+    import vectorbtpro as vbt
+
+    prefix, _, short_name = indicator_name.rpartition(':')
+    if prefix in ('', 'vbt') and hasattr(vbt, short_name):
+        return getattr(vbt, short_name)
+    return vbt.IndicatorFactory.get_indicator(indicator_name)
+
+
+class IndicatorRunner:
+    """
+    🧭 INDIKATOR-RUNNER
+    Einmal aufgelöste Ausführungs-Informationen eines Indikators
+    """
+
+    def __init__(self, indicator_name, run_params=None):
+        self.indicator_name = indicator_name
+        self.short_name = indicator_name.rpartition(':')[2]
+        self.indicator_cls = _resolve_indicator_class(indicator_name)
+
+        self.input_names = tuple(self.indicator_cls.input_names)
+        self.output_names = tuple(self.indicator_cls.output_names)
+        self.derived_outputs = {
+            name: derive
+            for name, (sources, derive) in DERIVED_OUTPUTS.get(self.short_name, {}).items()
+            if name not in self.output_names and all(source in self.output_names for source in sources)
+        }
+
+        # Parameter-Konvertierung aus dem Katalog-Schema
+        run_params = run_params or {}
+        self.coercers = {
+            name: _make_coercer(info.get('type') or self._type_from_default(info))
+            for name, info in run_params.items()
+            if name not in self.input_names and name.lower() not in DATA_COLUMNS
+        }
+        self.param_names = set(self.coercers) | set(getattr(self.indicator_cls, 'param_names', ()))
+
+    @staticmethod
+    def _type_from_default(info):
+        default = _parse_default(info.get('default'))
+        if default.lstrip('-').isdigit():
+            return 'int'
+        try:
+            float(default)
+            return 'float'
+        except ValueError:
+            return 'str'
+
+    def prepare_inputs(self, data):
+        """Daten-Inputs in Reihenfolge der Klasse (Spaltennamen ohne Groß/Klein)"""
+        columns = {str(column).lower(): column for column in data.columns}
+        missing = [name for name in self.input_names if name.lower() not in columns]
+        if missing:
+            raise ValueError(f"{self.short_name} benötigt Spalten: {', '.join(missing)}")
+        return [data[columns[name.lower()]] for name in self.input_names]
+
+    def prepare_params(self, parameters):
+        """Parameter konvertieren; unbekannte Parameter werden ignoriert"""
+        params = {}
+        for name, value in (parameters or {}).items():
+            if name not in self.param_names:
+                continue
+            coerce = self.coercers.get(name)
+            value = coerce(value) if coerce else value
+            if value is not None:
+                params[name] = value
+        return params
+
+    def run(self, data, parameters=None):
+        """
+        Indikator berechnen
+
+        Returns:
+            Series (ein Output) oder Dict Output-Name → Series
+        """
+        result = self.indicator_cls.run(*self.prepare_inputs(data), **self.prepare_params(parameters))
+
+        outputs = {name: getattr(result, name) for name in self.output_names}
+        for name, derive in self.derived_outputs.items():
+            outputs[name] = derive(outputs)
+
+        if len(outputs) == 1:
+            return next(iter(outputs.values()))
+        return outputs
+
+
+class RunnerCache:
+    """
+    🗃️ RUNNER-CACHE
+    Thread-sicherer Cache aufgelöster Runner (einer pro Indikator-Name)
+    """
+
+    def __init__(self):
+        self.runners = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, indicator_name):
+        runner = self.runners.get(indicator_name)
+        if runner is not None:
+            self.hits += 1
+            return runner
+
+        with self.lock:
+            runner = self.runners.get(indicator_name)
+            if runner is None:
+                self.misses += 1
+                runner = IndicatorRunner(indicator_name, indicator_registry.get_run_params(indicator_name))
+                self.runners[indicator_name] = runner
+            return runner
+
+    def clear(self):
+        with self.lock:
+            self.runners.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        return {'runners': len(self.runners), 'hits': self.hits, 'misses': self.misses}
+
+
+# Globale Instanz
+runner_cache = RunnerCache()
+
+
+def dispatch_indicator(indicator_name, data, parameters=None):
+    """Beliebigen katalogisierten Indikator über den gecachten Runner berechnen"""
+    return runner_cache.get(indicator_name).run(data, parameters)
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+⚙️ INDICATOR ENGINE - VectorBT Pro GUI System
+Parallele Indikator-Berechnung über Indikatoren und Timeframes
+- Jedes (Indikator, Timeframe)-Paar ist ein unabhängiger Job
+- Auto-Modus pro Job: native Numba-Kernels (nogil) im Thread-Pool,
+  Runner-Jobs (VBT/TA-Lib/Fallbacks) im Prozess-Pool
+- Ergebnisse werden in Fertigstellungs-Reihenfolge eingesammelt
+- Fortschritt pro Job über Callback
+- Optional: Planer-Job pro Timeframe mit gemeinsamen Zwischenergebnissen
+- Backend wählbar: VectorBT Pro oder eingebaute Bibliothek (ohne Lizenz)
+- VBT-Pfad: generischer Dispatch für den gesamten Indikator-Katalog
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+import indicator_kernels as kernels
+from indicator_grid import NATIVE_GRIDS, run_indicator_grid
+from indicator_planner import IndicatorPlan
+from indicator_library import compute_native_indicator, is_native_indicator
+from indicator_dispatch import dispatch_indicator
+
+# VectorBT Pro Kernels laufen ebenfalls GIL-frei (Numba nogil)
+try:
+    import vectorbtpro as vbt
+    VBT_AVAILABLE = True
+except ImportError:
+    VBT_AVAILABLE = False
+
+ENGINE_MODES = ['auto', 'threads', 'processes', 'serial']
+INDICATOR_BACKENDS = ['auto', 'vbt', 'native']
+
+
+def resolve_backend(backend, indicator_name):
+    """
+    Backend für einen Indikator bestimmen
+
+    'auto' nutzt VectorBT Pro falls installiert, sonst die eingebaute Bibliothek.
+    'native' fällt für nicht eingebaute Indikatoren auf VectorBT Pro zurück.
+    """
+    if backend not in INDICATOR_BACKENDS:
+        raise ValueError(f"Unbekanntes Backend: {backend} (verfügbar: {', '.join(INDICATOR_BACKENDS)})")
+    if backend == 'vbt':
+        return 'vbt'
+    if backend == 'auto' and VBT_AVAILABLE:
+        return 'vbt'
+    return 'native' if is_native_indicator(indicator_name) else 'vbt'
+
+
+def compute_indicator(indicator_name, data, parameters, backend='auto'):
+    """Einzelnen Indikator berechnen (VectorBT Pro oder eingebaute Bibliothek)"""
+    try:
+        if resolve_backend(backend, indicator_name) == 'native':
+            return compute_native_indicator(indicator_name, data, parameters)
+
+        # Alle katalogisierten Indikatoren über gecachte Runner
+        return dispatch_indicator(indicator_name, data, parameters)
+
+    except Exception as e:
+        print(f"❌ Fehler bei Indikator-Berechnung {indicator_name}: {e}")
+        return None
+
+
+def run_indicator_job(config, data, backend='auto'):
+    """
+    Einen Job aus indicators_config berechnen
+
+    Returns:
+        Ergebnis-Eintrag im Format von calculated_indicators (oder None)
+    """
+    indicator_name = config['indicator']
+    parameters = config['parameters']
+    param_grid = config.get('param_grid')
+
+    if param_grid:
+        result = run_indicator_grid(indicator_name, data, param_grid, parameters)
+    else:
+        result = compute_indicator(indicator_name, data, parameters, backend)
+
+    if result is None:
+        return None
+
+    return {
+        'indicator': indicator_name,
+        'timeframe': config['timeframe'],
+        'data': result,
+        'parameters': parameters,
+        'param_grid': param_grid
+    }
+
+
+def run_plan_job(configs, data):
+    """
+    Mehrere Indikatoren eines Timeframes über einen gemeinsamen DAG berechnen
+
+    Args:
+        configs: Dict config_key → Konfiguration (alle mit gleichem Timeframe)
+        data: OHLCV DataFrame des Timeframes
+
+    Returns:
+        Dict config_key → Ergebnis-Eintrag
+    """
+    plan = IndicatorPlan()
+    for config_key, config in configs.items():
+        plan.add_indicator(config_key, config['indicator'], config['parameters'])
+
+    outputs = plan.execute(data)
+    stats = plan.get_stats()
+    print(f"🧠 Plan: {stats['requested_nodes']} Knoten angefragt → {stats['unique_nodes']} berechnet")
+
+    return {
+        config_key: {
+            'indicator': config['indicator'],
+            'timeframe': config['timeframe'],
+            'data': outputs[config_key],
+            'parameters': config['parameters'],
+            'param_grid': config.get('param_grid')
+        }
+        for config_key, config in configs.items()
+    }
+
+
+def _run_single_job(config_key, config, data, backend='auto'):
+    """Einzel-Job im Format {config_key: Ergebnis}"""
+    result = run_indicator_job(config, data, backend)
+    return {config_key: result} if result is not None else {}
+
+
+# Daten pro Worker-Prozess (einmal beim Start übertragen statt pro Job)
+_WORKER_DATASETS = {}
+
+
+def _init_worker(datasets):
+    """Worker-Prozess initialisieren"""
+    global _WORKER_DATASETS
+    _WORKER_DATASETS = datasets
+
+
+def _run_job_in_worker(kind, timeframe, payload, backend):
+    """Job im Worker-Prozess ausführen"""
+    return _execute_job(kind, payload, _WORKER_DATASETS[timeframe], backend)
+
+
+def _execute_job(kind, payload, data, backend='auto'):
+    if kind == 'plan':
+        return run_plan_job(payload, data)
+    config_key, config = payload
+    return _run_single_job(config_key, config, data, backend)
+
+
+class ParallelIndicatorEngine:
+    """
+    ⚙️ PARALLELE INDIKATOR-ENGINE
+    Verteilt alle (Indikator, Timeframe)-Paare auf einen Worker-Pool
+    """
+
+    def __init__(self, mode='auto', max_workers=None, use_planner=True, backend='auto'):
+        if mode not in ENGINE_MODES:
+            raise ValueError(f"Unbekannter Modus: {mode} (verfügbar: {', '.join(ENGINE_MODES)})")
+        if backend not in INDICATOR_BACKENDS:
+            raise ValueError(f"Unbekanntes Backend: {backend} (verfügbar: {', '.join(INDICATOR_BACKENDS)})")
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_planner = use_planner
+        self.backend = backend
+
+    def resolve_mode(self, n_jobs):
+        """Ausführungsmodus bestimmen ('auto' → Pool pro Job, siehe job_mode)"""
+        if n_jobs <= 1 or self.max_workers <= 1:
+            return 'serial'
+        return self.mode
+
+    def job_mode(self, job):
+        """
+        Pool eines Jobs im Auto-Modus
+
+        Native Numba-Kernels (nogil) geben den GIL frei → Threads ohne Pickle-Overhead.
+        Runner-Jobs (VBT/TA-Lib/Python-Fallbacks) halten den GIL → Prozesse.
+        """
+        kind, _, payload, _ = job
+        if kind == 'plan':
+            native = True
+        else:
+            config = payload[1]
+            indicator_name = config['indicator']
+            if config.get('param_grid'):
+                native = indicator_name.replace('vbt:', '') in NATIVE_GRIDS
+            else:
+                native = resolve_backend(self.backend, indicator_name) == 'native'
+        return 'threads' if native and kernels.NUMBA_AVAILABLE else 'processes'
+
+    def build_jobs(self, indicators_config):
+        """
+        Jobs bilden: zerlegbare Indikatoren pro Timeframe in einen Planer-Job,
+        alle anderen (inkl. Grids) als Einzel-Jobs
+
+        Returns:
+            Liste (Art, Timeframe, Payload, config_keys)
+        """
+        jobs = []
+        planned = {}
+        plan = IndicatorPlan()
+
+        for config_key, config in indicators_config.items():
+            # Planer rechnet nativ → nur Indikatoren, die ohnehin die eingebaute Bibliothek nutzen
+            if (self.use_planner and not config.get('param_grid')
+                    and resolve_backend(self.backend, config['indicator']) == 'native'
+                    and plan.can_plan(config['indicator'], config['parameters'])):
+                planned.setdefault(config['timeframe'], {})[config_key] = config
+            else:
+                jobs.append(('single', config['timeframe'], (config_key, config), [config_key]))
+
+        for timeframe, configs in planned.items():
+            jobs.append(('plan', timeframe, configs, list(configs)))
+
+        return jobs
+
+    def run(self, datasets, indicators_config, progress_callback=None):
+        """
+        Alle Jobs berechnen
+
+        Args:
+            datasets: Dict Timeframe → DataFrame ('single' bei Single-Timeframe)
+            indicators_config: Dict config_key → Konfiguration (App 3 Format)
+            progress_callback: callback(fertig, gesamt, config_key, config, erfolgreich)
+
+        Returns:
+            Dict config_key → Ergebnis (Format von calculated_indicators)
+        """
+        jobs = self.build_jobs(indicators_config)
+        total = len(indicators_config)
+        results = {}
+        done = 0
+        mode = self.resolve_mode(len(jobs))
+
+        def collect(job, job_results):
+            nonlocal done
+            results.update(job_results)
+            for config_key in job[3]:
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total, config_key, indicators_config[config_key],
+                                      config_key in job_results)
+
+        if mode == 'serial':
+            for job in jobs:
+                collect(job, self._run_safely(job, datasets))
+        else:
+            job_modes = [self.job_mode(job) if mode == 'auto' else mode for job in jobs]
+            executors = {
+                pool_mode: self._create_executor(
+                    pool_mode, [job for job, job_mode in zip(jobs, job_modes) if job_mode == pool_mode], datasets)
+                for pool_mode in set(job_modes)
+            }
+
+            try:
+                futures = {
+                    self._submit(executors[job_mode], job_mode, job, datasets): job
+                    for job, job_mode in zip(jobs, job_modes)
+                }
+
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        job_results = future.result()
+                    except Exception as e:
+                        print(f"❌ Fehler bei Job ({job[1]}): {e}")
+                        job_results = {}
+                    collect(job, job_results)
+            finally:
+                for executor in executors.values():
+                    executor.shutdown()
+
+        # Ursprüngliche Reihenfolge der Konfiguration beibehalten
+        return {config_key: results[config_key] for config_key in indicators_config if config_key in results}
+
+    def _create_executor(self, mode, jobs, datasets):
+        """Worker-Pool für die Jobs eines Modus"""
+        workers = min(self.max_workers, len(jobs))
+        if mode == 'processes':
+            # Nur benötigte Timeframes an die Worker übertragen
+            needed = {job[1] for job in jobs}
+            return ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=({tf: datasets[tf] for tf in needed},)
+            )
+        return ThreadPoolExecutor(max_workers=workers)
+
+    def _submit(self, executor, mode, job, datasets):
+        if mode == 'processes':
+            return executor.submit(_run_job_in_worker, job[0], job[1], job[2], self.backend)
+        return executor.submit(_execute_job, job[0], job[2], datasets[job[1]], self.backend)
+
+    def _run_safely(self, job, datasets):
+        try:
+            return _execute_job(job[0], job[2], datasets[job[1]], self.backend)
+        except Exception as e:
+            print(f"❌ Fehler bei Job ({job[1]}): {e}")
+            return {}
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+🧩 INDICATOR GRID - VectorBT Pro GUI System
+Vektorisierte Parameter-Grids für Indikatoren
+- Parameter-Bereiche pro Indikator (z.B. window=5..50)
+- Alle Kombinationen in einem Aufruf → 2D-Spaltenblock pro Output
+- Gemeinsame Zwischenergebnisse über alle Fenster (Differenzen, Summen, EMAs)
+- Kompakte Speicherung als float32
+- Nicht nativ unterstützte Indikatoren: ein gebündelter VBT-Aufruf (param_product)
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+import indicator_kernels as kernels
+from indicator_dispatch import runner_cache
+
+# Standard-Datentyp für Grid-Blöcke
+GRID_DTYPE = np.float32
+
+
+def _parse_scalar(text):
+    """Zahl aus Text (int bevorzugt)"""
+    text = text.strip()
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parse_param_range(text):
+    """
+    Parameter-Bereich parsen
+
+    Formate:
+        "14"          → [14]
+        "5..50"       → [5, 6, ..., 50]
+        "5..50:5"     → [5, 10, ..., 50]
+        "1.5..3:0.5"  → [1.5, 2.0, 2.5, 3.0]
+        "5,10,20"     → [5, 10, 20]
+    """
+    text = str(text).strip()
+    if not text:
+        return []
+
+    if '..' in text:
+        bounds, _, step_text = text.partition(':')
+        start_text, end_text = bounds.split('..')
+        start, end = _parse_scalar(start_text), _parse_scalar(end_text)
+        step = _parse_scalar(step_text) if step_text else 1
+
+        if step <= 0:
+            raise ValueError(f"Ungültige Schrittweite in '{text}'")
+
+        if all(isinstance(v, int) for v in (start, end, step)):
+            return list(range(start, end + 1, step))
+
+        count = int(np.floor((end - start) / step + 1e-9)) + 1
+        return [round(start + i * step, 10) for i in range(count)]
+
+    return [_parse_scalar(part) for part in text.split(',') if part.strip()]
+
+
+def parse_param_grid(text):
+    """
+    Grid-Definition parsen: "window=5..50; alpha=1.5,2,2.5"
+
+    Returns:
+        Dict Parameter → Werte-Liste
+    """
+    grid = {}
+    for part in str(text).replace('\n', ';').split(';'):
+        if not part.strip():
+            continue
+        if '=' not in part:
+            raise ValueError(f"Ungültige Grid-Definition: '{part.strip()}' (erwartet: name=bereich)")
+        name, value = part.split('=', 1)
+        values = parse_param_range(value)
+        if values:
+            grid[name.strip()] = values
+    return grid
+
+
+def grid_size(param_grid):
+    """Anzahl Kombinationen eines Grids"""
+    size = 1
+    for values in param_grid.values():
+        size *= len(values)
+    return size
+
+
+def _combinations(param_grid):
+    """Kartesisches Produkt als Dict Parameter → Array (eine Spalte pro Kombination)"""
+    names = list(param_grid.keys())
+    combos = list(itertools.product(*[param_grid[name] for name in names]))
+    return {name: np.array([combo[i] for combo in combos]) for i, name in enumerate(names)}
+
+
+def _column_index(param_grid):
+    """Spalten-Index der Kombinationen (Index oder MultiIndex)"""
+    names = list(param_grid.keys())
+    if len(names) == 1:
+        return pd.Index(param_grid[names[0]], name=names[0])
+    return pd.MultiIndex.from_product([param_grid[name] for name in names], names=names)
+
+
+def _unique_columns(values):
+    """Eindeutige Werte und Spalten-Zuordnung je Kombination"""
+    unique, inverse = np.unique(values, return_inverse=True)
+    return unique, inverse
+
+
+# === NATIVE GRID-BERECHNUNGEN (gemeinsame Zwischenergebnisse) ===
+
+def _ma_grid(data, combos, params):
+    windows, inverse = _unique_columns(combos['window'])
+    close = kernels.to_float_array(data['close'])
+    if params.get('wtype', 'simple') == 'exp':
+        block = kernels.ewm_mean(close, kernels.alpha_ema(windows), minp=windows)
+    else:
+        block = kernels.rolling_mean(close, windows)
+    return {'ma': block[:, inverse]}
+
+
+def _rsi_grid(data, combos, params):
+    windows, inverse = _unique_columns(combos['window'])
+    # Gewinne/Verluste nur einmal für alle Fenster
+    gain, loss = kernels.gain_loss(data['close'])
+    alphas = kernels.alpha_wilder(windows)
+    avg_gain = kernels.ewm_mean(gain, alphas, minp=windows)
+    avg_loss = kernels.ewm_mean(loss, alphas, minp=windows)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 * avg_gain / (avg_gain + avg_loss)
+    return {'rsi': rsi[:, inverse]}
+
+
+def _bbands_grid(data, combos, params):
+    windows, inverse = _unique_columns(combos['window'])
+    close = kernels.to_float_array(data['close'])
+    # Mittelwert/Std je Fenster einmal, Alphas nur noch broadcasten
+    middle = kernels.rolling_mean(close, windows)[:, inverse]
+    std = kernels.rolling_std(close, windows, ddof=0)[:, inverse]
+    alpha = combos['alpha'].astype(np.float64)
+    return {
+        'upper': middle + alpha * std,
+        'middle': middle,
+        'lower': middle - alpha * std
+    }
+
+
+def _atr_grid(data, combos, params):
+    windows, inverse = _unique_columns(combos['window'])
+    tr = kernels.true_range(data['high'], data['low'], data['close'])
+    atr = kernels.ewm_mean(tr, kernels.alpha_wilder(windows), minp=windows)
+    return {'atr': atr[:, inverse]}
+
+
+def _macd_grid(data, combos, params):
+    fast, slow, signal = combos['fast_window'], combos['slow_window'], combos['signal_window']
+    close = kernels.to_float_array(data['close'])
+
+    # Alle benötigten EMAs (fast ∪ slow) in einem Aufruf
+    windows, inverse = _unique_columns(np.concatenate([fast, slow]))
+    emas = kernels.ewm_mean(close, kernels.alpha_ema(windows), minp=windows)
+    n_combos = len(fast)
+    macd = emas[:, inverse[:n_combos]] - emas[:, inverse[n_combos:]]
+
+    signal_line = kernels.ewm_mean(macd, kernels.alpha_ema(signal), minp=signal)
+    return {
+        'macd': macd,
+        'signal': signal_line,
+        'histogram': macd - signal_line
+    }
+
+
+# Native Grid-Indikatoren: Name → (Funktion, Parameter-Defaults)
+NATIVE_GRIDS = {
+    'MA': (_ma_grid, {'window': 14}),
+    'SMA': (_ma_grid, {'window': 14}),
+    'RSI': (_rsi_grid, {'window': 14}),
+    'BBANDS': (_bbands_grid, {'window': 20, 'alpha': 2.0}),
+    'ATR': (_atr_grid, {'window': 14}),
+    'MACD': (_macd_grid, {'fast_window': 12, 'slow_window': 26, 'signal_window': 9}),
+}
+
+
+def _run_vbt_grid(indicator_name, data, param_grid, parameters):
+    """Nicht nativ unterstützte Indikatoren: ein gebündelter VBT-Aufruf"""
+    runner = runner_cache.get(indicator_name)
+    indicator_cls = runner.indicator_cls
+    inputs = runner.prepare_inputs(data)
+    run_params = runner.prepare_params({k: v for k, v in parameters.items() if k not in param_grid})
+    run_params.update(param_grid)
+
+    result = indicator_cls.run(*inputs, **run_params, param_product=True)
+    outputs = {
+        output: getattr(result, output).to_numpy(dtype=np.float64)
+        for output in indicator_cls.output_names
+    }
+
+    # VBT benennt Ebenen mit Präfix (z.B. 'rsi_window')
+    columns = result.wrapper.columns
+    prefix = f"{indicator_cls.short_name}_"
+    return outputs, columns.rename([
+        name[len(prefix):] if name and name.startswith(prefix) else name
+        for name in columns.names
+    ])
+
+
+def run_indicator_grid(indicator_name, data, param_grid, parameters=None, dtype=GRID_DTYPE):
+    """
+    Alle Parameter-Kombinationen eines Indikators in einem Aufruf berechnen
+
+    Args:
+        indicator_name: Indikator-Name ('vbt:RSI' oder 'RSI')
+        data: OHLCV DataFrame
+        param_grid: Dict Parameter → Werte-Liste
+        parameters: Feste (nicht variierte) Parameter
+        dtype: Datentyp der Ergebnis-Blöcke
+
+    Returns:
+        Dict Output-Name → DataFrame (eine Spalte pro Kombination)
+    """
+    short_name = indicator_name.replace("vbt:", "")
+    parameters = dict(parameters or {})
+    param_grid = {name: list(values) for name, values in param_grid.items() if len(values)}
+
+    if short_name in NATIVE_GRIDS:
+        grid_func, defaults = NATIVE_GRIDS[short_name]
+        unknown = set(param_grid) - set(defaults)
+        if unknown:
+            raise ValueError(f"Unbekannte Grid-Parameter für {short_name}: {', '.join(sorted(unknown))}")
+
+        # Feste Parameter als einelementige Achsen ergänzen (Reihenfolge der Defaults)
+        full_grid = {
+            name: param_grid.get(name, [parameters.get(name, default)])
+            for name, default in defaults.items()
+        }
+        outputs = grid_func(data, _combinations(full_grid), parameters)
+
+        # Spalten-Index nur über die variierten Parameter
+        varying = {name: values for name, values in full_grid.items() if name in param_grid}
+        columns = _column_index(varying) if varying else pd.Index([0])
+    else:
+        outputs, columns = _run_vbt_grid(indicator_name, data, param_grid, parameters)
+
+    return {
+        name: pd.DataFrame(np.asarray(block, dtype=dtype), index=data.index, columns=columns)
+        for name, block in outputs.items()
+    }
+
+
+def flatten_grid_block(indicator_name, grid_result):
+    """
+    Grid-Ergebnis in flache Spalten umwandeln (z.B. RSI_5, MACD_macd_12_26_9)
+
+    Returns:
+        DataFrame mit allen Outputs nebeneinander
+    """
+    short_name = indicator_name.replace("vbt:", "")
+    multi_output = len(grid_result) > 1
+    blocks = []
+
+    for output_name, block in grid_result.items():
+        prefix = f"{short_name}_{output_name}" if multi_output else short_name
+        labels = []
+        for column in block.columns:
+            values = column if isinstance(column, tuple) else (column,)
+            labels.append(prefix + "_" + "_".join(str(v) for v in values))
+
+        flat = block.copy(deep=False)
+        flat.columns = labels
+        blocks.append(flat)
+
+    return pd.concat(blocks, axis=1)
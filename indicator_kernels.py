@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+🧮 INDICATOR KERNELS - VectorBT Pro GUI System
+Primitive Operationen für Indikator-Berechnungen
+- Spaltenweise (2D) Kernels: eine Berechnung für viele Fenster gleichzeitig
+- Rolling Mean über gemeinsame kumulative Summen, Rolling Std über Welford-Fenster
+- EMA/Wilder-Glättung mit Numba (GIL-frei), Pandas-Fallback
+- Differenzen, Gewinne/Verluste, True Range
+"""
+
+import numpy as np
+import pandas as pd
+
+# Numba für kompilierte Kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def to_float_array(values):
+    """Series/Array in zusammenhängendes float64-Array umwandeln"""
+    if isinstance(values, (pd.Series, pd.DataFrame)):
+        values = values.to_numpy()
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def window_array(windows):
+    """Fenster-Liste als int64-Array"""
+    return np.atleast_1d(np.asarray(windows, dtype=np.int64))
+
+
+def alpha_ema(windows):
+    """Glättungsfaktor für EMA (2 / (n + 1))"""
+    return 2.0 / (window_array(windows) + 1.0)
+
+
+def alpha_wilder(windows):
+    """Glättungsfaktor für Wilder-Glättung (1 / n)"""
+    return 1.0 / window_array(windows)
+
+
+def diff(x):
+    """Erste Differenz (erste Zeile NaN)"""
+    x = to_float_array(x)
+    out = np.empty_like(x)
+    out[:1] = np.nan
+    np.subtract(x[1:], x[:-1], out=out[1:])
+    return out
+
+
+def gain_loss(x):
+    """Gewinne und Verluste der ersten Differenz (beide ≥ 0)"""
+    delta = diff(x)
+    with np.errstate(invalid='ignore'):
+        gain = np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0))
+        loss = np.where(delta < 0, -delta, np.where(np.isnan(delta), np.nan, 0.0))
+    return gain, loss
+
+
+def true_range(high, low, close):
+    """True Range (erste Zeile = High - Low)"""
+    high = to_float_array(high)
+    low = to_float_array(low)
+    close = to_float_array(close)
+
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+
+    tr = high - low
+    tr = np.fmax(tr, np.abs(high - prev_close))
+    tr = np.fmax(tr, np.abs(low - prev_close))
+    return tr
+
+
+def valid_cumsums(x):
+    """Kumulative Summen von Werten, Quadraten und gültigen Beobachtungen"""
+    valid = ~np.isnan(x)
+    first_valid = np.argmax(valid) if valid.any() else 0
+    # Verschiebung um ersten gültigen Wert reduziert Auslöschung bei x²
+    shift = x[first_valid] if valid.any() else 0.0
+    filled = np.where(valid, x - shift, 0.0)
+
+    csum = np.concatenate(([0.0], np.cumsum(filled)))
+    csum_sq = np.concatenate(([0.0], np.cumsum(filled * filled)))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+    return csum, csum_sq, ccount, shift
+
+
+def rolling_mean(x, windows):
+    """
+    Rolling Mean für viele Fenster auf einmal
+
+    Args:
+        x: 1D-Array
+        windows: Fenster-Liste
+
+    Returns:
+        Array (n, len(windows)); NaN solange das Fenster nicht voll ist
+    """
+    x = to_float_array(x)
+    windows = window_array(windows)
+    n = len(x)
+    csum, _, ccount, shift = valid_cumsums(x)
+
+    out = np.full((n, len(windows)), np.nan)
+    for j, window in enumerate(windows):
+        if window > n:
+            continue
+        total = csum[window:] - csum[:-window]
+        count = ccount[window:] - ccount[:-window]
+        out[window - 1:, j] = np.where(count == window, total / window + shift, np.nan)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _rolling_var_nb(x, windows, ddof):
+        """
+        Welford über das gleitende Fenster (Wert hinzufügen, Wert von vor window Bars entfernen)
+
+        Werte werden relativ zu einem Referenzwert nahe dem Fenster-Mittel geführt, damit das
+        Kursniveau nicht in die Rundung eingeht. Alle window Bars wird das Fenster exakt neu
+        aufgesetzt (zwei Durchläufe, amortisiert O(1) pro Bar) → keine Drift über lange Reihen.
+
+        Returns:
+            (Varianz (n, k), Zustand (k, 4): Referenz, Mittelwert, M2, Anzahl gültiger Werte)
+        """
+        n = len(x)
+        k = len(windows)
+        out = np.full((n, k), np.nan)
+        state = np.zeros((k, 4))
+        for j in range(k):
+            window = windows[j]
+            ref = 0.0
+            mean = 0.0
+            m2 = 0.0
+            count = 0
+            for i in range(n):
+                value = x[i]
+                if not np.isnan(value):
+                    if count == 0:
+                        ref = value
+                    count += 1
+                    delta = (value - ref) - mean
+                    mean += delta / count
+                    m2 += delta * ((value - ref) - mean)
+                if i >= window:
+                    old = x[i - window]
+                    if not np.isnan(old):
+                        count -= 1
+                        if count == 0:
+                            mean = 0.0
+                            m2 = 0.0
+                        else:
+                            delta = (old - ref) - mean
+                            mean -= delta / count
+                            m2 -= delta * ((old - ref) - mean)
+                if (i + 1) % window == 0 and count > 0:
+                    ref += mean
+                    total = 0.0
+                    for t in range(i + 1 - window, i + 1):
+                        if not np.isnan(x[t]):
+                            total += x[t] - ref
+                    mean = total / count
+                    m2 = 0.0
+                    for t in range(i + 1 - window, i + 1):
+                        if not np.isnan(x[t]):
+                            delta = (x[t] - ref) - mean
+                            m2 += delta * delta
+                if count == window and window > ddof:
+                    out[i, j] = max(m2, 0.0) / (window - ddof)
+            state[j, 0] = ref
+            state[j, 1] = mean
+            state[j, 2] = m2
+            state[j, 3] = count
+        return out, state
+
+
+def _rolling_std_numpy(x, windows, ddof):
+    """NumPy-Fallback: zwei Durchläufe pro Fenster, blockweise über sliding_window_view"""
+    n = len(x)
+    out = np.full((n, len(windows)), np.nan)
+    for j, window in enumerate(windows):
+        window = int(window)
+        if window > n or window <= ddof:
+            continue
+        views = np.lib.stride_tricks.sliding_window_view(x, window)
+        # Temporäre Arrays auf ~32 MB pro Block begrenzen
+        step = max(1, (1 << 22) // window)
+        for start in range(0, len(views), step):
+            block = views[start:start + step]
+            out[window - 1 + start:window - 1 + start + len(block), j] = block.std(axis=1, ddof=ddof)
+    return out
+
+
+def rolling_std(x, windows, ddof=0):
+    """
+    Rolling Standardabweichung für viele Fenster
+
+    Welford-Update über das gleitende Fenster statt Summe/Quadratsumme: kein Präzisionsverlust
+    bei langen Reihen auf hohem Kursniveau.
+    """
+    x = to_float_array(x)
+    windows = window_array(windows)
+    if NUMBA_AVAILABLE:
+        var, _ = _rolling_var_nb(x, windows, ddof)
+        return np.sqrt(var)
+    return _rolling_std_numpy(x, windows, ddof)
+
+
+def rolling_var_state(x, window):
+    """
+    Welford-Zustand nach dem letzten Bar (Referenz, Mittelwert, M2, Anzahl gültiger Werte)
+
+    Für inkrementelle Updates, die an rolling_std anschließen.
+    """
+    x = to_float_array(x)
+    if NUMBA_AVAILABLE:
+        _, state = _rolling_var_nb(x, window_array([window]), 0)
+        return float(state[0, 0]), float(state[0, 1]), float(state[0, 2]), int(state[0, 3])
+    tail = x[-int(window):]
+    tail = tail[~np.isnan(tail)]
+    if not len(tail):
+        return 0.0, 0.0, 0.0, 0
+    ref = float(tail[-1])
+    shifted = tail - ref
+    mean = float(shifted.mean())
+    return ref, mean, float(((shifted - mean) ** 2).sum()), len(tail)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _ewm_mean_nb(x, alphas, minp):
+        n, n_in = x.shape
+        k = alphas.shape[0]
+        out = np.empty((n, k))
+        for j in range(k):
+            col = j if n_in > 1 else 0
+            alpha = alphas[j]
+            state = np.nan
+            count = 0
+            for i in range(n):
+                value = x[i, col]
+                if not np.isnan(value):
+                    if count == 0:
+                        state = value
+                    else:
+                        state = alpha * value + (1.0 - alpha) * state
+                    count += 1
+                out[i, j] = state if count >= minp[j] else np.nan
+        return out
+
+
+def _ewm_mean_pandas(x, alphas, minp):
+    """Pandas-Fallback (ein C-Aufruf pro Glättungsfaktor, NaN übersprungen wie im Numba-Kernel)"""
+    n, n_in = x.shape
+    out = np.empty((n, len(alphas)))
+    for j, alpha in enumerate(alphas):
+        col = x[:, j if n_in > 1 else 0]
+        out[:, j] = pd.Series(col).ewm(
+            alpha=alpha, adjust=False, ignore_na=True, min_periods=int(minp[j])
+        ).mean().to_numpy()
+    return out
+
+
+def ewm_mean(x, alphas, minp=None):
+    """
+    Exponentiell gewichteter Mittelwert (adjust=False) für viele Faktoren
+
+    NaN werden übersprungen (wie Pandas ignore_na=True): der Zustand wird über Lücken
+    fortgeschrieben, ohne dass die Gewichte über die Lücke weiter abklingen.
+
+    Args:
+        x: 1D-Array oder 2D-Array mit einer Spalte pro Faktor
+        alphas: Glättungsfaktoren (siehe alpha_ema / alpha_wilder)
+        minp: Mindestanzahl Beobachtungen (Skalar oder pro Faktor)
+
+    Returns:
+        Array (n, len(alphas))
+    """
+    x = to_float_array(x)
+    if x.ndim == 1:
+        x = x[:, None]
+    alphas = np.atleast_1d(np.asarray(alphas, dtype=np.float64))
+    if minp is None:
+        minp = 1
+    minp = np.broadcast_to(np.asarray(minp, dtype=np.int64), alphas.shape).copy()
+
+    if NUMBA_AVAILABLE:
+        return _ewm_mean_nb(x, alphas, minp)
+    return _ewm_mean_pandas(x, alphas, minp)
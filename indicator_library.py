@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+📚 INDICATOR LIBRARY - VectorBT Pro GUI System
+Eingebaute Indikatoren ohne VectorBT Pro Lizenz
+- RSI, MACD, BBANDS, ATR, ADX, MA (SMA/EMA/WMA), STOCH, OBV, VWAP
+- Numba-Kernels (GIL-frei) mit NumPy/Pandas-Fallback
+- Formeln und Defaults wie VectorBT Pro (Wilder-Glättung, ddof=0, minp=window)
+- Benchmark gegen den VBT-Pfad: python indicator_library.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+import indicator_kernels as kernels
+from indicator_kernels import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+
+# Unterstützte Glättungsarten für MA
+MA_WTYPES = ('simple', 'exp', 'wilder', 'weighted')
+
+
+# === KERNELS ===
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _wma_nb(x, window):
+        n = x.shape[0]
+        out = np.full(n, np.nan)
+        norm = window * (window + 1) / 2.0
+        for i in range(window - 1, n):
+            total = 0.0
+            for k in range(window):
+                total += (window - k) * x[i - k]
+            out[i] = total / norm
+        return out
+
+    @njit(cache=True, nogil=True)
+    def _rolling_extreme_nb(x, window, use_max):
+        n = x.shape[0]
+        out = np.full(n, np.nan)
+        for i in range(window - 1, n):
+            best = x[i]
+            for k in range(1, window):
+                value = x[i - k]
+                if np.isnan(value) or np.isnan(best):
+                    best = np.nan
+                    break
+                if (value > best) if use_max else (value < best):
+                    best = value
+            out[i] = best
+        return out
+
+    @njit(cache=True, nogil=True)
+    def _obv_nb(close, volume):
+        n = close.shape[0]
+        out = np.empty(n)
+        total = 0.0
+        for i in range(n):
+            value = volume[i]
+            if i > 0 and close[i] < close[i - 1]:
+                value = -value
+            if not np.isnan(value):
+                total += value
+            out[i] = total
+        return out
+
+    @njit(cache=True, nogil=True)
+    def _vwap_nb(price, volume, group_start):
+        n = price.shape[0]
+        out = np.empty(n)
+        pv_sum = 0.0
+        vol_sum = 0.0
+        for i in range(n):
+            if group_start[i]:
+                pv_sum = 0.0
+                vol_sum = 0.0
+            if not np.isnan(price[i]) and not np.isnan(volume[i]):
+                pv_sum += price[i] * volume[i]
+                vol_sum += volume[i]
+            out[i] = pv_sum / vol_sum if vol_sum != 0 else np.nan
+        return out
+
+
+def wma(x, window):
+    """Linear gewichteter Mittelwert (Gewichte 1..window)"""
+    x = kernels.to_float_array(x)
+    window = int(window)
+    if NUMBA_AVAILABLE:
+        return _wma_nb(x, window)
+
+    out = np.full(len(x), np.nan)
+    if window <= len(x):
+        weights = np.arange(window, 0, -1, dtype=np.float64)
+        out[window - 1:] = np.convolve(x, weights, mode='valid') / weights.sum()
+    return out
+
+
+def rolling_extreme(x, window, use_max=True):
+    """Rolling Maximum/Minimum (NaN solange Fenster unvollständig)"""
+    x = kernels.to_float_array(x)
+    window = int(window)
+    if NUMBA_AVAILABLE:
+        return _rolling_extreme_nb(x, window, use_max)
+
+    rolling = pd.Series(x).rolling(window, min_periods=window)
+    return (rolling.max() if use_max else rolling.min()).to_numpy()
+
+
+def moving_average(x, window, wtype='simple'):
+    """Gleitender Durchschnitt nach Glättungsart (wie vbt.MA)"""
+    if wtype not in MA_WTYPES:
+        raise ValueError(f"Unbekannte Glättungsart: {wtype} (verfügbar: {', '.join(MA_WTYPES)})")
+    if wtype == 'simple':
+        return kernels.rolling_mean(x, [window])[:, 0]
+    if wtype == 'exp':
+        return kernels.ewm_mean(x, kernels.alpha_ema(window), minp=window)[:, 0]
+    if wtype == 'wilder':
+        return kernels.ewm_mean(x, kernels.alpha_wilder(window), minp=window)[:, 0]
+    return wma(x, window)
+
+
+def _anchor_starts(index, anchor):
+    """Markiert die erste Zeile jeder Anker-Periode (z.B. Tag)"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        # Perioden in lokaler Zeit verankern
+        index = index.tz_localize(None)
+    try:
+        labels = index.floor(anchor)
+    except ValueError:
+        # Nicht-feste Perioden (W, M, ...)
+        labels = index.to_period(anchor).start_time
+    labels = np.asarray(labels.asi8)
+    starts = np.empty(len(labels), dtype=np.bool_)
+    starts[:1] = True
+    starts[1:] = labels[1:] != labels[:-1]
+    return starts
+
+
+# === INDIKATOREN (Arrays rein, Arrays raus) ===
+
+def _ma(data, params):
+    return moving_average(data['close'], params.get('window', 14), params.get('wtype', 'simple'))
+
+
+def _sma(data, params):
+    return moving_average(data['close'], params.get('window', 14), 'simple')
+
+
+def _ema(data, params):
+    return moving_average(data['close'], params.get('window', 14), 'exp')
+
+
+def _wma(data, params):
+    return moving_average(data['close'], params.get('window', 14), 'weighted')
+
+
+def _rsi(data, params):
+    window = params.get('window', 14)
+    gain, loss = kernels.gain_loss(data['close'])
+    alpha = kernels.alpha_wilder(window)
+    avg_gain = kernels.ewm_mean(gain, alpha, minp=window)[:, 0]
+    avg_loss = kernels.ewm_mean(loss, alpha, minp=window)[:, 0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100.0 * avg_gain / (avg_gain + avg_loss)
+
+
+def _macd(data, params):
+    fast = params.get('fast_window', 12)
+    slow = params.get('slow_window', 26)
+    signal_window = params.get('signal_window', 9)
+    emas = kernels.ewm_mean(data['close'], kernels.alpha_ema([fast, slow]), minp=[fast, slow])
+    macd = emas[:, 0] - emas[:, 1]
+    signal = kernels.ewm_mean(macd, kernels.alpha_ema(signal_window), minp=signal_window)[:, 0]
+    return {'macd': macd, 'signal': signal, 'histogram': macd - signal}
+
+
+def _bbands(data, params):
+    window = params.get('window', 20)
+    alpha = params.get('alpha', 2)
+    middle = kernels.rolling_mean(data['close'], [window])[:, 0]
+    std = kernels.rolling_std(data['close'], [window], ddof=0)[:, 0]
+    return {'upper': middle + alpha * std, 'middle': middle, 'lower': middle - alpha * std}
+
+
+def _atr(data, params):
+    window = params.get('window', 14)
+    tr = kernels.true_range(data['high'], data['low'], data['close'])
+    return kernels.ewm_mean(tr, kernels.alpha_wilder(window), minp=window)[:, 0]
+
+
+def _adx(data, params):
+    window = params.get('window', 14)
+    high = kernels.to_float_array(data['high'])
+    low = kernels.to_float_array(data['low'])
+    up = kernels.diff(high)
+    down = -kernels.diff(low)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        missing = np.isnan(up) | np.isnan(down)
+        plus_dm = np.where(missing, np.nan, np.where((up > down) & (up > 0), up, 0.0))
+        minus_dm = np.where(missing, np.nan, np.where((down > up) & (down > 0), down, 0.0))
+
+        tr = kernels.true_range(high, low, data['close'])
+        smoothed = kernels.ewm_mean(
+            np.column_stack([tr, plus_dm, minus_dm]),
+            kernels.alpha_wilder([window] * 3),
+            minp=window
+        )
+        atr = smoothed[:, 0]
+        plus_di = 100.0 * smoothed[:, 1] / atr
+        minus_di = 100.0 * smoothed[:, 2] / atr
+        dx = 100.0 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+
+    return kernels.ewm_mean(dx, kernels.alpha_wilder(window), minp=window)[:, 0]
+
+
+def _stoch(data, params):
+    k_window = params.get('fast_k_window', 14)
+    slow_k_window = params.get('slow_k_window', 3)
+    slow_d_window = params.get('slow_d_window', 3)
+    wtype = params.get('wtype', 'simple')
+
+    close = kernels.to_float_array(data['close'])
+    highest = rolling_extreme(data['high'], k_window, use_max=True)
+    lowest = rolling_extreme(data['low'], k_window, use_max=False)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fast_k = 100.0 * (close - lowest) / (highest - lowest)
+
+    slow_k = moving_average(fast_k, slow_k_window, wtype)
+    slow_d = moving_average(slow_k, slow_d_window, wtype)
+    return {'fast_k': fast_k, 'slow_k': slow_k, 'slow_d': slow_d}
+
+
+def _obv(data, params):
+    close = kernels.to_float_array(data['close'])
+    volume = kernels.to_float_array(data['volume'])
+    if NUMBA_AVAILABLE:
+        return _obv_nb(close, volume)
+
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    signed = np.where(close < prev_close, -volume, volume)
+    return np.nancumsum(signed)
+
+
+def _vwap(data, params):
+    anchor = params.get('anchor', 'D')
+    high = kernels.to_float_array(data['high'])
+    low = kernels.to_float_array(data['low'])
+    close = kernels.to_float_array(data['close'])
+    volume = kernels.to_float_array(data['volume'])
+    price = (high + low + close) / 3.0
+    starts = _anchor_starts(data.index, anchor)
+
+    if NUMBA_AVAILABLE:
+        return _vwap_nb(price, volume, starts)
+
+    valid = ~(np.isnan(price) | np.isnan(volume))
+    groups = np.cumsum(starts)
+    pv = pd.Series(np.where(valid, price * volume, 0.0)).groupby(groups).cumsum().to_numpy()
+    vol = pd.Series(np.where(valid, volume, 0.0)).groupby(groups).cumsum().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(vol != 0, pv / vol, np.nan)
+
+
+# Eingebaute Indikatoren: Name → (Funktion, benötigte Spalten)
+NATIVE_INDICATORS = {
+    'MA': (_ma, ('close',)),
+    'SMA': (_sma, ('close',)),
+    'EMA': (_ema, ('close',)),
+    'WMA': (_wma, ('close',)),
+    'RSI': (_rsi, ('close',)),
+    'MACD': (_macd, ('close',)),
+    'BBANDS': (_bbands, ('close',)),
+    'ATR': (_atr, ('high', 'low', 'close')),
+    'ADX': (_adx, ('high', 'low', 'close')),
+    'STOCH': (_stoch, ('high', 'low', 'close')),
+    'OBV': (_obv, ('close', 'volume')),
+    'VWAP': (_vwap, ('high', 'low', 'close', 'volume')),
+}
+
+
+def is_native_indicator(indicator_name):
+    """Prüfen ob ein Indikator eingebaut verfügbar ist"""
+    return indicator_name.replace("vbt:", "") in NATIVE_INDICATORS
+
+
+def compute_native_indicator(indicator_name, data, parameters=None):
+    """
+    Indikator mit der eingebauten Bibliothek berechnen
+
+    Args:
+        indicator_name: Indikator-Name ('vbt:RSI' oder 'RSI')
+        data: OHLCV DataFrame
+        parameters: Indikator-Parameter (Namen wie bei VectorBT Pro)
+
+    Returns:
+        Series oder Dict Output-Name → Series (wie VBT-Pfad)
+    """
+    short_name = indicator_name.replace("vbt:", "")
+    if short_name not in NATIVE_INDICATORS:
+        raise ValueError(f"Indikator {short_name} nicht in der eingebauten Bibliothek")
+
+    func, required = NATIVE_INDICATORS[short_name]
+    missing = [column for column in required if column not in data.columns]
+    if missing:
+        raise ValueError(f"{short_name} benötigt Spalten: {', '.join(missing)}")
+
+    result = func(data, dict(parameters or {}))
+
+    if isinstance(result, dict):
+        return {name: pd.Series(values, index=data.index, name=name) for name, values in result.items()}
+    return pd.Series(result, index=data.index, name=short_name.lower())
+
+
+# === BENCHMARK ===
+
+def _synthetic_ohlcv(n_bars, seed=42):
+    """Zufällige OHLCV-Daten (1-Minuten-Bars)"""
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0, 0.2, n_bars))
+    spread = rng.random(n_bars) * 0.5
+    return pd.DataFrame({
+        'open': close + rng.normal(0, 0.05, n_bars),
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'volume': rng.integers(100, 10_000, n_bars).astype(np.float64)
+    }, index=pd.date_range('2024-01-01', periods=n_bars, freq='1min'))
+
+
+def _max_abs_diff(native, reference):
+    """Maximale Abweichung zweier Ergebnisse (Series oder Dict)"""
+    if isinstance(native, dict):
+        return max(_max_abs_diff(native[name], reference[name]) for name in native)
+    a = np.asarray(native, dtype=np.float64)
+    b = np.asarray(reference, dtype=np.float64).reshape(a.shape)
+    both = ~(np.isnan(a) | np.isnan(b))
+    if (np.isnan(a) != np.isnan(b)).any():
+        return np.inf
+    return float(np.max(np.abs(a[both] - b[both]))) if both.any() else 0.0
+
+
+def benchmark_backends(data=None, n_bars=100_000, repeat=3, indicators=None):
+    """
+    Eingebaute Bibliothek gegen VectorBT Pro messen
+
+    Returns:
+        Liste Dicts (indicator, native_ms, vbt_ms, speedup, max_abs_diff)
+    """
+    from indicator_engine import compute_indicator, VBT_AVAILABLE
+
+    if data is None:
+        data = _synthetic_ohlcv(n_bars)
+    indicators = indicators or list(NATIVE_INDICATORS)
+
+    def timed(func):
+        best = np.inf
+        result = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+        return result, best * 1000.0
+
+    # Numba-Kernels vorab kompilieren
+    for name in indicators:
+        compute_native_indicator(name, data.iloc[:100], {})
+
+    results = []
+    for name in indicators:
+        native, native_ms = timed(lambda: compute_native_indicator(name, data, {}))
+        row = {'indicator': name, 'native_ms': native_ms, 'vbt_ms': None, 'speedup': None, 'max_abs_diff': None}
+
+        if VBT_AVAILABLE:
+            reference, vbt_ms = timed(lambda: compute_indicator(f"vbt:{name}", data, {}, backend='vbt'))
+            if reference is not None:
+                row['vbt_ms'] = vbt_ms
+                row['speedup'] = vbt_ms / native_ms if native_ms > 0 else None
+                row['max_abs_diff'] = _max_abs_diff(native, reference)
+
+        results.append(row)
+
+    return results
+
+
+def check_fallback_parity(data=None, n_bars=20_000, gap_fraction=0.01, indicators=None, seed=7):
+    """
+    Numba-Kernels gegen die Fallbacks ohne Numba prüfen (Daten mit NaN-Lücken)
+
+    Returns:
+        Liste Dicts (indicator, max_abs_diff); leer ohne Numba
+    """
+    global NUMBA_AVAILABLE
+    if not NUMBA_AVAILABLE:
+        return []
+
+    if data is None:
+        data = _synthetic_ohlcv(n_bars)
+        rng = np.random.default_rng(seed)
+        data.iloc[rng.random(len(data)) < gap_fraction] = np.nan
+    indicators = indicators or list(NATIVE_INDICATORS)
+
+    compiled = {name: compute_native_indicator(name, data, {}) for name in indicators}
+    NUMBA_AVAILABLE = kernels.NUMBA_AVAILABLE = False
+    try:
+        fallback = {name: compute_native_indicator(name, data, {}) for name in indicators}
+    finally:
+        NUMBA_AVAILABLE = kernels.NUMBA_AVAILABLE = True
+
+    return [
+        {'indicator': name, 'max_abs_diff': _max_abs_diff(compiled[name], fallback[name])}
+        for name in indicators
+    ]
+
+
+if __name__ == "__main__":
+    print(f"📚 Indikator-Benchmark (Numba: {'✅' if NUMBA_AVAILABLE else '❌'})")
+    for row in benchmark_backends():
+        line = f"  {row['indicator']:<8} nativ {row['native_ms']:8.2f} ms"
+        if row['vbt_ms'] is not None:
+            line += f" | vbt {row['vbt_ms']:8.2f} ms | x{row['speedup']:.1f} | Δmax {row['max_abs_diff']:.2e}"
+        else:
+            line += " | vbt nicht verfügbar"
+        print(line)
+
+    print("🔁 Numba gegen Fallback (Daten mit NaN-Lücken)")
+    for row in check_fallback_parity():
+        print(f"  {row['indicator']:<8} Δmax {row['max_abs_diff']:.2e}")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+🧠 INDICATOR PLANNER - VectorBT Pro GUI System
+Abhängigkeitsgraph für Indikatoren mit Wiederverwendung von Zwischenergebnissen
+- Zerlegt Indikatoren in primitive Operationen (Rolling Mean/Std, EMA, True Range, Diff, Gain/Loss)
+- Identische Knoten werden über (Operation, Input, Fenster) dedupliziert
+- Jede Primitive wird genau einmal berechnet; gleiche Operationen auf gleichem Input gebündelt
+- Angefragte Outputs werden aus den Knoten-Ergebnissen zusammengesetzt
+"""
+
+import numpy as np
+import pandas as pd
+
+import indicator_kernels as kernels
+
+# Fenster-Operationen, die pro Input gebündelt berechnet werden können
+WINDOWED_OPS = ('sma', 'std', 'ema', 'wilder')
+
+
+class IndicatorPlan:
+    """
+    🧠 INDIKATOR-PLAN (DAG)
+    Knoten sind Tupel (Operation, *Argumente); Argumente sind Knoten oder Skalare.
+    Gleiche Tupel = gleicher Knoten → automatische Deduplizierung.
+    """
+
+    def __init__(self):
+        self.nodes = {}          # Knoten → Anzahl Anfragen (Einfüge-Reihenfolge = topologisch)
+        self.outputs = {}        # config_key → {output_name: Knoten} oder Knoten
+        self.requested = 0
+
+    # === GRAPH-AUFBAU ===
+
+    def node(self, op, *args):
+        """Knoten anlegen oder vorhandenen wiederverwenden"""
+        key = (op,) + args
+        self.requested += 1
+        self.nodes[key] = self.nodes.get(key, 0) + 1
+        return key
+
+    def input(self, column):
+        return self.node('input', column)
+
+    def diff(self, x):
+        return self.node('diff', x)
+
+    def gain(self, x):
+        return self.node('gain', self.diff(x))
+
+    def loss(self, x):
+        return self.node('loss', self.diff(x))
+
+    def sma(self, x, window):
+        return self.node('sma', x, int(window))
+
+    def std(self, x, window):
+        return self.node('std', x, int(window))
+
+    def ema(self, x, window):
+        return self.node('ema', x, int(window))
+
+    def wilder(self, x, window):
+        return self.node('wilder', x, int(window))
+
+    def true_range(self):
+        return self.node('true_range', self.input('high'), self.input('low'), self.input('close'))
+
+    def directional_movement(self):
+        high, low = self.input('high'), self.input('low')
+        return self.node('plus_dm', high, low), self.node('minus_dm', high, low)
+
+    def add(self, a, b):
+        return self.node('add', a, b)
+
+    def sub(self, a, b):
+        return self.node('sub', a, b)
+
+    def div(self, a, b):
+        return self.node('div', a, b)
+
+    def scale(self, x, factor):
+        return self.node('scale', x, float(factor))
+
+    def abs(self, x):
+        return self.node('abs', x)
+
+    def can_plan(self, indicator_name, parameters=None):
+        """Prüfen ob ein Indikator zerlegt werden kann"""
+        short_name = indicator_name.replace("vbt:", "")
+        if short_name in ('MA', 'SMA'):
+            return (parameters or {}).get('wtype', 'simple') in ('simple', 'exp', 'wilder')
+        return short_name in PLANNERS
+
+    def add_indicator(self, config_key, indicator_name, parameters):
+        """
+        Indikator in den Graphen einfügen
+
+        Returns:
+            True wenn der Indikator geplant wurde
+        """
+        planner = PLANNERS.get(indicator_name.replace("vbt:", ""))
+        if planner is None:
+            return False
+        self.outputs[config_key] = planner(self, parameters)
+        return True
+
+    def get_stats(self):
+        """Anzahl angefragter vs. eindeutiger Knoten"""
+        return {'requested_nodes': self.requested, 'unique_nodes': len(self.nodes)}
+
+    # === AUSFÜHRUNG ===
+
+    def execute(self, data):
+        """
+        Alle Knoten genau einmal berechnen und Outputs zusammensetzen
+
+        Returns:
+            Dict config_key → Series oder Dict Output-Name → Series
+        """
+        values = {}
+
+        for key in self.nodes:
+            if key in values:
+                continue
+
+            op = key[0]
+            if op in WINDOWED_OPS:
+                # Alle Fenster derselben Operation auf demselben Input in einem Aufruf
+                siblings = [k for k in self.nodes if k[0] == op and k[1] == key[1] and k not in values]
+                windows = [k[2] for k in siblings]
+                block = _run_windowed(op, values[key[1]], windows)
+                for j, sibling in enumerate(siblings):
+                    values[sibling] = block[:, j]
+            else:
+                values[key] = _run_primitive(key, values, data)
+
+        def to_series(node_key):
+            return pd.Series(values[node_key], index=data.index)
+
+        results = {}
+        for config_key, output in self.outputs.items():
+            if isinstance(output, dict):
+                results[config_key] = {name: to_series(node_key) for name, node_key in output.items()}
+            else:
+                results[config_key] = to_series(output)
+        return results
+
+
+def _run_windowed(op, x, windows):
+    """Fenster-Operation für mehrere Fenster gebündelt"""
+    windows = kernels.window_array(windows)
+    if op == 'sma':
+        return kernels.rolling_mean(x, windows)
+    if op == 'std':
+        return kernels.rolling_std(x, windows, ddof=0)
+    if op == 'ema':
+        return kernels.ewm_mean(x, kernels.alpha_ema(windows), minp=windows)
+    return kernels.ewm_mean(x, kernels.alpha_wilder(windows), minp=windows)
+
+
+def _run_primitive(key, values, data):
+    """Einzelne (nicht gefensterte) Primitive berechnen"""
+    op, args = key[0], key[1:]
+
+    if op == 'input':
+        return kernels.to_float_array(data[args[0]])
+    if op == 'diff':
+        return kernels.diff(values[args[0]])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if op in ('gain', 'loss'):
+            delta = values[args[0]]
+            moved = delta if op == 'gain' else -delta
+            return np.where(np.isnan(delta), np.nan, np.where(moved > 0, moved, 0.0))
+        if op == 'true_range':
+            return kernels.true_range(values[args[0]], values[args[1]], values[args[2]])
+        if op in ('plus_dm', 'minus_dm'):
+            up = kernels.diff(values[args[0]])
+            down = -kernels.diff(values[args[1]])
+            if op == 'minus_dm':
+                up, down = down, up
+            return np.where(np.isnan(up) | np.isnan(down), np.nan, np.where((up > down) & (up > 0), up, 0.0))
+        if op == 'add':
+            return values[args[0]] + values[args[1]]
+        if op == 'sub':
+            return values[args[0]] - values[args[1]]
+        if op == 'div':
+            return values[args[0]] / values[args[1]]
+        if op == 'scale':
+            return values[args[0]] * args[1]
+        if op == 'abs':
+            return np.abs(values[args[0]])
+
+    raise ValueError(f"Unbekannte Primitive: {op}")
+
+
+# === INDIKATOR-ZERLEGUNGEN ===
+
+def _plan_ma(plan, params):
+    close = plan.input('close')
+    window = params.get('window', 14)
+    wtype = params.get('wtype', 'simple')
+    if wtype == 'exp':
+        return plan.ema(close, window)
+    if wtype == 'wilder':
+        return plan.wilder(close, window)
+    return plan.sma(close, window)
+
+
+def _plan_ema(plan, params):
+    return plan.ema(plan.input('close'), params.get('window', 14))
+
+
+def _plan_rsi(plan, params):
+    close = plan.input('close')
+    window = params.get('window', 14)
+    avg_gain = plan.wilder(plan.gain(close), window)
+    avg_loss = plan.wilder(plan.loss(close), window)
+    return plan.scale(plan.div(avg_gain, plan.add(avg_gain, avg_loss)), 100.0)
+
+
+def _plan_macd(plan, params):
+    close = plan.input('close')
+    macd = plan.sub(
+        plan.ema(close, params.get('fast_window', 12)),
+        plan.ema(close, params.get('slow_window', 26))
+    )
+    signal = plan.ema(macd, params.get('signal_window', 9))
+    return {
+        'macd': macd,
+        'signal': signal,
+        'histogram': plan.sub(macd, signal)
+    }
+
+
+def _plan_bbands(plan, params):
+    close = plan.input('close')
+    window = params.get('window', 20)
+    alpha = params.get('alpha', 2)
+    middle = plan.sma(close, window)
+    width = plan.scale(plan.std(close, window), alpha)
+    return {
+        'upper': plan.add(middle, width),
+        'middle': middle,
+        'lower': plan.sub(middle, width)
+    }
+
+
+def _plan_atr(plan, params):
+    return plan.wilder(plan.true_range(), params.get('window', 14))
+
+
+def _plan_adx(plan, params):
+    window = params.get('window', 14)
+    plus_dm, minus_dm = plan.directional_movement()
+    atr = plan.wilder(plan.true_range(), window)
+    plus_di = plan.scale(plan.div(plan.wilder(plus_dm, window), atr), 100.0)
+    minus_di = plan.scale(plan.div(plan.wilder(minus_dm, window), atr), 100.0)
+    dx = plan.scale(plan.div(plan.abs(plan.sub(plus_di, minus_di)), plan.add(plus_di, minus_di)), 100.0)
+    return plan.wilder(dx, window)
+
+
+# Zerlegbare Indikatoren: Name → Planer-Funktion
+PLANNERS = {
+    'MA': _plan_ma,
+    'SMA': _plan_ma,
+    'EMA': _plan_ema,
+    'RSI': _plan_rsi,
+    'MACD': _plan_macd,
+    'BBANDS': _plan_bbands,
+    'ATR': _plan_atr,
+    'ADX': _plan_adx,
+}
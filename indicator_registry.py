@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+🗂️ INDICATOR REGISTRY - VectorBT Pro GUI System
+Indizierter Katalog aller Indikatoren (vectorbt_all_indicators_params.json)
+- Kompakter Index: Namen, Kategorien, Anzeige-Texte, invertierter Token-Index
+- Index als Cache-Datei, Neuaufbau nur wenn sich die JSON-Datei ändert
+- Parameter-Schemas werden erst beim ersten Zugriff geladen
+- Präfix-Suche über sortierte Tokens (bisect) + Ergebnis-Cache
+"""
+
+import bisect
+import json
+import os
+import pickle
+import re
+import time
+
+CATALOG_FILE = 'vectorbt_all_indicators_params.json'
+CACHE_DIR = 'temp'
+INDEX_VERSION = 1
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Fallback falls der Katalog fehlt
+FALLBACK_INDICATORS = {
+    "vbt:RSI": {
+        "description": "Relative Strength Index",
+        "run_params": {
+            "close": {"required": True, "type": "Series"},
+            "window": {"default": "14", "required": False, "type": "int"}
+        }
+    },
+    "vbt:MACD": {
+        "description": "Moving Average Convergence Divergence",
+        "run_params": {
+            "close": {"required": True, "type": "Series"},
+            "fast_window": {"default": "12", "required": False, "type": "int"},
+            "slow_window": {"default": "26", "required": False, "type": "int"},
+            "signal_window": {"default": "9", "required": False, "type": "int"}
+        }
+    }
+}
+
+
+def display_name(indicator_name):
+    """Anzeige-Name ohne 'vbt:'-Präfix"""
+    return indicator_name.replace("vbt:", "")
+
+
+def tokenize(text):
+    """Kleingeschriebene Wort-Tokens"""
+    return _TOKEN_PATTERN.findall(str(text).lower())
+
+
+def _category(indicator_name, info):
+    """Kategorie aus Katalog-Eintrag oder Namens-Präfix"""
+    if info.get('category'):
+        return str(info['category'])
+    return indicator_name.split(':', 1)[0] if ':' in indicator_name else 'custom'
+
+
+def build_index(catalog):
+    """
+    Kompakten Such-Index aus dem Katalog bauen
+
+    Returns:
+        Dict mit names, display, categories, tokens (sortiert), postings
+    """
+    names = list(catalog.keys())
+    display = []
+    categories = []
+    inverted = {}
+
+    for position, name in enumerate(names):
+        info = catalog[name]
+        short_name = display_name(name)
+        description = info.get('description', '')
+        category = _category(name, info)
+
+        display.append(f"{short_name} - {description}")
+        categories.append(category)
+
+        # Name komplett + Namens-Teile + Kategorie + Beschreibung
+        tokens = {short_name.lower()}
+        tokens.update(tokenize(short_name))
+        tokens.update(tokenize(category))
+        tokens.update(tokenize(description))
+        for token in tokens:
+            inverted.setdefault(token, []).append(position)
+
+    tokens = sorted(inverted)
+    return {
+        'version': INDEX_VERSION,
+        'names': names,
+        'display': display,
+        'categories': categories,
+        'tokens': tokens,
+        'postings': [tuple(inverted[token]) for token in tokens]
+    }
+
+
+class IndicatorRegistry:
+    """
+    🗂️ INDIKATOR-REGISTRY
+    Lädt den Index aus dem Cache (oder baut ihn einmal), Schemas lazy
+    """
+
+    def __init__(self, catalog_path=CATALOG_FILE, cache_dir=CACHE_DIR):
+        self.catalog_path = catalog_path
+        self.index_path = os.path.join(cache_dir, 'indicator_index.pkl')
+        self.schema_path = os.path.join(cache_dir, 'indicator_schemas.pkl')
+        self.index = None
+        self.schemas = None
+        self.positions = {}
+        self.short_names = {}
+        self.search_cache = {}
+        self.search_texts = None
+        self.using_fallback = False
+
+    # === INDEX ===
+
+    def _catalog_signature(self):
+        stat = os.stat(self.catalog_path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_cached_index(self, signature):
+        if not os.path.exists(self.index_path) or not os.path.exists(self.schema_path):
+            return None
+        try:
+            with open(self.index_path, 'rb') as f:
+                index = pickle.load(f)
+            if index.get('version') == INDEX_VERSION and index.get('signature') == signature:
+                return index
+        except Exception as e:
+            print(f"⚠️ Indikator-Index Cache ungültig: {e}")
+        return None
+
+    def _build_and_cache(self, signature):
+        with open(self.catalog_path, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+
+        index = build_index(catalog)
+        index['signature'] = signature
+        self.schemas = catalog
+
+        try:
+            os.makedirs(os.path.dirname(self.index_path) or '.', exist_ok=True)
+            with open(self.schema_path, 'wb') as f:
+                pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Index zuletzt schreiben → gültiger Index impliziert gültige Schemas
+            with open(self.index_path, 'wb') as f:
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"⚠️ Indikator-Index konnte nicht gespeichert werden: {e}")
+
+        print(f"🗂️ Indikator-Index aufgebaut: {len(index['names'])} Indikatoren, {len(index['tokens'])} Tokens")
+        return index
+
+    def load(self):
+        """Index laden (Cache) oder bei geändertem Katalog neu aufbauen"""
+        if self.index is not None:
+            return self
+
+        start = time.perf_counter()
+        try:
+            signature = self._catalog_signature()
+            index = self._load_cached_index(signature) or self._build_and_cache(signature)
+            self.using_fallback = False
+        except FileNotFoundError:
+            print(f"⚠️ {self.catalog_path} nicht gefunden")
+            index = build_index(FALLBACK_INDICATORS)
+            self.schemas = FALLBACK_INDICATORS
+            self.using_fallback = True
+
+        self.index = index
+        self.positions = {name: i for i, name in enumerate(index['names'])}
+        self.short_names = {display_name(name): name for name in index['names']}
+        self.search_cache = {}
+        self.search_texts = None
+
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"✅ {len(index['names'])} Indikatoren geladen ({elapsed:.1f} ms)")
+        return self
+
+    def __len__(self):
+        return len(self.load().index['names'])
+
+    @property
+    def names(self):
+        return self.load().index['names']
+
+    @property
+    def display_texts(self):
+        return self.load().index['display']
+
+    def resolve(self, text):
+        """Vollständigen Namen aus Anzeige-Name oder Listen-Text bestimmen"""
+        self.load()
+        short_name = str(text).split(" - ")[0]
+        if short_name in self.positions:
+            return short_name
+        return self.short_names.get(short_name)
+
+    def get_category(self, indicator_name):
+        return self.index['categories'][self.positions[indicator_name]]
+
+    # === SCHEMAS (LAZY) ===
+
+    def _ensure_schemas(self):
+        if self.schemas is None:
+            with open(self.schema_path, 'rb') as f:
+                self.schemas = pickle.load(f)
+
+    def get_info(self, indicator_name):
+        """Katalog-Eintrag (Beschreibung, run_params) – lädt Schemas beim ersten Zugriff"""
+        self.load()
+        if indicator_name not in self.positions:
+            return {}
+        self._ensure_schemas()
+        return self.schemas.get(indicator_name, {})
+
+    def get_run_params(self, indicator_name):
+        return self.get_info(indicator_name).get('run_params', {})
+
+    # === SUCHE ===
+
+    def _token_matches(self, prefix):
+        """Alle Positionen mit Token, das mit prefix beginnt"""
+        tokens = self.index['tokens']
+        postings = self.index['postings']
+        lo = bisect.bisect_left(tokens, prefix)
+        hi = bisect.bisect_left(tokens, prefix + '\uffff', lo)
+
+        if hi - lo == 1:
+            return set(postings[lo])
+        matches = set()
+        for i in range(lo, hi):
+            matches.update(postings[i])
+        return matches
+
+    def _substring_matches(self, key):
+        """Teilstring in Anzeige-Text (Name + Beschreibung) wie die frühere Suche"""
+        if self.search_texts is None:
+            self.search_texts = [text.lower() for text in self.index['display']]
+        return {i for i, text in enumerate(self.search_texts) if key in text}
+
+    def search(self, query):
+        """
+        Indikatoren suchen
+
+        Treffer = alle Wörter als Präfix in Name/Kategorie/Beschreibung (Token-Index)
+        plus Teilstring-Treffer in den Anzeige-Texten (z.B. "rsi" findet auch STOCHRSI,
+        "ma" auch SMA/KAMA); Ergebnisse werden pro Anfrage gecacht.
+
+        Returns:
+            Liste Positionen in Katalog-Reihenfolge
+        """
+        self.load()
+        key = str(query).strip().lower()
+        if key in self.search_cache:
+            return self.search_cache[key]
+
+        words = tokenize(key)
+        if not words:
+            result = list(range(len(self.index['names'])))
+        else:
+            matches = None
+            for word in words:
+                found = self._token_matches(word)
+                matches = found if matches is None else matches & found
+                if not matches:
+                    break
+            result = sorted((matches or set()) | self._substring_matches(key))
+
+        if len(self.search_cache) > 1000:
+            self.search_cache.clear()
+        self.search_cache[key] = result
+        return result
+
+    def search_display(self, query):
+        """Anzeige-Texte der Suchtreffer"""
+        display = self.display_texts
+        return [display[i] for i in self.search(query)]
+
+
+# Globale Instanz
+indicator_registry = IndicatorRegistry()
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+📐 PERFORMANCE METRICS - VectorBT Pro GUI System
+Kennzahlen aus Equity-Kurve und Trade-Records (App 8/9)
+- Ein Numba-Durchlauf pro Spalte sammelt alle Akkumulatoren (Renditen, Drawdown, Exposure)
+- Kennzahlen sind Formeln über den Akkumulatoren → neue Kennzahl kostet praktisch nichts
+- Trade-Statistiken über gruppierte Summen (bincount) für alle Spalten gleichzeitig
+- Annualisierung über die aus dem Index geschätzte Bar-Frequenz (Bars pro Jahr)
+- Viele Spalten auf einmal (Parameter-Kombinationen, Symbole)
+- NumPy-Fallback ohne Numba (gleiche Ergebnisse)
+"""
+
+import numpy as np
+import pandas as pd
+
+from condition_engine import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+
+SECONDS_PER_YEAR = 365.25 * 24 * 3600
+DEFAULT_PERIODS_PER_YEAR = 252
+
+# Offene Trades (Exit-Grund < 0) zählen nicht zu den Trade-Statistiken
+OPEN_TRADE_REASON = -1
+
+# Akkumulatoren pro Spalte (Reihenfolge = Kernel-Ausgabe)
+STAT_FIELDS = ('n_returns', 'mean_return', 'm2_return', 'downside_sq', 'max_drawdown', 'max_drawdown_duration',
+               'start_value', 'end_value', 'exposure_bars', 'n_bars')
+
+
+def infer_periods_per_year(index, default=DEFAULT_PERIODS_PER_YEAR):
+    """
+    Bars pro Jahr aus einem DatetimeIndex schätzen
+
+    Über die tatsächliche Bar-Anzahl pro Zeitspanne, damit Lücken (Wochenenden,
+    Handelszeiten) berücksichtigt werden; bei kurzen Zeitspannen über den Median-Abstand.
+    """
+    if not isinstance(index, pd.DatetimeIndex) or len(index) < 2:
+        return float(default)
+    span = (index[-1] - index[0]).total_seconds()
+    if span <= 0:
+        return float(default)
+    if span >= 30 * 24 * 3600:
+        return (len(index) - 1) / (span / SECONDS_PER_YEAR)
+    step = (index[1:] - index[:-1]).median().total_seconds()
+    return SECONDS_PER_YEAR / step if step > 0 else float(default)
+
+
+def _as_columns(values):
+    """1D/2D-Array oder DataFrame → 2D float64 (Bars × Spalten), spaltenweise zusammenhängend"""
+    array = values.to_numpy() if isinstance(values, (pd.Series, pd.DataFrame)) else np.asarray(values)
+    if array.ndim == 1:
+        array = array.reshape(-1, 1)
+    return np.asfortranarray(array, dtype=np.float64)
+
+
+def _equity_stats_numpy(equity, start_value, position):
+    """NumPy-Fallback: Akkumulatoren vektorisiert entlang der Bars"""
+    n, k = equity.shape
+    stats = np.zeros((k, len(STAT_FIELDS)))
+    filled = pd.DataFrame(equity).ffill().to_numpy()
+    first_valid = pd.DataFrame(equity).bfill().to_numpy()[0] if n else np.full(k, np.nan)
+    # Ohne Startkapital beginnen die Renditen mit dem ersten gültigen Wert
+    start = np.where(np.isnan(start_value), first_valid, start_value)
+    # Vorwert = letzter gültiger Wert davor, am Anfang das Startkapital (wie der Numba-Kernel)
+    seeded = pd.DataFrame(np.vstack([start_value, equity])).ffill().to_numpy()
+    previous = seeded[:-1]
+    returns = filled / previous - 1.0
+    returns[np.isnan(equity) | np.isnan(previous)] = np.nan
+    valid = ~np.isnan(returns)
+    count = valid.sum(axis=0)
+    mean = np.nansum(returns, axis=0) / np.maximum(count, 1)
+    m2 = np.nansum((returns - mean) ** 2, axis=0)
+    downside = np.nansum(np.minimum(returns, 0.0) ** 2, axis=0)
+
+    peak = np.fmax.accumulate(np.vstack([start, filled]), axis=0)[1:]
+    drawdown = np.where(peak > 0, 1.0 - filled / peak, 0.0)
+    underwater = filled < peak
+    # Längste Unterwasser-Serie: Positionen seit dem letzten Hoch
+    rows = np.arange(1, n + 1)[:, None]
+    last_high = np.maximum.accumulate(np.where(underwater, 0, rows), axis=0)
+    duration = np.where(underwater, rows - last_high, 0)
+
+    stats[:, 0] = count
+    stats[:, 1] = mean
+    stats[:, 2] = m2
+    stats[:, 3] = downside
+    stats[:, 4] = np.nanmax(drawdown, axis=0, initial=0.0)
+    stats[:, 5] = duration.max(axis=0, initial=0)
+    stats[:, 6] = start
+    stats[:, 7] = seeded[-1]
+    stats[:, 8] = np.count_nonzero(position, axis=0) if position is not None else 0
+    stats[:, 9] = n
+    return stats
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _equity_stats_nb(equity, start_value, position, has_position):
+        """Ein Durchlauf pro Spalte: Welford-Mittel/Varianz, Downside, Drawdown + Dauer, Exposure"""
+        n, k = equity.shape
+        stats = np.zeros((k, 10))
+        for j in range(k):
+            previous = start_value[j]
+            start = previous
+            peak = previous
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            downside = 0.0
+            max_drawdown = 0.0
+            underwater = 0
+            max_underwater = 0
+            exposure = 0
+            for i in range(n):
+                if has_position and position[i, j] != 0.0:
+                    exposure += 1
+                value = equity[i, j]
+                if np.isnan(value):
+                    # Wie fortgeschriebener Vorwert: Unterwasser-Dauer läuft weiter
+                    if underwater > 0:
+                        underwater += 1
+                        if underwater > max_underwater:
+                            max_underwater = underwater
+                    continue
+                if np.isnan(start):
+                    start = value
+                if not np.isnan(previous):
+                    r = value / previous - 1.0
+                    count += 1
+                    delta = r - mean
+                    mean += delta / count
+                    m2 += delta * (r - mean)
+                    if r < 0.0:
+                        downside += r * r
+                previous = value
+                if np.isnan(peak) or value >= peak:
+                    peak = value
+                    underwater = 0
+                else:
+                    underwater += 1
+                    if underwater > max_underwater:
+                        max_underwater = underwater
+                    if peak > 0.0:
+                        drawdown = 1.0 - value / peak
+                        if drawdown > max_drawdown:
+                            max_drawdown = drawdown
+            stats[j, 0] = count
+            stats[j, 1] = mean
+            stats[j, 2] = m2
+            stats[j, 3] = downside
+            stats[j, 4] = max_drawdown
+            stats[j, 5] = max_underwater
+            stats[j, 6] = start
+            stats[j, 7] = previous
+            stats[j, 8] = exposure
+            stats[j, 9] = n
+        return stats
+
+
+def equity_stats(equity, start_value=None, position=None):
+    """
+    Akkumulatoren aller Spalten in einem Durchlauf
+
+    Returns:
+        Dict Feld → Array (eine Zahl pro Spalte), Felder siehe STAT_FIELDS
+    """
+    equity = _as_columns(equity)
+    k = equity.shape[1]
+    start = np.full(k, np.nan) if start_value is None else np.broadcast_to(
+        np.asarray(start_value, dtype=np.float64), (k,)).copy()
+    position = _as_columns(position) if position is not None else None
+
+    if NUMBA_AVAILABLE:
+        stats = _equity_stats_nb(equity, start, position if position is not None else np.zeros((0, 0)),
+                                 position is not None)
+    else:
+        stats = _equity_stats_numpy(equity, start, position)
+    return {field: stats[:, i] for i, field in enumerate(STAT_FIELDS)}
+
+
+def trade_stats(trades, n_columns=1, trade_columns=None):
+    """
+    Trade-Akkumulatoren pro Spalte über gruppierte Summen
+
+    Args:
+        trades: Trade-Records mit 'pnl' (optional 'exit_reason', 'col')
+        n_columns: Anzahl Spalten
+        trade_columns: Spalte pro Trade (Standard: Feld 'col' oder 0)
+    """
+    empty = np.zeros(n_columns)
+    if trades is None or len(trades) == 0:
+        return {'trades': empty, 'wins': empty, 'gross_profit': empty, 'gross_loss': empty, 'pnl': empty}
+
+    names = trades.dtype.names or ()
+    if trade_columns is None:
+        trade_columns = trades['col'] if 'col' in names else np.zeros(len(trades), dtype=np.int64)
+    closed = trades['exit_reason'] != OPEN_TRADE_REASON if 'exit_reason' in names else np.ones(len(trades), bool)
+    columns = np.asarray(trade_columns, dtype=np.int64)[closed]
+    pnl = trades['pnl'][closed]
+
+    def grouped(weights=None):
+        return np.bincount(columns, weights=weights, minlength=n_columns).astype(np.float64)
+
+    return {
+        'trades': grouped(),
+        'wins': grouped(pnl > 0),
+        'gross_profit': grouped(np.where(pnl > 0, pnl, 0.0)),
+        'gross_loss': grouped(np.where(pnl < 0, -pnl, 0.0)),
+        'pnl': grouped(pnl)
+    }
+
+
+def _divide(a, b, fill=np.nan):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(b != 0, a / np.where(b != 0, b, 1.0), fill)
+
+
+def _total_return(s, ppy, rf):
+    return _divide(s['end_value'], s['start_value']) - 1.0
+
+
+def _annualized_return(s, ppy, rf):
+    years = _divide(s['n_returns'], ppy)
+    growth = np.maximum(1.0 + _total_return(s, ppy, rf), 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(years > 0, growth ** (1.0 / np.where(years > 0, years, 1.0)) - 1.0, np.nan)
+
+
+def _std(s):
+    return np.sqrt(_divide(s['m2_return'], s['n_returns'] - 1))
+
+
+def _volatility(s, ppy, rf):
+    return _std(s) * np.sqrt(ppy)
+
+
+def _sharpe(s, ppy, rf):
+    return _divide(s['mean_return'] - rf / ppy, _std(s)) * np.sqrt(ppy)
+
+
+def _sortino(s, ppy, rf):
+    downside = np.sqrt(_divide(s['downside_sq'], s['n_returns']))
+    return _divide(s['mean_return'] - rf / ppy, downside) * np.sqrt(ppy)
+
+
+def _calmar(s, ppy, rf):
+    return _divide(_annualized_return(s, ppy, rf), s['max_drawdown'])
+
+
+def _max_drawdown(s, ppy, rf):
+    return s['max_drawdown']
+
+
+def _max_drawdown_duration(s, ppy, rf):
+    return s['max_drawdown_duration']
+
+
+def _exposure(s, ppy, rf):
+    return _divide(s['exposure_bars'], s['n_bars'], 0.0)
+
+
+def _trades(s, ppy, rf):
+    return s['trades']
+
+
+def _win_rate(s, ppy, rf):
+    return _divide(s['wins'], s['trades'])
+
+
+def _profit_factor(s, ppy, rf):
+    # Ohne Verlust-Trades unendlich, ohne Trades undefiniert
+    return np.where(s['trades'] > 0, _divide(s['gross_profit'], s['gross_loss'], np.inf), np.nan)
+
+
+def _expectancy(s, ppy, rf):
+    return _divide(s['pnl'], s['trades'])
+
+
+# Kennzahlen: Name → (Funktion(Akkumulatoren, Bars pro Jahr, risikofreier Zins), Anzeige, Format)
+METRICS = {
+    'total_return': (_total_return, 'Total Return', '.2%'),
+    'annualized_return': (_annualized_return, 'Annualisierte Rendite', '.2%'),
+    'volatility': (_volatility, 'Volatilität (ann.)', '.2%'),
+    'sharpe_ratio': (_sharpe, 'Sharpe Ratio', '.2f'),
+    'sortino_ratio': (_sortino, 'Sortino Ratio', '.2f'),
+    'calmar_ratio': (_calmar, 'Calmar Ratio', '.2f'),
+    'max_drawdown': (_max_drawdown, 'Max Drawdown', '.2%'),
+    'max_drawdown_duration': (_max_drawdown_duration, 'Max DD Dauer (Bars)', '.0f'),
+    'exposure': (_exposure, 'Exposure', '.2%'),
+    'total_trades': (_trades, 'Trades', '.0f'),
+    'win_rate': (_win_rate, 'Win Rate', '.2%'),
+    'profit_factor': (_profit_factor, 'Profit Factor', '.2f'),
+    'expectancy': (_expectancy, 'Expectancy', ',.2f'),
+}
+
+
+def compute_metrics(equity, trades=None, position=None, init_cash=None, index=None, periods_per_year=None,
+                    risk_free=0.0, metrics=None, trade_columns=None, columns=None):
+    """
+    Kennzahlen für eine oder viele Equity-Kurven
+
+    Args:
+        equity: Equity pro Bar (1D, 2D Bars × Spalten oder DataFrame)
+        trades: Trade-Records (TRADE_DTYPE, optional Feld 'col')
+        position: Position pro Bar (für Exposure), gleiche Form wie equity
+        init_cash: Startkapital (Skalar oder pro Spalte); Standard: erster Equity-Wert
+        index: DatetimeIndex für die Annualisierung (Standard: Index von equity)
+        periods_per_year: Bars pro Jahr (Standard: aus dem Index geschätzt)
+        risk_free: Risikofreier Zins pro Jahr
+        metrics: Auswahl aus METRICS (Standard: alle)
+        trade_columns: Spalte pro Trade (Standard: Feld 'col' oder 0)
+        columns: Spalten-Beschriftung
+
+    Returns:
+        DataFrame (Kennzahlen × Spalten)
+    """
+    if index is None and isinstance(equity, (pd.Series, pd.DataFrame)):
+        index = equity.index
+    if columns is None and isinstance(equity, pd.DataFrame):
+        columns = equity.columns
+    ppy = float(periods_per_year or infer_periods_per_year(index))
+
+    stats = equity_stats(equity, init_cash, position)
+    n_columns = len(stats['n_bars'])
+    stats.update(trade_stats(trades, n_columns, trade_columns))
+
+    names = metrics or list(METRICS)
+    values = {name: METRICS[name][0](stats, ppy, float(risk_free)) for name in names}
+    return pd.DataFrame(values, index=columns).T
+
+
+def format_metric(name, value):
+    """Kennzahl für die Anzeige formatieren"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return "n/a"
+    return format(value, METRICS[name][2])
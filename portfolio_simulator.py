@@ -0,0 +1,730 @@
+#!/usr/bin/env python3
+"""
+💼 PORTFOLIO SIMULATOR - VectorBT Pro GUI System
+Kompilierte Backtest-Simulation für App 8
+- Event-Schleife über alle Bars in einem Numba-Kernel (Long-Positionen)
+- Entries/Exits als Bool-Arrays, gepackte Bits oder SparseSignals (App 7)
+- Positionsgröße als Anteil des Kapitals, proportionale Gebühren und Slippage
+- Stop Loss / Take Profit intrabar über High/Low (Gap über Open), sonst über Close
+- Ergebnis: Equity, Position, strukturierte Trade-Records, Kennzahlen über performance_metrics
+- NumPy-Fallback: Sprung von Trade zu Trade, Stops als vektorisierte Suche (gleiche Semantik)
+- Batch-Modus: viele Spalten (Parameter-Kombinationen / Symbole) in einer kompilierten Schleife,
+  Gebühren/Stops/Größen pro Spalte, Kennzahlen pro Spalte
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from condition_engine import packed_length, NUMBA_AVAILABLE
+from signal_processing import SparseSignals, EXIT_SIGNAL, EXIT_MAX_HOLDING
+from performance_metrics import compute_metrics
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+
+# Exit-Gründe (0/1 wie signal_processing: Signal / Max Holding)
+EXIT_STOP_LOSS = 2
+EXIT_TAKE_PROFIT = 3
+EXIT_OPEN = -1
+EXIT_REASON_NAMES = {EXIT_SIGNAL: 'Signal', EXIT_MAX_HOLDING: 'Max Holding', EXIT_STOP_LOSS: 'Stop Loss',
+                     EXIT_TAKE_PROFIT: 'Take Profit', EXIT_OPEN: 'Offen'}
+
+TRADE_DTYPE = np.dtype([
+    ('entry_idx', np.int64),
+    ('exit_idx', np.int64),
+    ('entry_price', np.float64),
+    ('exit_price', np.float64),
+    ('size', np.float64),
+    ('fees', np.float64),
+    ('pnl', np.float64),
+    ('return', np.float64),
+    ('exit_reason', np.int8),
+])
+
+# Batch-Simulation: zusätzlich die Spalte (Parameter-Kombination / Symbol) pro Trade
+BATCH_TRADE_DTYPE = np.dtype([('col', np.int64)] + [(name, TRADE_DTYPE[name]) for name in TRADE_DTYPE.names])
+
+# Pro Spalte einstellbare Parameter (Skalar = gleich für alle Spalten)
+BATCH_PARAMETERS = ('init_cash', 'size', 'fees', 'slippage', 'stop_loss', 'take_profit')
+
+
+def _as_mask(signals, n_bars):
+    """Bool-Array/Series, gepackte Bits oder SparseSignals → Bool-Array"""
+    if isinstance(signals, np.ndarray) and signals.dtype == np.uint8 and len(signals) == packed_length(n_bars) \
+            and n_bars != len(signals):
+        return np.unpackbits(signals, count=n_bars).view(bool)
+    mask = np.asarray(signals, dtype=bool)
+    if len(mask) != n_bars:
+        raise ValueError(f"Signal-Länge {len(mask)} passt nicht zu {n_bars} Bars")
+    return mask
+
+
+def _price_array(data, column):
+    if column in data.columns:
+        return np.ascontiguousarray(data[column].to_numpy(), dtype=np.float64)
+    return None
+
+
+class SimulationResult:
+    """
+    💼 SIMULATIONS-ERGEBNIS
+    Equity/Position pro Bar und Trade-Records (TRADE_DTYPE)
+    """
+
+    def __init__(self, equity, position, trades, init_cash, index=None):
+        self.equity = equity
+        self.position = position
+        self.trades = trades
+        self.init_cash = float(init_cash)
+        self.index = index
+
+    @property
+    def final_value(self):
+        return float(self.equity[-1]) if len(self.equity) else self.init_cash
+
+    @property
+    def total_return(self):
+        return self.final_value / self.init_cash - 1.0
+
+    @property
+    def closed_trades(self):
+        return self.trades[self.trades['exit_reason'] != EXIT_OPEN]
+
+    def equity_series(self):
+        return pd.Series(self.equity, index=self.index, name='equity')
+
+    def trades_frame(self):
+        """Trade-Records als DataFrame (mit Zeitstempeln, falls Index vorhanden)"""
+        trades = pd.DataFrame(self.trades)
+        trades['exit_reason'] = trades['exit_reason'].map(EXIT_REASON_NAMES)
+        if self.index is not None and len(trades):
+            trades.insert(1, 'entry_time', self.index[trades['entry_idx'].to_numpy()])
+            trades.insert(3, 'exit_time', self.index[trades['exit_idx'].to_numpy()])
+        return trades
+
+    def metrics(self, periods_per_year=None, risk_free=0.0):
+        """Alle Kennzahlen aus performance_metrics als Series"""
+        return compute_metrics(self.equity, self.trades, self.position, init_cash=self.init_cash,
+                               index=self.index, periods_per_year=periods_per_year, risk_free=risk_free)[0]
+
+    def summary(self):
+        """Kennzahlen direkt aus Equity und Trades"""
+        closed = self.closed_trades
+        peak = np.maximum.accumulate(self.equity) if len(self.equity) else self.equity
+        drawdown = 1.0 - self.equity / peak if len(self.equity) else np.zeros(1)
+        return {
+            'initial_cash': self.init_cash,
+            'final_value': self.final_value,
+            'total_return': self.total_return,
+            'max_drawdown': float(np.nanmax(drawdown)) if len(drawdown) else 0.0,
+            'total_trades': int(len(self.trades)),
+            'closed_trades': int(len(closed)),
+            'profitable_trades': int((closed['pnl'] > 0).sum()),
+            'win_rate': float((closed['pnl'] > 0).mean()) if len(closed) else 0.0,
+            'total_fees': float(self.trades['fees'].sum())
+        }
+
+
+class BatchSimulationResult:
+    """
+    💼 BATCH-ERGEBNIS
+    Equity/Position als (Bars × Spalten) und Trade-Records mit Spalte (BATCH_TRADE_DTYPE)
+    """
+
+    def __init__(self, equity, position, trades, init_cash, index=None, columns=None):
+        self.equity = equity
+        self.position = position
+        self.trades = trades
+        self.init_cash = np.asarray(init_cash, dtype=np.float64)
+        self.index = index
+        if columns is None:
+            columns = pd.RangeIndex(equity.shape[1])
+        self.columns = columns if isinstance(columns, pd.Index) else pd.Index(columns)
+
+    @property
+    def n_columns(self):
+        return self.equity.shape[1]
+
+    @property
+    def final_value(self):
+        return self.equity[-1] if len(self.equity) else self.init_cash
+
+    @property
+    def total_return(self):
+        return self.final_value / self.init_cash - 1.0
+
+    def equity_frame(self):
+        return pd.DataFrame(self.equity, index=self.index, columns=self.columns)
+
+    def column(self, col):
+        """Einzelne Spalte (Position oder Label) als SimulationResult"""
+        j = col if isinstance(col, (int, np.integer)) else self.columns.get_loc(col)
+        selected = self.trades[self.trades['col'] == j]
+        trades = np.empty(len(selected), dtype=TRADE_DTYPE)
+        for name in TRADE_DTYPE.names:
+            trades[name] = selected[name]
+        return SimulationResult(self.equity[:, j], self.position[:, j], trades, self.init_cash[j], self.index)
+
+    def metrics(self, periods_per_year=None, risk_free=0.0):
+        """Kennzahlen aller Spalten in einem Durchlauf (DataFrame Kennzahlen × Spalten)"""
+        return compute_metrics(self.equity, self.trades, self.position, init_cash=self.init_cash, index=self.index,
+                               periods_per_year=periods_per_year, risk_free=risk_free, columns=self.columns)
+
+
+def _exit_checks(i, c, has_ohlc, open_, high, low, stop_price, target_price):
+    """Stop Loss / Take Profit für Bar i (Python, gemeinsam für den NumPy-Fallback)"""
+    if has_ohlc:
+        if low[i] <= stop_price:
+            return min(open_[i], stop_price), EXIT_STOP_LOSS
+        if high[i] >= target_price:
+            return max(open_[i], target_price), EXIT_TAKE_PROFIT
+    else:
+        if c <= stop_price:
+            return c, EXIT_STOP_LOSS
+        if c >= target_price:
+            return c, EXIT_TAKE_PROFIT
+    return np.nan, EXIT_OPEN
+
+
+def _first_stop(start, stop, has_ohlc, close, high, low, stop_price, target_price):
+    """Erster Bar in [start, stop) mit Stop-Treffer (vektorisiert) oder stop"""
+    if start >= stop:
+        return stop
+    lo = low[start:stop] if has_ohlc else close[start:stop]
+    hi = high[start:stop] if has_ohlc else close[start:stop]
+    hits = np.flatnonzero((lo <= stop_price) | (hi >= target_price))
+    return start + int(hits[0]) if len(hits) else stop
+
+
+def _simulate_numpy(close, open_, high, low, has_ohlc, entries, exits, init_cash, size, fees, slippage,
+                    stop_loss, take_profit):
+    """NumPy-Fallback: Schleife über Trades statt Bars"""
+    n = len(close)
+    entry_candidates = np.flatnonzero(entries & (close > 0))
+    # Exit-Signale auf Bars ohne Schlusskurs (NaN) werden ignoriert
+    exit_candidates = np.flatnonzero(exits & ~np.isnan(close))
+    equity = np.full(n, float(init_cash))
+    position = np.zeros(n)
+    records = []
+    cash = float(init_cash)
+    earliest = 0
+
+    while True:
+        k = np.searchsorted(entry_candidates, earliest)
+        if k >= len(entry_candidates):
+            break
+        entry = int(entry_candidates[k])
+        entry_price = close[entry] * (1.0 + slippage)
+        shares = cash * size / (entry_price * (1.0 + fees))
+        entry_fees = shares * entry_price * fees
+        cash -= shares * entry_price + entry_fees
+        stop_price = entry_price * (1.0 - stop_loss) if stop_loss > 0 else -np.inf
+        target_price = entry_price * (1.0 + take_profit) if take_profit > 0 else np.inf
+
+        j = np.searchsorted(exit_candidates, entry + 1)
+        signal_bar = int(exit_candidates[j]) if j < len(exit_candidates) else n
+        # Stops nur bis einschließlich Exit-Signal suchen
+        window_end = min(signal_bar + 1, n)
+        exit_bar = _first_stop(entry + 1, window_end, has_ohlc, close, high, low, stop_price, target_price)
+        if exit_bar == window_end:
+            exit_bar = signal_bar
+        if exit_bar < n:
+            exit_price, reason = _exit_checks(exit_bar, close[exit_bar], has_ohlc, open_, high, low,
+                                              stop_price, target_price)
+            if reason == EXIT_OPEN:
+                exit_price, reason = close[exit_bar], EXIT_SIGNAL
+        else:
+            exit_price, reason = np.nan, EXIT_OPEN
+
+        last = exit_bar if exit_bar < n else n
+        held = slice(entry, last)
+        position[held] = shares
+        prices = pd.Series(close[held]).ffill().to_numpy()
+        equity[held] = cash + shares * prices
+
+        if reason == EXIT_OPEN:
+            valid = close[~np.isnan(close)]
+            mark = valid[-1] if len(valid) else entry_price
+            proceeds = shares * mark
+            records.append((entry, n - 1, entry_price, mark, shares, entry_fees,
+                            proceeds - shares * entry_price - entry_fees, 0.0, EXIT_OPEN))
+            break
+
+        fill = exit_price * (1.0 - slippage)
+        value = shares * fill
+        exit_fees = value * fees
+        cash += value - exit_fees
+        pnl = value - exit_fees - shares * entry_price - entry_fees
+        records.append((entry, exit_bar, entry_price, fill, shares, entry_fees + exit_fees, pnl, 0.0, reason))
+        equity[exit_bar:] = cash
+        earliest = exit_bar + 1
+
+    trades = np.array(records, dtype=TRADE_DTYPE)
+    if len(trades):
+        cost = trades['size'] * trades['entry_price']
+        trades['return'] = np.where(cost > 0, trades['pnl'] / cost, 0.0)
+    return equity, position, trades
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True, inline='always')
+    def _simulate_core_nb(close, open_, high, low, has_ohlc, entries, exits, init_cash, size, fees, slippage,
+                          stop_loss, take_profit, equity, position,
+                          t_entry, t_exit, t_entry_price, t_exit_price, t_size, t_fees, t_pnl, t_reason):
+        """Event-Schleife einer Spalte; schreibt Equity/Position und Trade-Felder, gibt Anzahl Trades zurück"""
+        n = len(close)
+        cash = init_cash
+        shares = 0.0
+        entry_bar = -1
+        entry_price = 0.0
+        entry_fees = 0.0
+        stop_price = -np.inf
+        target_price = np.inf
+        last_exit = -1
+        last_price = np.nan
+        n_trades = 0
+
+        for i in range(n):
+            c = close[i]
+            if not np.isnan(c):
+                last_price = c
+
+            if shares > 0.0 and i > entry_bar:
+                exit_price = np.nan
+                reason = -1
+                if has_ohlc:
+                    if low[i] <= stop_price:
+                        exit_price = min(open_[i], stop_price)
+                        reason = EXIT_STOP_LOSS
+                    elif high[i] >= target_price:
+                        exit_price = max(open_[i], target_price)
+                        reason = EXIT_TAKE_PROFIT
+                elif c <= stop_price:
+                    exit_price = c
+                    reason = EXIT_STOP_LOSS
+                elif c >= target_price:
+                    exit_price = c
+                    reason = EXIT_TAKE_PROFIT
+                if reason < 0 and exits[i] and not np.isnan(c):
+                    exit_price = c
+                    reason = EXIT_SIGNAL
+
+                if reason >= 0:
+                    fill = exit_price * (1.0 - slippage)
+                    value = shares * fill
+                    exit_fees = value * fees
+                    cash += value - exit_fees
+                    t_exit[n_trades] = i
+                    t_exit_price[n_trades] = fill
+                    t_fees[n_trades] = entry_fees + exit_fees
+                    t_pnl[n_trades] = value - exit_fees - shares * entry_price - entry_fees
+                    t_reason[n_trades] = reason
+                    n_trades += 1
+                    shares = 0.0
+                    last_exit = i
+
+            if shares == 0.0 and entries[i] and i > last_exit and c > 0.0:
+                entry_price = c * (1.0 + slippage)
+                shares = cash * size / (entry_price * (1.0 + fees))
+                entry_fees = shares * entry_price * fees
+                cash -= shares * entry_price + entry_fees
+                entry_bar = i
+                stop_price = entry_price * (1.0 - stop_loss) if stop_loss > 0.0 else -np.inf
+                target_price = entry_price * (1.0 + take_profit) if take_profit > 0.0 else np.inf
+                t_entry[n_trades] = i
+                t_entry_price[n_trades] = entry_price
+                t_size[n_trades] = shares
+
+            position[i] = shares
+            equity[i] = cash + shares * last_price if shares > 0.0 else cash
+
+        # Offene Position zum letzten Kurs bewerten
+        if shares > 0.0:
+            proceeds = shares * last_price
+            t_exit[n_trades] = n - 1
+            t_exit_price[n_trades] = last_price
+            t_fees[n_trades] = entry_fees
+            t_pnl[n_trades] = proceeds - shares * entry_price - entry_fees
+            t_reason[n_trades] = EXIT_OPEN
+            n_trades += 1
+        return n_trades
+
+    @njit(cache=True, nogil=True)
+    def _simulate_nb(close, open_, high, low, has_ohlc, entries, exits, init_cash, size, fees, slippage,
+                     stop_loss, take_profit, max_trades):
+        n = len(close)
+        equity = np.empty(n, dtype=np.float64)
+        position = np.empty(n, dtype=np.float64)
+        t_entry = np.empty(max_trades, dtype=np.int64)
+        t_exit = np.empty(max_trades, dtype=np.int64)
+        t_entry_price = np.empty(max_trades, dtype=np.float64)
+        t_exit_price = np.empty(max_trades, dtype=np.float64)
+        t_size = np.empty(max_trades, dtype=np.float64)
+        t_fees = np.empty(max_trades, dtype=np.float64)
+        t_pnl = np.empty(max_trades, dtype=np.float64)
+        t_reason = np.empty(max_trades, dtype=np.int8)
+        n_trades = _simulate_core_nb(close, open_, high, low, has_ohlc, entries, exits, init_cash, size, fees,
+                                     slippage, stop_loss, take_profit, equity, position,
+                                     t_entry, t_exit, t_entry_price, t_exit_price, t_size, t_fees, t_pnl, t_reason)
+        return (equity, position, n_trades, t_entry, t_exit, t_entry_price, t_exit_price,
+                t_size, t_fees, t_pnl, t_reason)
+
+
+    @njit(cache=True, nogil=True, parallel=True)
+    def _simulate_batch_nb(close, open_, high, low, has_ohlc, entries, exits, init_cash, size, fees, slippage,
+                           stop_loss, take_profit, trade_offsets):
+        """
+        Alle Spalten in einer kompilierten Schleife
+
+        Kurse und Signale liegen als (Spalten × Bars) vor, d.h. jede Spalte ist zusammenhängend im
+        Speicher; eine einzelne Kurs- bzw. Signal-Zeile gilt für alle Spalten. Jede Spalte schreibt
+        ihre Trades in einen eigenen Abschnitt [trade_offsets[j], trade_offsets[j + 1]).
+        """
+        k = len(init_cash)
+        n = close.shape[1]
+        equity = np.empty((k, n), dtype=np.float64)
+        position = np.empty((k, n), dtype=np.float64)
+        max_trades = trade_offsets[k]
+        t_entry = np.empty(max_trades, dtype=np.int64)
+        t_exit = np.empty(max_trades, dtype=np.int64)
+        t_entry_price = np.empty(max_trades, dtype=np.float64)
+        t_exit_price = np.empty(max_trades, dtype=np.float64)
+        t_size = np.empty(max_trades, dtype=np.float64)
+        t_fees = np.empty(max_trades, dtype=np.float64)
+        t_pnl = np.empty(max_trades, dtype=np.float64)
+        t_reason = np.empty(max_trades, dtype=np.int8)
+        n_trades = np.zeros(k, dtype=np.int64)
+
+        price_step = 1 if close.shape[0] > 1 else 0
+        signal_step = 1 if entries.shape[0] > 1 else 0
+        for col in prange(k):
+            p = col * price_step
+            q = col * signal_step
+            a = trade_offsets[col]
+            b = trade_offsets[col + 1]
+            n_trades[col] = _simulate_core_nb(
+                close[p], open_[p], high[p], low[p], has_ohlc, entries[q], exits[q],
+                init_cash[col], size[col], fees[col], slippage[col], stop_loss[col], take_profit[col],
+                equity[col], position[col], t_entry[a:b], t_exit[a:b], t_entry_price[a:b], t_exit_price[a:b],
+                t_size[a:b], t_fees[a:b], t_pnl[a:b], t_reason[a:b])
+        return (equity, position, n_trades, t_entry, t_exit, t_entry_price, t_exit_price,
+                t_size, t_fees, t_pnl, t_reason)
+
+
+def _trade_records(n_trades, t_entry, t_exit, t_entry_price, t_exit_price, t_size, t_fees, t_pnl, t_reason):
+    """Kernel-Felder zu strukturierten Trade-Records"""
+    trades = np.empty(n_trades, dtype=TRADE_DTYPE)
+    trades['entry_idx'] = t_entry[:n_trades]
+    trades['exit_idx'] = t_exit[:n_trades]
+    trades['entry_price'] = t_entry_price[:n_trades]
+    trades['exit_price'] = t_exit_price[:n_trades]
+    trades['size'] = t_size[:n_trades]
+    trades['fees'] = t_fees[:n_trades]
+    trades['pnl'] = t_pnl[:n_trades]
+    trades['exit_reason'] = t_reason[:n_trades]
+    cost = trades['size'] * trades['entry_price']
+    trades['return'] = np.where(cost > 0, trades['pnl'] / np.where(cost > 0, cost, 1.0), 0.0)
+    return trades
+
+
+def simulate_portfolio(data, entries, exits=None, init_cash=10000.0, size=1.0, fees=0.001, slippage=0.0,
+                       stop_loss=0.0, take_profit=0.0):
+    """
+    Long-Only Backtest über Entries/Exits
+
+    Ausführung zum Close des Signal-Bars; Stops ab dem Folge-Bar (High/Low, Gap über Open),
+    Stop Loss hat Vorrang vor Take Profit im selben Bar. Nach einem Exit frühestens im
+    nächsten Bar ein neuer Entry.
+
+    Args:
+        data: DataFrame mit 'close' (optional 'open', 'high', 'low')
+        entries, exits: Bool-Arrays/Series oder gepackte Bits (bzw. SparseSignals als entries, exits=None)
+        init_cash: Startkapital
+        size: Anteil des Kapitals pro Entry (0..1)
+        fees: Proportionale Gebühren pro Order (0.001 = 0.1%)
+        slippage: Preisaufschlag beim Kauf / -abschlag beim Verkauf
+        stop_loss, take_profit: Abstand zum Entry-Preis (0 = aus)
+
+    Returns:
+        SimulationResult
+    """
+    n = len(data)
+    if isinstance(entries, SparseSignals):
+        entries, exits = entries.to_mask('entries'), entries.to_mask('exits')
+    entry_mask = _as_mask(entries, n)
+    exit_mask = _as_mask(exits, n)
+
+    close = _price_array(data, 'close')
+    if close is None:
+        raise ValueError("Backtest benötigt eine 'close'-Spalte")
+    open_, high, low = (_price_array(data, column) for column in ('open', 'high', 'low'))
+    has_ohlc = open_ is not None and high is not None and low is not None
+    if not has_ohlc:
+        open_ = high = low = close
+
+    args = (float(init_cash), float(size), float(fees), float(slippage), float(stop_loss), float(take_profit))
+    if NUMBA_AVAILABLE:
+        max_trades = int(np.count_nonzero(entry_mask)) + 1
+        equity, position, n_trades, *fields = _simulate_nb(close, open_, high, low, has_ohlc, entry_mask, exit_mask,
+                                                           *args, max_trades)
+        trades = _trade_records(n_trades, *fields)
+    else:
+        equity, position, trades = _simulate_numpy(close, open_, high, low, has_ohlc, entry_mask, exit_mask, *args)
+    return SimulationResult(equity, position, trades, init_cash, data.index)
+
+
+def _align_frames(frames):
+    """Dict Symbol → DataFrame auf einen gemeinsamen Index ausrichten (Lücken = NaN)"""
+    index = frames[next(iter(frames))].index
+    for frame in frames.values():
+        if not frame.index.equals(index):
+            index = index.union(frame.index)
+    return index, {symbol: frame.reindex(index) if not frame.index.equals(index) else frame
+                   for symbol, frame in frames.items()}
+
+
+def _price_rows(frames, column):
+    """Kurs-Spalte aller Frames als (Spalten × Bars), jede Zeile zusammenhängend"""
+    if not all(column in frame.columns for frame in frames):
+        return None
+    rows = np.empty((len(frames), len(frames[0])), dtype=np.float64)
+    for j, frame in enumerate(frames):
+        rows[j] = frame[column].to_numpy(dtype=np.float64)
+    return rows
+
+
+def _signal_row(signals, kind, n_bars, own_index=None, index=None):
+    """Ein Signal (Bool, gepackte Bits, SparseSignals) als Bool-Zeile auf dem gemeinsamen Index"""
+    if isinstance(signals, SparseSignals):
+        row = np.zeros(signals.n_bars, dtype=bool)
+        row[signals.entries if kind == 'entries' else signals.exits] = True
+    else:
+        row = _as_mask(signals, n_bars if own_index is None else len(own_index))
+    if own_index is not None and not own_index.equals(index):
+        row = pd.Series(row, index=own_index).reindex(index, fill_value=False).to_numpy()
+    return row
+
+
+def _signal_rows(signals, kind, n_bars, index, frame_indexes=None):
+    """
+    Signale als (Spalten × Bars) Bool-Matrix
+
+    Akzeptiert 2D (Bars × Spalten) Arrays/DataFrames, 1D-Signale sowie Listen oder Dicts
+    von 1D-Signalen (Dict-Schlüssel = Symbole bzw. Spalten-Labels).
+
+    Returns:
+        (Matrix, Labels oder None)
+    """
+    if isinstance(signals, pd.DataFrame):
+        frame = signals if len(signals) == n_bars else signals.reindex(index, fill_value=False)
+        return np.ascontiguousarray(frame.to_numpy(dtype=bool).T), signals.columns
+
+    if isinstance(signals, dict):
+        labels = list(signals)
+        rows = [_signal_row(signals[label], kind, n_bars,
+                            frame_indexes.get(label) if frame_indexes else None, index) for label in labels]
+        return np.ascontiguousarray(np.vstack(rows)), labels
+
+    if isinstance(signals, (list, tuple)):
+        rows = [_signal_row(signal, kind, n_bars) for signal in signals]
+        return np.ascontiguousarray(np.vstack(rows)), None
+
+    if isinstance(signals, SparseSignals) or np.ndim(signals) == 1:
+        return _signal_row(signals, kind, n_bars)[None, :], None
+
+    matrix = np.asarray(signals, dtype=bool)
+    if matrix.shape[0] != n_bars:
+        raise ValueError(f"Signal-Matrix {matrix.shape} passt nicht zu {n_bars} Bars")
+    return np.ascontiguousarray(matrix.T), None
+
+
+def _broadcast_columns(name, n_rows, k):
+    if n_rows not in (1, k):
+        raise ValueError(f"{name}: {n_rows} Spalten passen nicht zu {k} Spalten")
+
+
+def _parameter_columns(parameters, k):
+    """Pro Spalte variierende Parameter als Spalten-Labels (MultiIndex)"""
+    varying = {name: values for name, values in parameters.items() if len(np.unique(values)) > 1}
+    if not varying:
+        return None
+    if len(varying) == 1:
+        name, values = next(iter(varying.items()))
+        return pd.Index(values, name=name)
+    return pd.MultiIndex.from_arrays(list(varying.values()), names=list(varying))
+
+
+def simulate_batch(data, entries, exits=None, init_cash=10000.0, size=1.0, fees=0.001, slippage=0.0,
+                   stop_loss=0.0, take_profit=0.0, columns=None):
+    """
+    Viele Backtests auf einmal: eine Spalte pro Parameter-Kombination oder Symbol
+
+    Gleiche Semantik wie simulate_portfolio, aber alle Spalten in einer kompilierten Schleife.
+    Kurse, Signale und Parameter werden auf die Spaltenzahl gebroadcastet: ein DataFrame
+    (bzw. eine Signal-Zeile, ein Skalar) gilt für alle Spalten.
+
+    Args:
+        data: DataFrame (gleiche Kurse für alle Spalten) oder Dict Symbol → DataFrame
+              (eine Spalte pro Symbol, auf gemeinsamen Index ausgerichtet)
+        entries, exits: 2D Bool (Bars × Spalten) / DataFrame, 1D-Signal, Liste oder Dict von
+                        1D-Signalen (auch SparseSignals; dann exits=None)
+        init_cash, size, fees, slippage, stop_loss, take_profit: Skalar oder ein Wert pro Spalte
+        columns: Spalten-Labels (Standard: Symbole / Signal-Spalten / variierende Parameter)
+
+    Returns:
+        BatchSimulationResult
+    """
+    if isinstance(data, dict):
+        symbols = list(data)
+        index, frames = _align_frames(data)
+        frame_indexes = {symbol: data[symbol].index for symbol in symbols}
+        frames = [frames[symbol] for symbol in symbols]
+    else:
+        symbols = None
+        index, frames, frame_indexes = data.index, [data], None
+    n = len(index)
+
+    close = _price_rows(frames, 'close')
+    if close is None:
+        raise ValueError("Backtest benötigt eine 'close'-Spalte")
+    open_, high, low = (_price_rows(frames, column) for column in ('open', 'high', 'low'))
+    has_ohlc = open_ is not None and high is not None and low is not None
+    if not has_ohlc:
+        open_ = high = low = close
+
+    if exits is None:
+        exits = entries
+    entry_rows, signal_labels = _signal_rows(entries, 'entries', n, index, frame_indexes)
+    exit_rows, _ = _signal_rows(exits, 'exits', n, index, frame_indexes)
+
+    values = {'init_cash': init_cash, 'size': size, 'fees': fees, 'slippage': slippage,
+              'stop_loss': stop_loss, 'take_profit': take_profit}
+    parameters = {name: np.asarray(value, dtype=np.float64).ravel() for name, value in values.items()}
+    k = max([len(close), len(entry_rows), len(exit_rows)] + [len(v) for v in parameters.values()])
+    _broadcast_columns('Kurse', len(close), k)
+    for name, rows in (('entries', entry_rows), ('exits', exit_rows)):
+        _broadcast_columns(name, len(rows), k)
+    for name, value in parameters.items():
+        _broadcast_columns(name, len(value), k)
+        parameters[name] = np.ascontiguousarray(np.broadcast_to(value, (k,)))
+    # Entries und Exits teilen sich den Spalten-Zugriff im Kernel
+    if len(entry_rows) != len(exit_rows):
+        entry_rows = np.ascontiguousarray(np.broadcast_to(entry_rows, (k, n)))
+        exit_rows = np.ascontiguousarray(np.broadcast_to(exit_rows, (k, n)))
+
+    if columns is None:
+        columns = symbols if symbols is not None and len(symbols) == k else signal_labels
+        if columns is None or len(columns) != k:
+            columns = _parameter_columns(parameters, k)
+
+    args = tuple(parameters[name] for name in BATCH_PARAMETERS)
+    if NUMBA_AVAILABLE:
+        # Maximal ein Trade pro Entry-Signal (+ offene Position) je Spalte
+        signal_col = np.arange(k) if len(entry_rows) == k else np.zeros(k, dtype=np.int64)
+        capacity = np.count_nonzero(entry_rows, axis=1)[signal_col] + 1
+        trade_offsets = np.concatenate(([0], np.cumsum(capacity))).astype(np.int64)
+        equity, position, n_trades, *fields = _simulate_batch_nb(close, open_, high, low, has_ohlc,
+                                                                 entry_rows, exit_rows, *args, trade_offsets)
+        # Trade-Abschnitte der Spalten zusammenschieben
+        total = int(n_trades.sum())
+        starts = np.repeat(trade_offsets[:-1] - (np.cumsum(n_trades) - n_trades), n_trades)
+        selected = starts + np.arange(total)
+        records = _trade_records(total, *(field[selected] for field in fields))
+        trade_col = np.repeat(np.arange(k), n_trades)
+    else:
+        equity, position = np.empty((k, n)), np.empty((k, n))
+        parts = []
+        for col in range(k):
+            p = 0 if len(close) == 1 else col
+            q = 0 if len(entry_rows) == 1 else col
+            equity[col], position[col], col_trades = _simulate_numpy(
+                close[p], open_[p], high[p], low[p], has_ohlc, entry_rows[q], exit_rows[q],
+                *(float(value[col]) for value in args))
+            parts.append(col_trades)
+        records = np.concatenate(parts) if parts else np.empty(0, dtype=TRADE_DTYPE)
+        trade_col = np.repeat(np.arange(k), [len(part) for part in parts])
+
+    trades = np.empty(len(records), dtype=BATCH_TRADE_DTYPE)
+    trades['col'] = trade_col
+    for name in TRADE_DTYPE.names:
+        trades[name] = records[name]
+    # (Spalten × Bars) transponiert = (Bars × Spalten) in Fortran-Reihenfolge, ohne Kopie
+    return BatchSimulationResult(equity.T, position.T, trades, parameters['init_cash'], index, columns)
+
+
+def simulate_portfolio_python(data, entries, exits, init_cash=10000.0, size=1.0, fees=0.001, slippage=0.0,
+                              stop_loss=0.0, take_profit=0.0):
+    """Referenz: Bar-für-Bar in Python (nur für Tests/Benchmark)"""
+    close = data['close'].to_numpy(dtype=np.float64)
+    has_ohlc = all(column in data.columns for column in ('open', 'high', 'low'))
+    open_, high, low = ((data[column].to_numpy(dtype=np.float64) if has_ohlc else close)
+                        for column in ('open', 'high', 'low'))
+    entries = np.asarray(entries, dtype=bool)
+    exits = np.asarray(exits, dtype=bool)
+    cash, shares, last_exit, equity, pnls = float(init_cash), 0.0, -1, [], []
+    entry_bar, entry_price, entry_fees = -1, 0.0, 0.0
+    for i, c in enumerate(close):
+        if shares > 0 and i > entry_bar:
+            stop_price = entry_price * (1 - stop_loss) if stop_loss > 0 else -np.inf
+            target_price = entry_price * (1 + take_profit) if take_profit > 0 else np.inf
+            exit_price, reason = _exit_checks(i, c, has_ohlc, open_, high, low, stop_price, target_price)
+            if reason == EXIT_OPEN and exits[i] and not np.isnan(c):
+                exit_price, reason = c, EXIT_SIGNAL
+            if reason != EXIT_OPEN:
+                value = shares * exit_price * (1 - slippage)
+                cash += value * (1 - fees)
+                pnls.append(value * (1 - fees) - shares * entry_price - entry_fees)
+                shares, last_exit = 0.0, i
+        if shares == 0 and entries[i] and i > last_exit and c > 0:
+            entry_price = c * (1 + slippage)
+            shares = cash * size / (entry_price * (1 + fees))
+            entry_fees = shares * entry_price * fees
+            cash -= shares * entry_price + entry_fees
+            entry_bar = i
+        equity.append(cash + shares * c)
+    return np.array(equity), np.array(pnls)
+
+
+def benchmark_simulation(n_bars=10_000_000, density=0.001, seed=0):
+    """Durchsatz des Simulations-Kernels (Bars pro Sekunde)"""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+    data = pd.DataFrame({'open': close, 'high': close * 1.001, 'low': close * 0.999, 'close': close})
+    entries = rng.random(n_bars) < density
+    exits = rng.random(n_bars) < density
+
+    simulate_portfolio(data.iloc[:100], entries[:100], exits[:100])  # JIT aufwärmen
+    start = time.perf_counter()
+    result = simulate_portfolio(data, entries, exits, fees=0.001, slippage=0.0005, stop_loss=0.02, take_profit=0.04)
+    seconds = time.perf_counter() - start
+    print(f"💼 Simulation (Numba: {'✅' if NUMBA_AVAILABLE else '❌'}): {n_bars:,} Bars, {len(result.trades):,} Trades "
+          f"in {seconds * 1000:.1f} ms ({n_bars / seconds / 1e6:.1f} Mio. Bars/s)")
+    return result
+
+
+def benchmark_batch(n_bars=1_000_000, n_columns=100, density=0.001, seed=0):
+    """Durchsatz der Batch-Simulation: gleiche Signale, Stop-Loss-Sweep über n_columns Spalten"""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+    data = pd.DataFrame({'open': close, 'high': close * 1.001, 'low': close * 0.999, 'close': close})
+    entries = rng.random(n_bars) < density
+    exits = rng.random(n_bars) < density
+    stop_loss = np.linspace(0.0, 0.05, n_columns)
+
+    simulate_batch(data.iloc[:100], entries[:100], exits[:100], stop_loss=stop_loss[:2])  # JIT aufwärmen
+    start = time.perf_counter()
+    result = simulate_batch(data, entries, exits, fees=0.001, stop_loss=stop_loss)
+    metrics = result.metrics()
+    seconds = time.perf_counter() - start
+    cells = n_bars * n_columns
+    print(f"💼 Batch-Simulation (Numba: {'✅' if NUMBA_AVAILABLE else '❌'}): {n_columns} Spalten × {n_bars:,} Bars, "
+          f"{len(result.trades):,} Trades inkl. Kennzahlen in {seconds * 1000:.1f} ms "
+          f"({cells / seconds / 1e6:.1f} Mio. Bars/s)")
+    return metrics
+
+
+if __name__ == "__main__":
+    benchmark_simulation()
+    benchmark_batch()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+🧵 RENDER WORKER - VectorBT Pro GUI System
+Chart-Rendering außerhalb des Tk-Main-Threads
+- Ein Hintergrund-Thread pro Worker, immer nur der neueste Auftrag zählt
+- Neuer Auftrag oder cancel() bricht laufende/wartende Aufträge ab
+- Offscreen-Figures (Agg) werden pro Ziel wiederverwendet (Achsen/Artists in-place)
+- Fertige Bitmaps (PPM) werden per root.after an Tk übergeben
+- Main Thread zeigt nur noch das Bild an
+"""
+
+import threading
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from chart_manager import FigureState
+
+
+class RenderCancelled(Exception):
+    """Auftrag wurde durch einen neueren ersetzt oder abgebrochen"""
+
+
+class RenderJob:
+    """
+    🎫 RENDER-AUFTRAG
+    Abbruch-Flag, das der Auftrag zwischen seinen Schritten prüft
+    """
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def check(self):
+        """RenderCancelled auslösen, falls abgebrochen"""
+        if self._cancelled.is_set():
+            raise RenderCancelled(f"Render-Auftrag {self.job_id} abgebrochen")
+
+
+def rgba_to_ppm(rgba):
+    """RGBA-Puffer (Höhe, Breite, 4) als binäres PPM (von tk.PhotoImage lesbar)"""
+    height, width = rgba.shape[:2]
+    header = f"P6 {width} {height} 255\n".encode('ascii')
+    return header + np.ascontiguousarray(rgba[:, :, :3]).tobytes()
+
+
+class OffscreenFigure(FigureState):
+    """
+    🖨️ OFFSCREEN-FIGURE
+    Agg-Figure mit gleichem Zustand wie ein ChartPanel (Layout, Slots, Artists)
+    """
+
+    def __init__(self, facecolor='#2b2b2b'):
+        super().__init__(Figure())
+        self.figure.patch.set_facecolor(facecolor)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.size = None
+
+    def resize(self, width, height, dpi=100):
+        """Figure auf Pixel-Größe bringen (Größenänderung → Layout neu aufbauen)"""
+        size = (int(width), int(height), dpi)
+        if size == self.size:
+            return
+        self.figure.set_dpi(dpi)
+        self.figure.set_size_inches(width / dpi, height / dpi)
+        self.size = size
+        self.layout_key = None
+
+    def rasterize(self):
+        """Figure zeichnen und als PPM zurückgeben"""
+        self.canvas.draw()
+        return rgba_to_ppm(np.asarray(self.canvas.buffer_rgba()))
+
+
+class RenderWorker:
+    """
+    🧵 RENDER-WORKER
+    Führt Render-Aufträge im Hintergrund aus; nur der neueste wird ausgeliefert
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._condition = threading.Condition()
+        self._pending = None
+        self._current = None
+        self._next_id = 0
+        self._thread = None
+        self.offscreen = {}
+        self.completed = 0
+        self.cancelled = 0
+
+    def submit(self, task, on_done, on_error=None):
+        """
+        Auftrag einreihen (ersetzt und bricht alle vorherigen ab)
+
+        Args:
+            task: Funktion task(job, worker) → Ergebnis (läuft im Worker-Thread)
+            on_done: Callback on_done(Ergebnis) im Tk-Main-Thread
+            on_error: Callback on_error(Exception) im Tk-Main-Thread
+
+        Returns:
+            RenderJob
+        """
+        with self._condition:
+            self._cancel_locked()
+            self._next_id += 1
+            job = RenderJob(self._next_id)
+            self._pending = (job, task, on_done, on_error)
+            self._condition.notify()
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return job
+
+    def cancel(self):
+        """Laufenden und wartenden Auftrag abbrechen"""
+        with self._condition:
+            self._cancel_locked()
+
+    def _cancel_locked(self):
+        if self._pending is not None:
+            self._pending[0].cancel()
+            self._pending = None
+            self.cancelled += 1
+        if self._current is not None and not self._current.cancelled:
+            self._current.cancel()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                job, task, on_done, on_error = self._pending
+                self._pending = None
+                self._current = job
+
+            try:
+                result = task(job, self)
+                job.check()
+                self.root.after(0, lambda: self._deliver(job, on_done, result))
+            except RenderCancelled:
+                self.cancelled += 1
+            except Exception as e:
+                print(f"❌ Render-Fehler: {e}")
+                if on_error is not None and not job.cancelled:
+                    self.root.after(0, lambda error=e: on_error(error))
+            finally:
+                with self._condition:
+                    self._current = None
+
+    def _deliver(self, job, on_done, result):
+        # Zwischen Fertigstellung und Anzeige abgebrochen → verwerfen
+        if job.cancelled:
+            return
+        self.completed += 1
+        on_done(result)
+
+    # === OFFSCREEN-RENDERING (nur im Worker-Thread aufrufen) ===
+
+    def render(self, name, width, height, draw, job, dpi=100):
+        """
+        Figure offscreen zeichnen und rastern
+
+        Args:
+            name: Ziel-Name (eine wiederverwendete Offscreen-Figure pro Ziel)
+            width, height: Pixel-Größe
+            draw: Funktion draw(OffscreenFigure, job) – baut/aktualisiert die Artists
+
+        Returns:
+            PPM-Bytes
+        """
+        figure = self.offscreen.get(name)
+        if figure is None:
+            figure = OffscreenFigure()
+            self.offscreen[name] = figure
+
+        figure.resize(max(int(width), 1), max(int(height), 1), dpi)
+        job.check()
+        draw(figure, job)
+        job.check()
+        return figure.rasterize()
+
+    def get_stats(self):
+        """Worker-Statistiken"""
+        return {'completed': self.completed, 'cancelled': self.cancelled, 'offscreen_figures': len(self.offscreen)}
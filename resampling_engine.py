@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+🕐 RESAMPLING ENGINE - VectorBT Pro GUI System
+Session- und kalenderbasiertes Resampling
+- Börsen-Kalender mit Handelszeiten, Feiertagen und Zeitzonen
+- Bins pro Handels-Session statt reiner Kalender-Bins (keine leeren Wochenend-Bins)
+- Bin-Zuordnung wird einmal pro (Index, Kalender, Timeframe) berechnet und gecacht
+- OHLCV-Aggregation direkt über Gruppen-Offsets (reduceat) - kein erneutes Gruppieren
+- Bin-Labels = Periodenbeginn: Wochen-Bins tragen den Montag (pandas 'W': Sonntag als
+  Periodenende), Monats-Bins den Monatsersten, Session-Bins den ersten Session-Tag
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+NS_PER_DAY = 86_400_000_000_000
+NS_PER_MINUTE = 60_000_000_000
+
+
+def _easter_sunday(year):
+    """Ostersonntag (Gregorianischer Kalender, Gauß/Meeus)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year, month, weekday, n):
+    """n-ter Wochentag im Monat (n=-1: letzter)"""
+    if n > 0:
+        first = date(year, month, 1)
+        offset = (weekday - first.weekday()) % 7
+        return first + timedelta(days=offset + 7 * (n - 1))
+
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _parse_time_ns(value):
+    """'HH:MM' in Nanosekunden seit Mitternacht ('24:00' erlaubt)"""
+    hours, minutes = value.split(':')
+    return (int(hours) * 60 + int(minutes)) * NS_PER_MINUTE
+
+
+class SessionCalendar:
+    """
+    📅 BÖRSEN-KALENDER
+    Handelszeiten, Handelstage, Feiertage und Zeitzone einer Börse
+
+    Feiertags-Regeln:
+        ('fixed', monat, tag)             - fester Termin (Wochenende → Freitag/Montag bei observed=True)
+        ('easter', offset_tage)           - relativ zu Ostersonntag
+        ('nth_weekday', monat, wochentag, n) - z.B. 3. Montag im Januar (n=-1: letzter)
+    """
+
+    def __init__(self, name, timezone='UTC', open_time='00:00', close_time='24:00',
+                 weekdays=(0, 1, 2, 3, 4), holiday_rules=None, holidays=None, observed=False):
+        self.name = name
+        self.timezone = timezone
+        self.open_time = open_time
+        self.close_time = close_time
+        self.weekdays = tuple(weekdays)
+        self.holiday_rules = list(holiday_rules or [])
+        self.holidays = {pd.Timestamp(d).date() for d in (holidays or [])}
+        self.observed = observed
+
+        self.open_ns = _parse_time_ns(open_time)
+        self.close_ns = _parse_time_ns(close_time)
+        # Session über Mitternacht (z.B. CME Globex 17:00 - 16:00)
+        self.overnight = self.close_ns <= self.open_ns
+
+    @property
+    def is_continuous(self):
+        """24/7-Handel ohne Session-Grenzen"""
+        return (
+            not self.overnight and self.open_ns == 0 and self.close_ns == NS_PER_DAY
+            and len(self.weekdays) == 7 and not self.holiday_rules and not self.holidays
+        )
+
+    def holidays_for_year(self, year):
+        """Alle Feiertage eines Jahres"""
+        days = set(d for d in self.holidays if d.year == year)
+
+        for rule in self.holiday_rules:
+            kind = rule[0]
+            if kind == 'fixed':
+                day = date(year, rule[1], rule[2])
+                if self.observed:
+                    if day.weekday() == 5:
+                        day -= timedelta(days=1)
+                    elif day.weekday() == 6:
+                        day += timedelta(days=1)
+            elif kind == 'easter':
+                day = _easter_sunday(year) + timedelta(days=rule[1])
+            elif kind == 'nth_weekday':
+                day = _nth_weekday(year, rule[1], rule[2], rule[3])
+            else:
+                raise ValueError(f"Unbekannte Feiertags-Regel: {rule}")
+            days.add(day)
+
+        return days
+
+    def holiday_days_ns(self, first_year, last_year):
+        """Feiertage als Tages-Nanosekunden (lokale Mitternacht)"""
+        days = set()
+        for year in range(first_year, last_year + 1):
+            days |= self.holidays_for_year(year)
+
+        if not days:
+            return np.empty(0, dtype=np.int64)
+
+        return np.array([pd.Timestamp(d).value for d in sorted(days)], dtype=np.int64)
+
+    def cache_key(self):
+        """Schlüssel für den Bin-Index-Cache"""
+        return (
+            self.name, self.timezone, self.open_ns, self.close_ns, self.weekdays,
+            tuple(self.holiday_rules), tuple(sorted(self.holidays)), self.observed
+        )
+
+    def __repr__(self):
+        return f"SessionCalendar({self.name!r}, {self.timezone}, {self.open_time}-{self.close_time})"
+
+
+_NYSE_HOLIDAYS = [
+    ('fixed', 1, 1),
+    ('nth_weekday', 1, 0, 3),    # Martin Luther King Jr. Day
+    ('nth_weekday', 2, 0, 3),    # Presidents' Day
+    ('easter', -2),              # Good Friday
+    ('nth_weekday', 5, 0, -1),   # Memorial Day
+    ('fixed', 6, 19),            # Juneteenth
+    ('fixed', 7, 4),
+    ('nth_weekday', 9, 0, 1),    # Labor Day
+    ('nth_weekday', 11, 3, 4),   # Thanksgiving
+    ('fixed', 12, 25),
+]
+
+_XETRA_HOLIDAYS = [
+    ('fixed', 1, 1),
+    ('easter', -2),              # Karfreitag
+    ('easter', 1),               # Ostermontag
+    ('fixed', 5, 1),
+    ('fixed', 12, 24),
+    ('fixed', 12, 25),
+    ('fixed', 12, 26),
+    ('fixed', 12, 31),
+]
+
+_LSE_HOLIDAYS = [
+    ('fixed', 1, 1),
+    ('easter', -2),
+    ('easter', 1),
+    ('nth_weekday', 5, 0, 1),    # Early May Bank Holiday
+    ('nth_weekday', 5, 0, -1),   # Spring Bank Holiday
+    ('nth_weekday', 8, 0, -1),   # Summer Bank Holiday
+    ('fixed', 12, 25),
+    ('fixed', 12, 26),
+]
+
+# Verfügbare Kalender (Name → SessionCalendar)
+CALENDARS = {
+    '24/7': SessionCalendar('24/7', 'UTC', '00:00', '24:00', weekdays=range(7)),
+    'NYSE': SessionCalendar('NYSE', 'America/New_York', '09:30', '16:00',
+                            holiday_rules=_NYSE_HOLIDAYS, observed=True),
+    'XETRA': SessionCalendar('XETRA', 'Europe/Berlin', '09:00', '17:30',
+                             holiday_rules=_XETRA_HOLIDAYS),
+    'LSE': SessionCalendar('LSE', 'Europe/London', '08:00', '16:30',
+                           holiday_rules=_LSE_HOLIDAYS, observed=True),
+    'CME Globex': SessionCalendar('CME Globex', 'America/Chicago', '17:00', '16:00',
+                                  holiday_rules=[('fixed', 1, 1), ('fixed', 12, 25)], observed=True),
+    'Forex': SessionCalendar('Forex', 'America/New_York', '17:00', '17:00'),
+}
+
+
+def get_calendar(calendar):
+    """Kalender per Name oder Objekt auflösen"""
+    if isinstance(calendar, SessionCalendar):
+        return calendar
+    if calendar is None:
+        return CALENDARS['24/7']
+    if calendar not in CALENDARS:
+        raise ValueError(f"Unbekannter Kalender: {calendar} (verfügbar: {', '.join(CALENDARS)})")
+    return CALENDARS[calendar]
+
+
+def parse_timeframe(timeframe):
+    """Timeframe-String in Pandas-Offset umwandeln ('1H' → '1h')"""
+    try:
+        return to_offset(timeframe)
+    except ValueError:
+        return to_offset(timeframe.replace('H', 'h').replace('T', 'min'))
+
+
+class BinIndex:
+    """
+    🗂️ VORBERECHNETE BIN-ZUORDNUNG
+    Gruppen-Offsets für einen Index - wird von allen Spalten wiederverwendet
+
+    positions: Zeilen innerhalb der Sessions (None = alle Zeilen)
+    starts:    Start-Offset jeder Gruppe (bezogen auf positions)
+    labels:    Bin-Labels als DatetimeIndex
+    """
+
+    __slots__ = ('positions', 'starts', 'ends', 'labels', 'n_rows')
+
+    def __init__(self, positions, starts, labels, n_rows):
+        self.positions = positions
+        self.starts = starts
+        self.n_rows = n_rows
+        kept = n_rows if positions is None else len(positions)
+        self.ends = np.append(starts[1:], kept).astype(np.int64)
+        self.labels = labels
+
+    def __len__(self):
+        return len(self.starts)
+
+    def take(self, values):
+        """Werte auf Session-Zeilen reduzieren"""
+        values = np.asarray(values)
+        return values if self.positions is None else values[self.positions]
+
+    def first(self, values):
+        return self.take(values)[self.starts]
+
+    def last(self, values):
+        return self.take(values)[self.ends - 1]
+
+    def max(self, values):
+        return np.fmax.reduceat(self.take(values), self.starts)
+
+    def min(self, values):
+        return np.fmin.reduceat(self.take(values), self.starts)
+
+    def sum(self, values):
+        values = self.take(values)
+        if np.issubdtype(values.dtype, np.integer):
+            return np.add.reduceat(values, self.starts, dtype=np.int64)
+        return np.add.reduceat(np.nan_to_num(values), self.starts, dtype=np.float64)
+
+    def aggregate(self, values, how):
+        """Eine Spalte aggregieren ('first', 'last', 'max', 'min', 'sum')"""
+        if len(self.starts) == 0:
+            return np.empty(0, dtype=np.asarray(values).dtype)
+        return getattr(self, how)(values)
+
+
+def as_ns(index):
+    """DatetimeIndex auf Nanosekunden-Auflösung bringen"""
+    return index.as_unit('ns') if hasattr(index, 'as_unit') else index
+
+
+def buffer_digest(values):
+    """Digest über den gesamten Puffer eines Arrays (ohne Kopie bei zusammenhängendem Speicher)"""
+    values = np.ascontiguousarray(values)
+    return hashlib.blake2b(memoryview(values).cast('B'), digest_size=16).digest()
+
+
+def index_fingerprint(index):
+    """Fingerabdruck eines DatetimeIndex (Länge, Ränder, Digest aller Zeitstempel)"""
+    # Rohwerte + Einheit statt Umrechnung auf ns (as_unit kopiert den ganzen Index)
+    values = index.asi8
+    unit = getattr(index, 'unit', 'ns')
+    if len(values) == 0:
+        return (0, unit, str(index.tz))
+    return (len(values), unit, int(values[0]), int(values[-1]), buffer_digest(values), str(index.tz))
+
+
+def build_bin_index(index, calendar, timeframe):
+    """
+    Bin-Zuordnung für einen sortierten DatetimeIndex berechnen
+
+    Args:
+        index: DatetimeIndex (naive Zeitstempel gelten als Börsen-Lokalzeit)
+        calendar: SessionCalendar
+        timeframe: Ziel-Timeframe ('5min', '1H', '1D', '1W', ...)
+    """
+    offset = parse_timeframe(timeframe)
+    n_rows = len(index)
+
+    # Lokale Wandzeit in Nanosekunden
+    if index.tz is not None:
+        local_ns = as_ns(index.tz_convert(calendar.timezone).tz_localize(None)).asi8
+    else:
+        local_ns = as_ns(index).asi8
+    local_ns = local_ns.astype(np.int64)
+
+    day_ns = local_ns - np.mod(local_ns, NS_PER_DAY)
+    time_of_day = local_ns - day_ns
+
+    # Session-Zugehörigkeit
+    if calendar.overnight:
+        after_open = time_of_day >= calendar.open_ns
+        in_session = after_open | (time_of_day < calendar.close_ns)
+        session_day = np.where(after_open, day_ns + NS_PER_DAY, day_ns)
+        session_open = session_day - NS_PER_DAY + calendar.open_ns
+    else:
+        in_session = (time_of_day >= calendar.open_ns) & (time_of_day < calendar.close_ns)
+        session_day = day_ns
+        session_open = day_ns + calendar.open_ns
+
+    if not calendar.is_continuous:
+        # 1970-01-01 war ein Donnerstag (Wochentag 3)
+        weekday = (session_day // NS_PER_DAY + 3) % 7
+        in_session &= np.isin(weekday, calendar.weekdays)
+
+        if n_rows:
+            first_year = pd.Timestamp(int(session_day.min())).year
+            last_year = pd.Timestamp(int(session_day.max())).year
+            holiday_ns = calendar.holiday_days_ns(first_year, last_year)
+            if len(holiday_ns):
+                in_session &= ~np.isin(session_day, holiday_ns)
+
+    positions = None if in_session.all() else np.flatnonzero(in_session)
+    if positions is not None:
+        session_day = session_day[positions]
+        session_open = session_open[positions]
+        local_ns = local_ns[positions]
+
+    # Bin-Schlüssel (lokale Zeit) pro Zeile - Bins sind bei sortiertem Index zusammenhängend
+    if isinstance(offset, pd.offsets.Day):
+        # n Handels-Sessions pro Bin, Label = erster Session-Tag
+        new_session = np.r_[True, session_day[1:] != session_day[:-1]] if len(session_day) else session_day
+        bin_keys = (np.cumsum(new_session) - 1) // offset.n
+        label_source = session_day
+    elif isinstance(offset, pd.offsets.Tick) and offset.nanos < NS_PER_DAY:
+        # Intraday: Bins ab Session-Eröffnung verankert
+        step = offset.nanos
+        bin_keys = session_open + ((local_ns - session_open) // step) * step
+        label_source = bin_keys
+    else:
+        # Wochen/Monate/...: Periodenbeginn des Session-Tages
+        periods = pd.to_datetime(session_day, unit='ns').to_period(offset)
+        bin_keys = as_ns(periods.start_time).asi8.astype(np.int64)
+        label_source = bin_keys
+
+    if len(bin_keys):
+        starts = np.flatnonzero(np.r_[True, bin_keys[1:] != bin_keys[:-1]]).astype(np.int64)
+    else:
+        starts = np.empty(0, dtype=np.int64)
+
+    labels = pd.to_datetime(label_source[starts], unit='ns')
+    if index.tz is not None:
+        labels = labels.tz_localize(
+            calendar.timezone, ambiguous=False, nonexistent='shift_forward'
+        ).tz_convert(index.tz)
+    labels.name = index.name
+
+    return BinIndex(positions, starts, labels, n_rows)
+
+
+class BinIndexCache:
+    """
+    ⚡ BIN-INDEX CACHE
+    LRU-Cache für Bin-Zuordnungen pro (Index, Kalender, Timeframe)
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, index, calendar, timeframe):
+        """Bin-Index abrufen oder berechnen"""
+        calendar = get_calendar(calendar)
+        key = (index_fingerprint(index), calendar.cache_key(), str(timeframe))
+
+        with self._lock:
+            bin_index = self._entries.get(key)
+            if bin_index is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return bin_index
+
+        bin_index = build_bin_index(index, calendar, timeframe)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = bin_index
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return bin_index
+
+    def clear(self):
+        """Cache leeren"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """Cache-Statistiken"""
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Globale Instanz für alle Apps
+bin_index_cache = BinIndexCache()
+
+
+# Standard-OHLCV Aggregation
+OHLCV_AGG = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum'
+}
+
+
+def resample_ohlcv(data, timeframe, calendar='24/7', method='standard', agg=None):
+    """
+    OHLCV-Daten session-basiert resamplen
+
+    Args:
+        data: DataFrame mit DatetimeIndex
+        timeframe: Ziel-Timeframe ('5min', '1H', '1D', '1W', ...)
+        calendar: Kalender-Name aus CALENDARS oder SessionCalendar
+        method: 'standard' oder 'vwap' (zusätzliche VWAP-Spalte)
+        agg: Optionales Aggregations-Dict (Spalte → 'first'/'last'/'max'/'min'/'sum')
+    """
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+
+    bin_index = bin_index_cache.get(data.index, calendar, timeframe)
+
+    agg = agg or {col: how for col, how in OHLCV_AGG.items() if col in data.columns}
+    columns = {}
+    for col, how in agg.items():
+        if col in data.columns:
+            columns[col] = bin_index.aggregate(data[col].to_numpy(), how)
+
+    if method == 'vwap' and 'volume' in data.columns and 'close' in data.columns:
+        close = data['close'].to_numpy(dtype=np.float64)
+        volume = data['volume'].to_numpy(dtype=np.float64)
+        turnover = bin_index.sum(close * volume)
+        total_volume = bin_index.sum(volume)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            columns['vwap'] = np.where(total_volume > 0, turnover / total_volume, np.nan)
+
+    return pd.DataFrame(columns, index=bin_index.labels)
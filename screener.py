@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+🔎 SCREENER - VectorBT Pro GUI System
+Eine Strategie (App 6) über alle Symbole in historical_data
+- Symbole aus dem Datei-Katalog des Data Managers
+- Indikatoren pro Symbol über die Indikator-Engine (App 3 Konfiguration), Ergebnis-Enden im LRU-Cache
+- Symbole am letzten Bar ausgerichtet und als 2D-Spaltenblöcke gestapelt (Bars × Symbole)
+- Ein Kernel-Aufruf pro Batch: Bedingungen über alle Symbole gleichzeitig
+- Speicher begrenzt: volle Historie immer nur für ein Symbol, pro Batch nur die benötigten End-Bars
+- Rangliste der Symbole, deren Entry am letzten Bar ausgelöst hat
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from column_assembler import assemble_timeframe
+from condition_engine import unpack_signals
+from data_manager import data_manager
+from indicator_engine import ParallelIndicatorEngine
+from strategy_expression import compile_strategy
+
+DEFAULT_DIRECTORY = 'historical_data'
+DEFAULT_BATCH_SIZE = 64
+
+# Bars nach dem Lookback: Frische und Dauer des Entry-Signals
+ACTIVE_WINDOW = 32
+
+# Mindestens so viele End-Bars cachen (spätere Strategien mit längerem Lookback ohne Neuberechnung)
+CACHED_ROWS = 256
+
+RESULT_COLUMNS = ['symbol', 'timestamp', 'close', 'fresh', 'bars_active', 'stale']
+
+
+def _config_signature(indicators_config):
+    """Stabiler Schlüssel für eine Indikator-Konfiguration"""
+    return json.dumps(indicators_config, sort_keys=True, default=str)
+
+
+def single_timeframe_configs(indicators_config):
+    """Nur Single-Timeframe-Indikatoren (Symbol-Dateien liegen in einem Timeframe vor)"""
+    configs = {}
+    skipped = []
+    for config_key, config in (indicators_config or {}).items():
+        if config.get('timeframe', 'single') == 'single':
+            configs[config_key] = config
+        else:
+            skipped.append(config_key)
+    if skipped:
+        print(f"⚠️ Screener: Multi-Timeframe-Indikatoren übersprungen: {', '.join(skipped)}")
+    return configs
+
+
+class SymbolTailCache:
+    """
+    🔎 SYMBOL-CACHE
+    LRU-Cache der letzten Bars (inkl. Indikatoren) pro (Datei, Änderungszeit, Indikator-Konfiguration)
+    """
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_info, indicators_config, rows, engine=None):
+        """
+        Letzte rows Bars eines Symbols abrufen oder berechnen
+
+        Returns:
+            DataFrame (float64-Spalten) oder None falls nicht ladbar
+        """
+        key = (file_info['file_path'], file_info.get('modified_time'), _config_signature(indicators_config))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            # Ausreichend lange Enden (oder komplette kurze Historie) wiederverwenden
+            if entry is not None and (len(entry[0]) >= rows or entry[1]):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0].iloc[-rows:]
+
+        tail, complete = _load_symbol_tail(file_info['file_path'], indicators_config, rows, engine)
+        if tail is None:
+            return None
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (tail, complete)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return tail.iloc[-rows:]
+
+    def clear(self):
+        """Cache leeren"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """Cache-Statistiken"""
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Globale Instanz für alle Apps
+symbol_tail_cache = SymbolTailCache()
+
+
+def _load_symbol_tail(file_path, indicators_config, rows, engine=None):
+    """Symbol laden, Indikatoren auf der vollen Historie berechnen, nur das Ende behalten"""
+    data = data_manager.performance_handler.load_with_performance(file_path)
+    if not isinstance(data, pd.DataFrame) or data.empty:
+        return None, False
+
+    if indicators_config:
+        engine = engine or ParallelIndicatorEngine()
+        results = engine.run({'single': data}, indicators_config)
+        data, _ = assemble_timeframe(data, list(results.values()))
+
+    rows = max(rows, CACHED_ROWS)
+    numeric = data.select_dtypes(include=[np.number, bool])
+    tail = numeric.iloc[-rows:].astype(np.float64)
+    return tail, len(data) <= rows
+
+
+def stack_tails(tails, columns, rows):
+    """
+    Enden der Symbole zu Spaltenblöcken stapeln (am letzten Bar ausgerichtet)
+
+    Jeder Block ist (rows × Symbole) in Fortran-Reihenfolge, d.h. ein Symbol liegt
+    zusammenhängend im Speicher; kürzere Historien werden oben mit NaN aufgefüllt.
+
+    Returns:
+        Dict Spalte → 2D-Block
+    """
+    blocks = {}
+    for column in columns:
+        block = np.full((rows, len(tails)), np.nan, dtype=np.float64, order='F')
+        for j, tail in enumerate(tails):
+            if column in tail.columns:
+                values = tail[column].to_numpy()
+                block[rows - len(values):, j] = values
+        blocks[column] = block
+    return blocks
+
+
+def evaluate_blocks(compiled, blocks, rows, n_symbols):
+    """
+    Entries für alle Symbole eines Batches in einem Kernel-Aufruf
+
+    Die Blöcke werden spaltenweise (Symbol für Symbol) hintereinander gelegt. Über die
+    Symbolgrenze liest der Kernel nur in die ersten lookback Bars eines Symbols, die
+    für den Screener nicht ausgewertet werden.
+
+    Returns:
+        Bool-Array (Symbole × rows)
+    """
+    frame = pd.DataFrame({column: block.ravel(order='F') for column, block in blocks.items()})
+    if frame.empty:
+        frame = pd.DataFrame(index=pd.RangeIndex(rows * n_symbols))
+    entries, _ = compiled.evaluate(frame)
+    return unpack_signals(entries, rows * n_symbols).reshape(n_symbols, rows)
+
+
+def _batches(items, batch_size):
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+
+def run_screener(strategy_config, indicators_config=None, directory=DEFAULT_DIRECTORY,
+                 batch_size=DEFAULT_BATCH_SIZE, rank_by=None, ascending=False,
+                 progress_callback=None, cache=None):
+    """
+    Strategie über alle Symbole eines Ordners auswerten
+
+    Args:
+        strategy_config: Strategie aus App 6
+        indicators_config: Indikator-Konfiguration aus App 3 (None = Spalten aus den Dateien)
+        directory: Ordner mit Symbol-Dateien
+        batch_size: Symbole pro Kernel-Aufruf (bestimmt den Speicherbedarf)
+        rank_by: Optionale Spalte für die Rangfolge (Wert am letzten Bar)
+        ascending: Rangfolge aufsteigend statt absteigend
+        progress_callback: callback(fertig, gesamt)
+        cache: SymbolTailCache (Standard: globale Instanz)
+
+    Returns:
+        (DataFrame der Treffer mit Rang, Statistik-Dict)
+    """
+    start_time = time.perf_counter()
+    cache = cache or symbol_tail_cache
+    configs = single_timeframe_configs(indicators_config)
+    engine = ParallelIndicatorEngine() if configs else None
+
+    catalog = data_manager.get_available_files(directory)
+    symbols = sorted(catalog)
+    stats = {'symbols': len(symbols), 'evaluated': 0, 'failed': 0, 'batches': 0, 'hits': 0}
+    if not symbols:
+        return pd.DataFrame(columns=RESULT_COLUMNS), stats
+
+    # Spalten und Lookback aus dem ersten ladbaren Symbol (alle teilen dieselbe Konfiguration)
+    compiled = None
+    probe_rows = ACTIVE_WINDOW + 2
+    for symbol in symbols:
+        tail = cache.get(catalog[symbol], configs, probe_rows, engine)
+        if tail is not None:
+            compiled = compile_strategy(strategy_config, tail)
+            break
+    if compiled is None:
+        stats['failed'] = len(symbols)
+        return pd.DataFrame(columns=RESULT_COLUMNS), stats
+
+    lookback = compiled.lookback
+    rows = lookback + ACTIVE_WINDOW + 2
+    columns = list(dict.fromkeys(list(compiled.columns) + ['close'] + ([rank_by] if rank_by else [])))
+
+    hits = []
+    done = 0
+    for batch in _batches(symbols, max(int(batch_size), 1)):
+        loaded, tails = [], []
+        for symbol in batch:
+            tail = cache.get(catalog[symbol], configs, rows, engine)
+            if tail is None or tail.empty:
+                stats['failed'] += 1
+            else:
+                loaded.append(symbol)
+                tails.append(tail)
+
+        if tails:
+            blocks = stack_tails(tails, columns, rows)
+            entries = evaluate_blocks(compiled, {c: blocks[c] for c in compiled.columns}, rows, len(tails))
+            # Nur Bars nach dem Lookback sind frei von Werten des vorherigen Symbols
+            valid = entries[:, lookback:]
+            bars_active = np.cumprod(valid[:, ::-1], axis=1).sum(axis=1)
+
+            for j, symbol in enumerate(loaded):
+                if not entries[j, -1]:
+                    continue
+                hit = {
+                    'symbol': symbol,
+                    'timestamp': tails[j].index[-1],
+                    'close': blocks['close'][-1, j],
+                    'fresh': not entries[j, -2],
+                    'bars_active': int(bars_active[j])
+                }
+                if rank_by:
+                    hit[rank_by] = blocks[rank_by][-1, j]
+                hits.append(hit)
+
+            stats['evaluated'] += len(tails)
+            stats['batches'] += 1
+
+        done += len(batch)
+        if progress_callback:
+            progress_callback(done, len(symbols))
+
+    ranking = pd.DataFrame(hits, columns=RESULT_COLUMNS + ([rank_by] if rank_by else []))
+    if not ranking.empty:
+        # Veraltete Daten markieren (letzter Bar älter als der neueste im Universum)
+        ranking['stale'] = ranking['timestamp'] < ranking['timestamp'].max()
+        sort_by, order = ['stale', 'fresh'], [True, False]
+        if rank_by:
+            sort_by.append(rank_by)
+            order.append(ascending)
+        sort_by += ['bars_active', 'symbol']
+        order += [True, True]
+        ranking = ranking.sort_values(sort_by, ascending=order, na_position='last').reset_index(drop=True)
+        ranking.insert(0, 'rank', np.arange(1, len(ranking) + 1))
+
+    cache_stats = cache.get_stats()
+    stats.update({
+        'hits': len(ranking),
+        'lookback': lookback,
+        'rows_per_symbol': rows,
+        'seconds': time.perf_counter() - start_time,
+        'cache_hits': cache_stats['hits'],
+        'cache_misses': cache_stats['misses']
+    })
+    print(f"🔎 Screener: {stats['evaluated']}/{stats['symbols']} Symbole in {stats['batches']} Batches, "
+          f"{stats['hits']} Entry-Signale am letzten Bar ({stats['seconds']:.2f}s)")
+    return ranking, stats
+
+
+def screen_frames(strategy_config, frames, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Screener über bereits geladene DataFrames (Symbol → DataFrame mit Indikatoren)
+
+    Returns:
+        Dict Symbol → Entry am letzten Bar (bool)
+    """
+    symbols = list(frames)
+    if not symbols:
+        return {}
+    compiled = compile_strategy(strategy_config, frames[symbols[0]])
+    rows = compiled.lookback + 2
+    fired = {}
+    for batch in _batches(symbols, max(int(batch_size), 1)):
+        tails = [frames[symbol].iloc[-rows:] for symbol in batch]
+        blocks = stack_tails(tails, compiled.columns, rows)
+        entries = evaluate_blocks(compiled, blocks, rows, len(tails))
+        fired.update({symbol: bool(entries[j, -1]) for j, symbol in enumerate(batch)})
+    return fired
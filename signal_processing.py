@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+🧹 SIGNAL PROCESSING - VectorBT Pro GUI System
+Bereinigung der Roh-Signale (App 7 → App 8)
+- Erster Entry nach einem Exit, Exits nur bei offener Position
+- Mindest- und Maximal-Haltedauer (min/max_holding_period aus App 5)
+- Cool-down: N Bars nach einem Exit keine neuen Entries
+- Numba-Kernel liest die gepackten Bits direkt (leere Bytes werden übersprungen)
+- Ergebnis als dünn besetzte int64-Positionen: Speicher wächst mit der Anzahl Trades, nicht Bars
+- NumPy-Fallback über Kandidaten-Positionen + searchsorted (gleiche Semantik)
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from condition_engine import packed_length, NUMBA_AVAILABLE
+from strategy_expression import compile_strategy
+from timeframe_projection import TimeframeSources
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+
+# Exit-Gründe pro Trade
+EXIT_SIGNAL = 0
+EXIT_MAX_HOLDING = 1
+EXIT_REASONS = ('Signal', 'Max Holding')
+
+DEFAULT_MIN_HOLDING = 1
+DEFAULT_MAX_HOLDING = 0
+DEFAULT_COOLDOWN = 0
+
+
+def holding_parameters(parameters=None):
+    """
+    Haltedauer-Parameter aus den Strategieparametern (App 5) lesen
+
+    Returns:
+        (min_holding, max_holding, cooldown) – max_holding 0 = unbegrenzt
+    """
+    parameters = parameters or {}
+    min_holding = max(int(parameters.get('min_holding_period', DEFAULT_MIN_HOLDING) or 0), 1)
+    max_holding = max(int(parameters.get('max_holding_period', DEFAULT_MAX_HOLDING) or 0), 0)
+    cooldown = max(int(parameters.get('cooldown_period', DEFAULT_COOLDOWN) or 0), 0)
+    if max_holding:
+        max_holding = max(max_holding, min_holding)
+    return min_holding, max_holding, cooldown
+
+
+def _as_packed(signals, n_bars):
+    """Bool-Array/Series oder gepackte Bits → gepackte Bits"""
+    signals = np.asarray(signals)
+    if signals.dtype == np.uint8 and len(signals) == packed_length(n_bars):
+        return signals
+    return np.packbits(signals.astype(bool, copy=False))
+
+
+class SparseSignals:
+    """
+    🧹 BEREINIGTE SIGNALE
+    Entry-/Exit-Positionen (int64) statt voller Bool-Serien
+    """
+
+    def __init__(self, entries, exits, n_bars, exit_reasons=None, index=None):
+        self.entries = np.asarray(entries, dtype=np.int64)
+        self.exits = np.asarray(exits, dtype=np.int64)
+        self.n_bars = int(n_bars)
+        if exit_reasons is None:
+            exit_reasons = np.zeros(len(self.exits), dtype=np.int8)
+        self.exit_reasons = np.asarray(exit_reasons, dtype=np.int8)
+        self.index = index
+
+    @property
+    def entry_count(self):
+        return len(self.entries)
+
+    @property
+    def exit_count(self):
+        return len(self.exits)
+
+    @property
+    def is_open(self):
+        """Letzte Position am Datenende noch offen"""
+        return len(self.entries) > len(self.exits)
+
+    @property
+    def nbytes(self):
+        return self.entries.nbytes + self.exits.nbytes + self.exit_reasons.nbytes
+
+    def to_mask(self, kind='entries'):
+        """Volle Bool-Maske (nur für kleine Ausschnitte gedacht)"""
+        mask = np.zeros(self.n_bars, dtype=bool)
+        mask[getattr(self, kind)] = True
+        return mask
+
+    def to_series(self, kind='entries'):
+        """Volle Bool-Series (Kompatibilität mit Pandas-Code)"""
+        return pd.Series(self.to_mask(kind), index=self.index)
+
+    def tail(self, n_rows):
+        """
+        Positionen relativ zu den letzten n_rows Bars (für Chart-Ausschnitte)
+
+        Trades, deren Entry vor dem Ausschnitt liegt, fallen komplett weg (auch ihr Exit),
+        damit Entries und Exits paarweise zusammenpassen.
+        """
+        start = max(self.n_bars - int(n_rows), 0)
+        kept = self.entries[self.entries >= start]
+        first_entry = kept[0] if len(kept) else self.n_bars
+        keep = self.exits >= first_entry
+        return SparseSignals(
+            kept - start, self.exits[keep] - start, self.n_bars - start,
+            self.exit_reasons[keep], None if self.index is None else self.index[start:]
+        )
+
+    def trades(self):
+        """Entry/Exit-Paare als DataFrame (offene Position mit Exit -1)"""
+        exits = np.full(len(self.entries), -1, dtype=np.int64)
+        exits[:len(self.exits)] = self.exits
+        reasons = np.full(len(self.entries), -1, dtype=np.int8)
+        reasons[:len(self.exit_reasons)] = self.exit_reasons
+        trades = pd.DataFrame({'entry_idx': self.entries, 'exit_idx': exits, 'exit_reason': reasons})
+        trades['bars_held'] = np.where(exits >= 0, exits - self.entries, self.n_bars - 1 - self.entries)
+        return trades
+
+    def summary(self):
+        return {
+            'entries': self.entry_count,
+            'exits': self.exit_count,
+            'open_position': self.is_open,
+            'forced_exits': int((self.exit_reasons == EXIT_MAX_HOLDING).sum()),
+            'bytes': self.nbytes
+        }
+
+
+def _clean_numpy(entry_packed, exit_packed, n_bars, min_holding, max_holding, cooldown):
+    """
+    Bereinigung ohne Numba: Kandidaten-Positionen, dann ein Sprung pro Trade
+
+    Die Kandidaten werden nur einmal bestimmt; die Schleife läuft über Trades, nicht Bars.
+    """
+    entry_candidates = np.flatnonzero(np.unpackbits(entry_packed, count=n_bars))
+    exit_candidates = np.flatnonzero(np.unpackbits(exit_packed, count=n_bars))
+
+    entries, exits, reasons = [], [], []
+    earliest = 0
+    while True:
+        i = np.searchsorted(entry_candidates, earliest)
+        if i >= len(entry_candidates):
+            break
+        entry = int(entry_candidates[i])
+        entries.append(entry)
+
+        j = np.searchsorted(exit_candidates, entry + min_holding)
+        exit_bar = int(exit_candidates[j]) if j < len(exit_candidates) else n_bars
+        reason = EXIT_SIGNAL
+        if max_holding and entry + max_holding <= exit_bar:
+            exit_bar = entry + max_holding
+            reason = EXIT_MAX_HOLDING
+        if exit_bar >= n_bars:
+            break
+        exits.append(exit_bar)
+        reasons.append(reason)
+        earliest = exit_bar + 1 + cooldown
+
+    return (np.array(entries, dtype=np.int64), np.array(exits, dtype=np.int64),
+            np.array(reasons, dtype=np.int8))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _next_bit_nb(packed, start, stop):
+        """Erste gesetzte Position in [start, stop) (stop falls keine)"""
+        if start >= stop:
+            return stop
+        byte = start >> 3
+        # Teil-Byte ab start maskieren (erste Bar = höchstes Bit)
+        bits = packed[byte] & (0xFF >> (start & 7))
+        last_byte = (stop - 1) >> 3
+        while bits == 0:
+            byte += 1
+            if byte > last_byte:
+                return stop
+            bits = packed[byte]
+        position = byte << 3
+        mask = 0x80
+        while (bits & mask) == 0:
+            mask >>= 1
+            position += 1
+        return position if position < stop else stop
+
+    @njit(cache=True, nogil=True)
+    def _grow_nb(values, size):
+        grown = np.empty(max(2 * len(values), 16), dtype=values.dtype)
+        grown[:size] = values[:size]
+        return grown
+
+    @njit(cache=True, nogil=True)
+    def _clean_nb(entry_packed, exit_packed, n_bars, min_holding, max_holding, cooldown):
+        """Ein Durchlauf: Entry suchen → Exit suchen → Cool-down, Sprünge statt Bar-Schleife"""
+        entries = np.empty(64, dtype=np.int64)
+        exits = np.empty(64, dtype=np.int64)
+        reasons = np.empty(64, dtype=np.int8)
+        n_entries = 0
+        n_exits = 0
+        earliest = 0
+        while earliest < n_bars:
+            entry = _next_bit_nb(entry_packed, earliest, n_bars)
+            if entry >= n_bars:
+                break
+            if n_entries == len(entries):
+                entries = _grow_nb(entries, n_entries)
+            entries[n_entries] = entry
+            n_entries += 1
+
+            # Exit-Signal frühestens nach min_holding, spätestens erzwungen nach max_holding
+            stop = n_bars
+            if max_holding > 0 and entry + max_holding < n_bars:
+                stop = entry + max_holding
+            exit_bar = _next_bit_nb(exit_packed, entry + min_holding, stop)
+            reason = EXIT_SIGNAL
+            if exit_bar >= stop:
+                if stop == n_bars:
+                    break
+                reason = EXIT_MAX_HOLDING
+            if n_exits == len(exits):
+                exits = _grow_nb(exits, n_exits)
+                reasons = _grow_nb(reasons, n_exits)
+            exits[n_exits] = exit_bar
+            reasons[n_exits] = reason
+            n_exits += 1
+            earliest = exit_bar + 1 + cooldown
+        return entries[:n_entries].copy(), exits[:n_exits].copy(), reasons[:n_exits].copy()
+
+
+def clean_signals(entries, exits, n_bars=None, min_holding=DEFAULT_MIN_HOLDING,
+                  max_holding=DEFAULT_MAX_HOLDING, cooldown=DEFAULT_COOLDOWN, index=None):
+    """
+    Roh-Signale zu handelbaren Entry/Exit-Paaren bereinigen
+
+    Args:
+        entries, exits: Gepackte Bits (condition_engine) oder Bool-Arrays/Series
+        n_bars: Anzahl Bars (bei Bool-Eingaben aus der Länge)
+        min_holding: Exits frühestens nach so vielen Bars (mindestens 1)
+        max_holding: Erzwungener Exit nach so vielen Bars (0 = unbegrenzt)
+        cooldown: Bars nach einem Exit ohne neue Entries
+        index: Optionaler Index für to_series/Chart-Marker
+
+    Returns:
+        SparseSignals
+    """
+    if n_bars is None:
+        n_bars = len(entries)
+    if index is None and isinstance(entries, pd.Series):
+        index = entries.index
+    min_holding = max(int(min_holding), 1)
+    max_holding = max(int(max_holding), 0)
+    if max_holding:
+        max_holding = max(max_holding, min_holding)
+    cooldown = max(int(cooldown), 0)
+
+    entry_packed = _as_packed(entries, n_bars)
+    exit_packed = _as_packed(exits, n_bars)
+
+    if NUMBA_AVAILABLE:
+        entry_idx, exit_idx, reasons = _clean_nb(entry_packed, exit_packed, n_bars, min_holding, max_holding, cooldown)
+    else:
+        entry_idx, exit_idx, reasons = _clean_numpy(entry_packed, exit_packed, n_bars, min_holding, max_holding, cooldown)
+    return SparseSignals(entry_idx, exit_idx, n_bars, reasons, index)
+
+
+def strategy_signals(strategy_config, data, strategy_parameters=None):
+    """
+    Strategie auswerten und bereinigen (wie App 7)
+
+    Args:
+        strategy_config: Strategie aus App 6
+        data: DataFrame oder Multi-Timeframe-Dict
+        strategy_parameters: Strategieparameter aus App 5 (Haltedauer, Cool-down)
+
+    Returns:
+        (Basisdaten, SparseSignals)
+    """
+    sources = TimeframeSources(data)
+    base = sources.base
+    entries, exits = compile_strategy(strategy_config, sources).evaluate(sources)
+    min_holding, max_holding, cooldown = holding_parameters(strategy_parameters)
+    return base, clean_signals(entries, exits, len(base), min_holding, max_holding, cooldown, index=base.index)
+
+
+def clean_signals_python(entries, exits, min_holding=DEFAULT_MIN_HOLDING,
+                         max_holding=DEFAULT_MAX_HOLDING, cooldown=DEFAULT_COOLDOWN):
+    """Referenz: Bar-für-Bar-Zustandsmaschine über Bool-Arrays (nur für Tests/Benchmark)"""
+    entries = np.asarray(entries, dtype=bool)
+    exits = np.asarray(exits, dtype=bool)
+    min_holding = max(int(min_holding), 1)
+    max_holding = max(int(max_holding), 0)
+    if max_holding:
+        max_holding = max(max_holding, min_holding)
+    entry_idx, exit_idx = [], []
+    position_start = -1
+    blocked_until = 0
+    for i in range(len(entries)):
+        if position_start < 0:
+            if i >= blocked_until and entries[i]:
+                position_start = i
+                entry_idx.append(i)
+        else:
+            held = i - position_start
+            if (held >= min_holding and exits[i]) or (max_holding and held >= max_holding):
+                exit_idx.append(i)
+                position_start = -1
+                blocked_until = i + 1 + max(int(cooldown), 0)
+    return np.array(entry_idx, dtype=np.int64), np.array(exit_idx, dtype=np.int64)
+
+
+def benchmark_cleaning(n_bars=10_000_000, density=0.0005, seed=0):
+    """Numba-Bereinigung auf gepackten Bits gegen Bool-Serien"""
+    rng = np.random.default_rng(seed)
+    entries = rng.random(n_bars) < density
+    exits = rng.random(n_bars) < density
+    entry_packed, exit_packed = np.packbits(entries), np.packbits(exits)
+
+    clean_signals(entry_packed[:8], exit_packed[:8], 64)  # JIT aufwärmen
+    start = time.perf_counter()
+    cleaned = clean_signals(entry_packed, exit_packed, n_bars, 5, 200, 10)
+    seconds = time.perf_counter() - start
+
+    dense_mb = (entries.nbytes + exits.nbytes) / (1024 * 1024)
+    print(f"🧹 Signal-Bereinigung (Numba: {'✅' if NUMBA_AVAILABLE else '❌'}): {n_bars:,} Bars, "
+          f"{cleaned.entry_count:,} Trades in {seconds * 1000:.1f} ms")
+    print(f"   Speicher: {cleaned.nbytes / 1024:.1f} KB statt {dense_mb:.1f} MB (Bool-Serien)")
+    return cleaned
+
+
+if __name__ == "__main__":
+    benchmark_cleaning()
@@ -0,0 +1,897 @@
+#!/usr/bin/env python3
+"""
+🧮 STRATEGY EXPRESSION - VectorBT Pro GUI System
+Sichere Ausdruckssprache für Custom Logic (App 6 → App 7)
+- Arithmetik (+ - * /), Vergleiche, AND/OR/NOT, Bedingungen C1..Cn
+- Funktionen: crosses_above/below, rising/falling, shift, any/all, abs, min/max
+- Lookback per Index: close[3] = close vor 3 Bars
+- Beliebige Spalten inkl. projizierter Timeframes (RSI@4H, `Name mit Leerzeichen`)
+- Parser → AST ohne eval; Konstanten-Faltung und gemeinsame Teilausdrücke (CSE)
+- Ein Numba-Kernel (Register-Maschine, cache-große Blöcke mit Lookback-Rand), NumPy-Fallback
+- Multi-Timeframe: höhere Timeframes werden im Kernel über die Index-Zuordnung gelesen
+"""
+
+import re
+
+import numpy as np
+
+from condition_engine import (
+    OPERATOR_CODES, OP_CROSSES_ABOVE, OP_CROSSES_BELOW, OP_RISING, OP_FALLING,
+    parse_operand, packed_length, unpack_signals, BLOCK_ROWS, NUMBA_AVAILABLE
+)
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+    from condition_engine import _pack_nb
+
+MAX_LOOKBACK = 100_000
+
+# Platzhalter-Zuordnung für Basis-Spalten (Kernel-Tupel brauchen einheitliche Typen)
+_NO_MAP = np.empty(0, dtype=np.int64)
+
+# === OPCODES ===
+OP_CONST = 0
+OP_COLUMN = 1
+OP_ADD = 2
+OP_SUB = 3
+OP_MUL = 4
+OP_DIV = 5
+OP_NEG = 6
+OP_GT = 7   # Vergleiche: OP_GT + Vergleichs-Code (> < >= <= == !=)
+OP_LT = 8
+OP_GE = 9
+OP_LE = 10
+OP_EQ = 11
+OP_NE = 12
+OP_AND = 13
+OP_OR = 14
+OP_NOT = 15
+OP_SHIFT = 16
+OP_ANY = 17
+OP_ALL = 18
+OP_ABS = 19
+OP_MIN = 20
+OP_MAX = 21
+
+COMPARISON_OPS = {'>': OP_GT, '<': OP_LT, '>=': OP_GE, '<=': OP_LE, '==': OP_EQ, '!=': OP_NE}
+COMMUTATIVE_OPS = {OP_ADD, OP_MUL, OP_EQ, OP_NE, OP_AND, OP_OR, OP_MIN, OP_MAX}
+BOOLEAN_OPS = {OP_GT, OP_LT, OP_GE, OP_LE, OP_EQ, OP_NE, OP_AND, OP_OR, OP_NOT, OP_ANY, OP_ALL}
+
+
+class ExpressionError(ValueError):
+    """Fehler in einem Custom-Logic-Ausdruck"""
+
+
+# === AUSWERTUNG (NumPy, auch für Konstanten-Faltung) ===
+
+def _truth(values):
+    """Wahrheitswert: ungleich 0 und nicht NaN"""
+    return (values > 0) | (values < 0)
+
+
+def _shift(values, periods):
+    result = np.full(values.shape, np.nan)
+    if periods < len(values):
+        result[periods:] = values[:len(values) - periods]
+    return result
+
+
+def _window_count(flags, window):
+    counts = np.cumsum(flags, dtype=np.int64)
+    in_window = counts.copy()
+    in_window[window:] -= counts[:-window]
+    return in_window
+
+
+def _apply_numpy(op, args, param):
+    """Eine Operation auf ganzen Arrays (float64; Wahrheitswerte als 0/1)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if op == OP_ADD:
+            return args[0] + args[1]
+        if op == OP_SUB:
+            return args[0] - args[1]
+        if op == OP_MUL:
+            return args[0] * args[1]
+        if op == OP_DIV:
+            return args[0] / args[1]
+        if op == OP_NEG:
+            return -args[0]
+        if OP_GT <= op <= OP_NE:
+            a, b = args
+            result = (a > b, a < b, a >= b, a <= b, a == b, a != b)[op - OP_GT]
+            return result.astype(np.float64)
+        if op == OP_AND:
+            return (_truth(args[0]) & _truth(args[1])).astype(np.float64)
+        if op == OP_OR:
+            return (_truth(args[0]) | _truth(args[1])).astype(np.float64)
+        if op == OP_NOT:
+            return (~_truth(args[0])).astype(np.float64)
+        if op == OP_SHIFT:
+            return _shift(args[0], param)
+        if op == OP_ANY:
+            return (_window_count(_truth(args[0]), param) > 0).astype(np.float64)
+        if op == OP_ALL:
+            result = _window_count(_truth(args[0]), param) == param
+            result[:param - 1] = False
+            return result.astype(np.float64)
+        if op == OP_ABS:
+            return np.abs(args[0])
+        if op == OP_MIN:
+            return np.fmin(args[0], args[1])
+        if op == OP_MAX:
+            return np.fmax(args[0], args[1])
+    raise ExpressionError(f"Unbekannte Operation {op}")
+
+
+# === AST (hash-consed: gleiche Teilausdrücke = gleicher Knoten) ===
+
+class ExpressionBuilder:
+    """
+    🌳 AST-BUILDER
+    Knoten (op, args, param) werden dedupliziert (CSE) und konstant gefaltet
+    """
+
+    def __init__(self):
+        self.nodes = []          # (op, args, param, value)
+        self._lookup = {}
+        self.folded = 0
+        self.shared = 0
+
+    def _intern(self, op, args=(), param=0, value=0.0):
+        key = (op, args, param, value if op == OP_CONST else 0.0)
+        node = self._lookup.get(key)
+        if node is not None:
+            self.shared += 1
+            return node
+        self.nodes.append((op, args, param, value))
+        node = len(self.nodes) - 1
+        self._lookup[key] = node
+        return node
+
+    def const(self, value):
+        return self._intern(OP_CONST, value=float(value))
+
+    def column(self, slot):
+        return self._intern(OP_COLUMN, param=int(slot))
+
+    def is_const(self, node):
+        return self.nodes[node][0] == OP_CONST
+
+    def value(self, node):
+        return self.nodes[node][3]
+
+    def op(self, op, *args, param=0):
+        """Knoten anlegen (mit Faltung und Vereinfachung)"""
+        if op in COMMUTATIVE_OPS:
+            args = tuple(sorted(args))
+
+        # Konstanten-Faltung
+        if all(self.is_const(arg) for arg in args) and op not in (OP_ANY, OP_ALL):
+            self.folded += 1
+            if op == OP_SHIFT:
+                return args[0]
+            values = [np.array([self.value(arg)]) for arg in args]
+            return self.const(_apply_numpy(op, values, param)[0])
+
+        # Boolesche Vereinfachungen mit einer Konstanten
+        if op in (OP_AND, OP_OR):
+            consts = [arg for arg in args if self.is_const(arg)]
+            if consts:
+                self.folded += 1
+                other = args[0] if args[1] == consts[0] else args[1]
+                truth = bool(_truth(np.array([self.value(consts[0])]))[0])
+                if op == OP_AND:
+                    return self._as_bool(other) if truth else self.const(0.0)
+                return self.const(1.0) if truth else self._as_bool(other)
+        if op == OP_NOT and self.nodes[args[0]][0] == OP_NOT:
+            return self._as_bool(self.nodes[args[0]][1][0])
+        if op == OP_SHIFT and param == 0:
+            return args[0]
+        if op in (OP_ANY, OP_ALL) and param == 1:
+            return self._as_bool(args[0])
+
+        return self._intern(op, tuple(args), int(param))
+
+    def _as_bool(self, node):
+        if self.nodes[node][0] in BOOLEAN_OPS:
+            return node
+        return self._intern(OP_NE, tuple(sorted((node, self.const(0.0)))))
+
+    def crosses(self, a, b, above=True):
+        """Kreuzung: jetzt über/unter, vorher nicht (über shift, ohne Kopie im Kernel)"""
+        prev_a, prev_b = self.op(OP_SHIFT, a, param=1), self.op(OP_SHIFT, b, param=1)
+        if above:
+            return self.op(OP_AND, self.op(OP_GT, a, b), self.op(OP_LE, prev_a, prev_b))
+        return self.op(OP_AND, self.op(OP_LT, a, b), self.op(OP_GE, prev_a, prev_b))
+
+    def trend(self, a, periods, rising=True):
+        """rising/falling: Wert gegenüber vor periods Bars"""
+        return self.op(OP_GT if rising else OP_LT, a, self.op(OP_SHIFT, a, param=periods))
+
+    def window(self, node, window, require_all=False):
+        """Bedingung in einem (any) / allen (all) der letzten window Bars"""
+        return self.op(OP_ALL if require_all else OP_ANY, node, param=window)
+
+
+# === PARSER ===
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)
+      | `(?P<quoted>[^`]+)`
+      | (?P<name>[A-Za-z_][A-Za-z0-9_@.]*)
+      | (?P<op>>=|<=|==|!=|&&|\|\||[-+*/()<>\[\],!&|])
+    )""", re.VERBOSE)
+
+FUNCTIONS = {
+    'crosses_above': 2, 'crosses_below': 2, 'rising': 2, 'falling': 2,
+    'shift': 2, 'any': 2, 'all': 2, 'abs': 1, 'min': 2, 'max': 2
+}
+
+
+def tokenize(text):
+    """Ausdruck in Tokens zerlegen: (Typ, Wert)"""
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise ExpressionError(f"Unerwartetes Zeichen an Position {position}: '{text[position:position + 10]}'")
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'quoted':
+            kind = 'name'
+        elif kind == 'name' and value.upper() in ('AND', 'OR', 'NOT', 'TRUE', 'FALSE'):
+            kind, value = 'keyword', value.upper()
+        elif kind == 'op':
+            value = {'&&': 'AND', '&': 'AND', '||': 'OR', '|': 'OR', '!': 'NOT'}.get(value, value)
+            if value in ('AND', 'OR', 'NOT'):
+                kind = 'keyword'
+        tokens.append((kind, value))
+    return tokens
+
+
+class ExpressionParser:
+    """
+    🔎 PARSER (rekursiver Abstieg)
+    or → and → not → Vergleich → Summe → Produkt → unär → Lookback [n] → Atom
+    """
+
+    def __init__(self, builder, resolve_name):
+        self.builder = builder
+        self.resolve_name = resolve_name
+        self.tokens = []
+        self.position = 0
+
+    def parse(self, text):
+        if not text or not text.strip():
+            raise ExpressionError("Leerer Ausdruck")
+        self.tokens = tokenize(text)
+        self.position = 0
+        node = self._or()
+        if self.position < len(self.tokens):
+            raise ExpressionError(f"Unerwartetes Token: {self.tokens[self.position][1]}")
+        return node
+
+    # --- Token-Hilfen ---
+    def _peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def _accept(self, value):
+        if self._peek()[1] == value:
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, value):
+        if not self._accept(value):
+            raise ExpressionError(f"'{value}' erwartet, gefunden: {self._peek()[1] or 'Ende'}")
+
+    # --- Grammatik ---
+    def _or(self):
+        node = self._and()
+        while self._accept('OR'):
+            node = self.builder.op(OP_OR, node, self._and())
+        return node
+
+    def _and(self):
+        node = self._not()
+        while self._accept('AND'):
+            node = self.builder.op(OP_AND, node, self._not())
+        return node
+
+    def _not(self):
+        if self._accept('NOT'):
+            return self.builder.op(OP_NOT, self._not())
+        return self._comparison()
+
+    def _comparison(self):
+        node = self._sum()
+        kind, value = self._peek()
+        if kind == 'op' and value in COMPARISON_OPS:
+            self.position += 1
+            node = self.builder.op(COMPARISON_OPS[value], node, self._sum())
+        return node
+
+    def _sum(self):
+        node = self._product()
+        while True:
+            if self._accept('+'):
+                node = self.builder.op(OP_ADD, node, self._product())
+            elif self._accept('-'):
+                node = self.builder.op(OP_SUB, node, self._product())
+            else:
+                return node
+
+    def _product(self):
+        node = self._unary()
+        while True:
+            if self._accept('*'):
+                node = self.builder.op(OP_MUL, node, self._unary())
+            elif self._accept('/'):
+                node = self.builder.op(OP_DIV, node, self._unary())
+            else:
+                return node
+
+    def _unary(self):
+        if self._accept('-'):
+            return self.builder.op(OP_NEG, self._unary())
+        if self._accept('+'):
+            return self._unary()
+        return self._lookback()
+
+    def _lookback(self):
+        node = self._atom()
+        while self._accept('['):
+            node = self.builder.op(OP_SHIFT, node, param=self._bars())
+            self._expect(']')
+        return node
+
+    def _bars(self):
+        kind, value = self._peek()
+        if kind != 'number' or not float(value).is_integer():
+            raise ExpressionError(f"Anzahl Bars (ganze Zahl) erwartet, gefunden: {value or 'Ende'}")
+        self.position += 1
+        bars = int(float(value))
+        if bars > MAX_LOOKBACK:
+            raise ExpressionError(f"Lookback {bars} größer als {MAX_LOOKBACK}")
+        return bars
+
+    def _atom(self):
+        kind, value = self._peek()
+        if kind is None:
+            raise ExpressionError("Unerwartetes Ende des Ausdrucks")
+        self.position += 1
+
+        if kind == 'number':
+            return self.builder.const(float(value))
+        if kind == 'keyword' and value in ('TRUE', 'FALSE'):
+            return self.builder.const(1.0 if value == 'TRUE' else 0.0)
+        if value == '(':
+            node = self._or()
+            self._expect(')')
+            return node
+        if kind == 'name':
+            if self._peek()[1] == '(' and value.lower() in FUNCTIONS:
+                return self._call(value.lower())
+            return self.resolve_name(value)
+        raise ExpressionError(f"Unerwartetes Token: {value}")
+
+    def _call(self, name):
+        self._expect('(')
+        builder = self.builder
+        first = self._or()
+        if FUNCTIONS[name] == 1:
+            self._expect(')')
+            return builder.op(OP_ABS, first)
+        self._expect(',')
+
+        if name in ('rising', 'falling', 'shift', 'any', 'all'):
+            bars = self._bars()
+            self._expect(')')
+            if name == 'shift':
+                return builder.op(OP_SHIFT, first, param=bars)
+            if name in ('rising', 'falling'):
+                return builder.trend(first, max(bars, 1), rising=(name == 'rising'))
+            return builder.window(first, max(bars, 1), require_all=(name == 'all'))
+
+        second = self._or()
+        self._expect(')')
+        if name == 'min':
+            return builder.op(OP_MIN, first, second)
+        if name == 'max':
+            return builder.op(OP_MAX, first, second)
+        return builder.crosses(first, second, above=(name == 'crosses_above'))
+
+
+# === KOMPILIERTES PROGRAMM ===
+
+class ExpressionProgram:
+    """
+    ⚙️ PROGRAMM
+    Topologisch sortierte Instruktionen mit wiederverwendeten Registern
+    """
+
+    def __init__(self, builder, outputs, columns):
+        self.columns = list(columns)
+        self.node_count = len(builder.nodes)
+        self.folded = builder.folded
+        self.shared = builder.shared
+
+        # Nur von den Ausgaben erreichbare Knoten (Knoten-IDs sind bereits topologisch)
+        needed = set()
+        stack = list(outputs)
+        while stack:
+            node = stack.pop()
+            if node not in needed:
+                needed.add(node)
+                stack.extend(builder.nodes[node][1])
+        order = sorted(needed)
+
+        # Lookback-Tiefe: wie viele Bars vor dem Block jede Instruktion braucht
+        depth = {}
+        for node in order:
+            op, args, param, _ = builder.nodes[node]
+            own = param if op == OP_SHIFT else (param - 1 if op in (OP_ANY, OP_ALL) else 0)
+            depth[node] = own + max((depth[arg] for arg in args), default=0)
+        self.lookback = max((depth[node] for node in outputs), default=0)
+        if self.lookback > MAX_LOOKBACK:
+            raise ExpressionError(f"Gesamter Lookback {self.lookback} größer als {MAX_LOOKBACK}")
+
+        # Register-Vergabe: Register nach letzter Verwendung freigeben
+        last_use = {}
+        for position, node in enumerate(order):
+            for arg in builder.nodes[node][1]:
+                last_use[arg] = position
+        for node in outputs:
+            last_use[node] = len(order)
+
+        free, register, n_registers = [], {}, 0
+        ops, arg_a, arg_b, params, values, targets = [], [], [], [], [], []
+        for position, node in enumerate(order):
+            op, args, param, value = builder.nodes[node]
+            released = [register[arg] for arg in set(args) if last_use[arg] == position]
+            # Elementweise Operationen und shift dürfen in ihr Argument-Register schreiben,
+            # any/all lesen zurückliegende Werte → eigenes Register
+            if op not in (OP_ANY, OP_ALL):
+                free.extend(released)
+            if free:
+                register[node] = free.pop()
+            else:
+                register[node] = n_registers
+                n_registers += 1
+            if op in (OP_ANY, OP_ALL):
+                free.extend(released)
+            ops.append(op)
+            arg_a.append(register[args[0]] if len(args) > 0 else -1)
+            arg_b.append(register[args[1]] if len(args) > 1 else -1)
+            params.append(param)
+            values.append(value)
+            targets.append(register[node])
+
+        self.ops = np.asarray(ops, dtype=np.int64)
+        self.arg_a = np.asarray(arg_a, dtype=np.int64)
+        self.arg_b = np.asarray(arg_b, dtype=np.int64)
+        self.params = np.asarray(params, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        self.outputs = np.asarray([register[node] for node in outputs], dtype=np.int64)
+        self.n_registers = max(n_registers, 1)
+
+    def __len__(self):
+        return len(self.ops)
+
+    def _inputs(self, data):
+        """
+        Eingabe-Arrays + Index-Zuordnungen
+
+        data: DataFrame oder TimeframeSources; projizierte Spalten bleiben im
+        eigenen Timeframe und werden erst im Kernel über die Zuordnung gelesen.
+        """
+        arrays, maps, mapped = [], [], []
+        for column in self.columns:
+            positions = data.positions(column) if hasattr(data, 'positions') else None
+            if positions is None:
+                arrays.append(np.ascontiguousarray(data[column].to_numpy(), dtype=np.float64))
+                maps.append(_NO_MAP)
+            else:
+                arrays.append(data.values(column))
+                maps.append(positions)
+            mapped.append(positions is not None)
+        if not arrays:
+            arrays, maps, mapped = [np.empty(len(data))], [_NO_MAP], [False]
+        return tuple(arrays), tuple(maps), np.asarray(mapped, dtype=np.bool_)
+
+    def run(self, data):
+        """
+        Programm auswerten
+
+        Returns:
+            Liste gepackter Bool-Arrays (eine pro Ausgabe)
+        """
+        n = len(data)
+        arrays, maps, mapped = self._inputs(data)
+        if NUMBA_AVAILABLE:
+            # Block groß genug, dass der Lookback-Rand höchstens ~25% Mehraufwand kostet;
+            # Vielfaches von 8, damit jeder Block ganze Bytes packt
+            block = max(BLOCK_ROWS, -(-4 * self.lookback // 8) * 8)
+            packed = _run_program_nb(arrays, maps, mapped, n, self.ops, self.arg_a, self.arg_b, self.params,
+                                     self.values, self.targets, self.outputs, self.n_registers, self.lookback, block)
+            return list(packed)
+        return self._run_numpy(arrays, maps, mapped, n)
+
+    def _run_numpy(self, arrays, maps, mapped, n):
+        """NumPy-Fallback: ganze Arrays pro Instruktion"""
+        registers = [None] * self.n_registers
+        for k in range(len(self.ops)):
+            op = self.ops[k]
+            if op == OP_CONST:
+                result = np.full(n, self.values[k])
+            elif op == OP_COLUMN:
+                slot = self.params[k]
+                result = arrays[slot]
+                if mapped[slot]:
+                    positions = maps[slot]
+                    result = np.where(positions >= 0, result[np.maximum(positions, 0)], np.nan) if len(result) else np.full(n, np.nan)
+            else:
+                args = [registers[self.arg_a[k]]]
+                if self.arg_b[k] >= 0:
+                    args.append(registers[self.arg_b[k]])
+                result = _apply_numpy(op, args, int(self.params[k]))
+            registers[self.targets[k]] = result
+        return [np.packbits(_truth(registers[output])) for output in self.outputs]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True, inline='always')
+    def _truth_nb(v):
+        return v > 0.0 or v < 0.0
+
+    @njit(cache=True, nogil=True, error_model='numpy')
+    def _binary_nb(op, a, b, out):
+        # Eine Schleife pro Operation → Verzweigung außerhalb, SIMD-fähig
+        w = out.shape[0]
+        if op == 2:
+            for p in range(w):
+                out[p] = a[p] + b[p]
+        elif op == 3:
+            for p in range(w):
+                out[p] = a[p] - b[p]
+        elif op == 4:
+            for p in range(w):
+                out[p] = a[p] * b[p]
+        elif op == 5:
+            for p in range(w):
+                out[p] = a[p] / b[p]
+        elif op == 7:
+            for p in range(w):
+                out[p] = 1.0 if a[p] > b[p] else 0.0
+        elif op == 8:
+            for p in range(w):
+                out[p] = 1.0 if a[p] < b[p] else 0.0
+        elif op == 9:
+            for p in range(w):
+                out[p] = 1.0 if a[p] >= b[p] else 0.0
+        elif op == 10:
+            for p in range(w):
+                out[p] = 1.0 if a[p] <= b[p] else 0.0
+        elif op == 11:
+            for p in range(w):
+                out[p] = 1.0 if a[p] == b[p] else 0.0
+        elif op == 12:
+            for p in range(w):
+                out[p] = 1.0 if a[p] != b[p] else 0.0
+        elif op == 13:
+            for p in range(w):
+                out[p] = 1.0 if _truth_nb(a[p]) and _truth_nb(b[p]) else 0.0
+        elif op == 14:
+            for p in range(w):
+                out[p] = 1.0 if _truth_nb(a[p]) or _truth_nb(b[p]) else 0.0
+        elif op == 20:
+            for p in range(w):
+                out[p] = np.fmin(a[p], b[p])
+        else:
+            for p in range(w):
+                out[p] = np.fmax(a[p], b[p])
+
+    @njit(cache=True, nogil=True)
+    def _unary_nb(op, a, param, origin, out):
+        # origin: globale Zeile der Fenster-Position 0; Zeilen vor Datenbeginn zählen nicht
+        w = out.shape[0]
+        if op == 6:
+            for p in range(w):
+                out[p] = -a[p]
+        elif op == 15:
+            for p in range(w):
+                out[p] = 0.0 if _truth_nb(a[p]) else 1.0
+        elif op == 19:
+            for p in range(w):
+                out[p] = abs(a[p])
+        elif op == 16:
+            # Verschiebung innerhalb des Fensters (vor dem Fenster bzw. vor Datenbeginn = NaN)
+            for p in range(w - 1, -1, -1):
+                out[p] = a[p - param] if p >= param and origin + p - param >= 0 else np.nan
+        else:
+            # any/all: gleitende Anzahl wahrer Werte über param Zeilen
+            count = 0
+            for p in range(w):
+                if origin + p >= 0 and _truth_nb(a[p]):
+                    count += 1
+                if p >= param and origin + p - param >= 0 and _truth_nb(a[p - param]):
+                    count -= 1
+                if op == 17:
+                    out[p] = 1.0 if count > 0 else 0.0
+                else:
+                    out[p] = 1.0 if origin + p >= param - 1 and count == param else 0.0
+
+    @njit(cache=True, nogil=True)
+    def _run_program_nb(columns, maps, mapped, n, ops, arg_a, arg_b, params, values, targets, outputs,
+                        n_registers, lookback, block):
+        # Register: [Lookback-Rand | Block]; jeder Block rechnet den Rand neu (kein Zustand zwischen Blöcken)
+        width = lookback + block
+        registers = np.empty((n_registers, width))
+        flags = np.empty(block, dtype=np.bool_)
+        packed = np.zeros((outputs.shape[0], (n + 7) // 8), dtype=np.uint8)
+
+        for start in range(0, n, block):
+            m = min(block, n - start)
+            w = lookback + m
+            origin = start - lookback
+            for k in range(ops.shape[0]):
+                op = ops[k]
+                out = registers[targets[k], :w]
+                if op == 0:
+                    out[:] = values[k]
+                elif op == 1:
+                    slot = params[k]
+                    column = columns[slot]
+                    if mapped[slot]:
+                        # Höherer Timeframe: Wert des zuletzt abgeschlossenen Bars (kein Look-Ahead)
+                        positions = maps[slot]
+                        for p in range(w):
+                            i = origin + p
+                            source = positions[i] if i >= 0 else -1
+                            out[p] = column[source] if source >= 0 else np.nan
+                    else:
+                        for p in range(w):
+                            i = origin + p
+                            out[p] = column[i] if i >= 0 else np.nan
+                elif arg_b[k] >= 0:
+                    _binary_nb(op, registers[arg_a[k], :w], registers[arg_b[k], :w], out)
+                else:
+                    # Verschiebung in-place möglich (gleiches Register) → rückwärts schreiben
+                    _unary_nb(op, registers[arg_a[k], :w], params[k], origin, out)
+
+            for o in range(outputs.shape[0]):
+                result = registers[outputs[o], lookback:w]
+                acc = flags[:m]
+                for j in range(m):
+                    acc[j] = _truth_nb(result[j])
+                _pack_nb(acc, packed[o, start // 8:(start + m + 7) // 8])
+        return packed
+
+
+# === STRATEGIE-REGELN ===
+
+def compile_expression(text, columns, conditions=None):
+    """
+    Einzelnen Ausdruck kompilieren
+
+    Args:
+        text: Ausdruck, z.B. "crosses_above(close, SMA_50) AND RSI@4H < 70"
+        columns: Verfügbare Spalten
+        conditions: Optionale Bedingungen (C1..Cn) im App-6-Format
+
+    Returns:
+        ExpressionProgram mit einer Ausgabe
+    """
+    builder = ExpressionBuilder()
+    resolver = _NameResolver(builder, columns, conditions or [])
+    node = ExpressionParser(builder, resolver).parse(text)
+    return ExpressionProgram(builder, [builder._as_bool(node)], resolver.used_columns)
+
+
+class _NameResolver:
+    """Namen → Spalten-Knoten bzw. Bedingungs-Knoten (C1..Cn)"""
+
+    def __init__(self, builder, columns, conditions, used_columns=None, slots=None):
+        self.builder = builder
+        self.available = set(columns)
+        self.conditions = conditions
+        self.condition_nodes = {}
+        self.used_columns = used_columns if used_columns is not None else []
+        self._slots = slots if slots is not None else {}
+
+    def column(self, name):
+        if name not in self.available:
+            raise ExpressionError(f"Unbekannte Spalte: {name}")
+        if name not in self._slots:
+            self._slots[name] = len(self.used_columns)
+            self.used_columns.append(name)
+        return self.builder.column(self._slots[name])
+
+    def __call__(self, name):
+        match = re.fullmatch(r"[Cc](\d+)", name)
+        if match and name not in self.available:
+            number = int(match.group(1))
+            if not 1 <= number <= len(self.conditions):
+                raise ExpressionError(f"Bedingung {name} existiert nicht (1..{len(self.conditions)})")
+            if number not in self.condition_nodes:
+                self.condition_nodes[number] = condition_node(self, self.conditions[number - 1])
+            return self.condition_nodes[number]
+        return self.column(name)
+
+
+def condition_node(resolver, condition):
+    """App-6-Bedingung als Ausdrucks-Knoten"""
+    builder = resolver.builder
+    left = resolver.column(condition['indicator'])
+    code = OPERATOR_CODES[condition['operator']]
+
+    if code in (OP_RISING, OP_FALLING):
+        node = builder.trend(left, max(int(float(condition.get('value') or 1)), 1), rising=(code == OP_RISING))
+    else:
+        constant, right = parse_operand(condition['value'], resolver.available)
+        if constant is None and right is None:
+            raise ExpressionError(f"Ungültiger Wert: {condition['value']}")
+        rhs = builder.const(constant) if right is None else resolver.column(right)
+        if code in (OP_CROSSES_ABOVE, OP_CROSSES_BELOW):
+            node = builder.crosses(left, rhs, above=(code == OP_CROSSES_ABOVE))
+        else:
+            node = builder.op(OP_GT + code, left, rhs)
+
+    window = int(condition.get('window', 1) or 1)
+    if window > 1:
+        node = builder.window(node, window, require_all=(condition.get('window_mode', 'any') == 'all'))
+    return node
+
+
+class ExpressionRules:
+    """
+    🧮 AUSDRUCKS-REGELN
+    Entries und Exits als ein Programm (ein Durchlauf); gleiche Schnittstelle wie CompiledConditions
+    """
+
+    def __init__(self, program, has_entries, has_exits):
+        self.program = program
+        self.columns = program.columns
+        self.lookback = program.lookback
+        self.has_entries = has_entries
+        self.has_exits = has_exits
+        self.skipped = []
+
+    def evaluate(self, data):
+        """Returns: (entries, exits) als gepackte uint8-Arrays"""
+        n = len(data)
+        results = iter(self.program.run(data) if len(self.program.outputs) else [])
+        empty = np.zeros(packed_length(n), dtype=np.uint8)
+        entries = next(results) if self.has_entries else empty
+        exits = next(results) if self.has_exits else empty.copy()
+        return entries, exits
+
+    def signals(self, data):
+        """Entries/Exits als Bool-Series (entpackt)"""
+        entries, exits = self.evaluate(data)
+        return unpack_signals(entries, len(data), data.index), unpack_signals(exits, len(data), data.index)
+
+
+def _referenced_columns(condition):
+    """Spalten, die eine App-6-Bedingung liest"""
+    names = [condition['indicator']]
+    if condition['operator'] not in ('rising', 'falling') and not isinstance(condition['value'], (int, float)):
+        names.append(str(condition['value']).strip())
+    return names
+
+
+def custom_logic_texts(strategy_config):
+    """Custom-Logic-Ausdrücke (Entry, Exit); ältere Strategien haben nur custom_logic"""
+    entry_text = strategy_config.get('custom_logic', '')
+    exit_text = strategy_config.get('custom_exit_logic') or entry_text
+    return entry_text, exit_text
+
+
+def compile_rules(strategy_config, columns):
+    """
+    Strategie (App 6) als ein Ausdrucks-Programm kompilieren
+
+    AND/OR: Bedingungen jeder Seite werden verknüpft (fehlende Spalten übersprungen).
+    CUSTOM: custom_logic verknüpft die Entry-, custom_exit_logic die Exit-Bedingungen
+    (C1..Cn zählen je Seite; ohne custom_exit_logic gilt custom_logic für beide).
+    Eine Seite ohne Bedingungen liefert keine Signale. Gemeinsame Teilausdrücke
+    beider Seiten werden nur einmal berechnet.
+
+    Returns:
+        ExpressionRules
+    """
+    logic = strategy_config.get('logic', 'AND')
+    texts = custom_logic_texts(strategy_config)
+    available = set(columns)
+    builder = ExpressionBuilder()
+    outputs = []
+    used_columns = []
+    slots = {}
+    sides = []
+    skipped = []
+
+    for key, text in zip(('entry_conditions', 'exit_conditions'), texts):
+        conditions = strategy_config.get(key, [])
+        # Spalten-Slots über beide Seiten teilen (ein Spalten-Knoten pro Spalte)
+        resolver = _NameResolver(builder, columns, conditions, used_columns, slots)
+
+        if logic == 'CUSTOM':
+            node = ExpressionParser(builder, resolver).parse(text) if conditions else None
+        else:
+            node = None
+            combine = OP_OR if logic == 'OR' else OP_AND
+            for condition in conditions:
+                missing = [name for name in _referenced_columns(condition)
+                           if name not in available and parse_operand(name, available) == (None, None)]
+                if missing:
+                    skipped.extend(missing)
+                    continue
+                current = condition_node(resolver, condition)
+                node = current if node is None else builder.op(combine, node, current)
+
+        sides.append(node is not None)
+        if node is not None:
+            outputs.append(builder._as_bool(node))
+
+    if skipped:
+        print(f"⚠️ Spalten nicht in den Daten, Bedingungen übersprungen: {', '.join(skipped)}")
+
+    program = ExpressionProgram(builder, outputs, used_columns)
+    print(f"✅ Regeln kompiliert: {len(program)} Instruktionen, {program.shared} geteilt, "
+          f"{program.folded} gefaltet, Lookback {program.lookback}")
+    rules = ExpressionRules(program, sides[0], sides[1])
+    rules.skipped = skipped
+    return rules
+
+
+def compile_strategy(strategy_config, sources):
+    """
+    Strategie für Single- oder Multi-Timeframe-Daten kompilieren
+
+    Lesen die Bedingungen projizierte Spalten (z.B. RSI@4H), läuft alles als ein
+    Programm: höhere Timeframes werden im Kernel über die gecachte Index-Zuordnung
+    gelesen (ein Durchlauf, keine projizierten Kopien). Sonst AND/OR über den
+    Bedingungs-Kernel der Condition Engine.
+
+    Args:
+        strategy_config: Strategie aus App 6
+        sources: TimeframeSources oder DataFrame
+
+    Returns:
+        CompiledConditions oder ExpressionRules (evaluate(sources) → gepackte Entries/Exits)
+    """
+    from condition_engine import compile_conditions
+
+    columns = list(sources.columns)
+    referenced = {
+        name
+        for key in ('entry_conditions', 'exit_conditions')
+        for condition in strategy_config.get(key, [])
+        for name in _referenced_columns(condition)
+    }
+    projected = hasattr(sources, 'is_projected') and any(
+        name in sources and sources.is_projected(name) for name in referenced
+    )
+    # CUSTOM läuft in compile_conditions ohnehin über compile_rules
+    if projected and strategy_config.get('logic', 'AND') != 'CUSTOM':
+        return compile_rules(strategy_config, columns)
+    return compile_conditions(strategy_config, columns)
+
+
+def validate_expression(text, columns, conditions=None):
+    """
+    Ausdruck prüfen
+
+    Returns:
+        None wenn gültig, sonst Fehlermeldung
+    """
+    try:
+        compile_expression(text, columns, conditions)
+        return None
+    except ExpressionError as e:
+        return str(e)
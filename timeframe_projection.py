@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+🔭 TIMEFRAME PROJECTION - VectorBT Pro GUI System
+Höhere Timeframes ohne Look-Ahead auf niedrigere Timeframes projizieren
+- Ein höherer Bar ist erst nach seinem Ende verfügbar (Label + Dauer)
+- Ein niedrigerer Bar sieht nur höhere Bars, die bis zu seinem Schluss abgeschlossen sind
+- Vorberechnete Index-Zuordnung (searchsorted) statt reindex/merge_asof pro Aufruf
+- Zuordnungen werden pro (Index, Index, Timeframes) gecacht
+- Projizierte Spalten heißen 'Spalte@Timeframe' (z.B. RSI@4H)
+- TimeframeSources: alle Spalten aller Timeframes unter diesem Namen, ohne projizierte Kopien
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.offsets import Tick, Day
+
+from resampling_engine import parse_timeframe, as_ns, index_fingerprint, NS_PER_DAY
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def projected_name(column, timeframe):
+    """Spaltenname einer projizierten Spalte"""
+    return f"{column}@{timeframe}"
+
+
+def _parse_offset(timeframe):
+    """Pandas-Offset eines Timeframes (None bei unbekannt, z.B. 'single')"""
+    try:
+        return parse_timeframe(timeframe)
+    except (ValueError, TypeError):
+        return None
+
+
+def fixed_duration_ns(timeframe):
+    """Feste Bar-Dauer eines Timeframes in ns (None bei Woche/Monat/unbekannt)"""
+    offset = _parse_offset(timeframe)
+    if isinstance(offset, Day):
+        return offset.n * NS_PER_DAY
+    if isinstance(offset, Tick):
+        return int(offset.nanos)
+    return None
+
+
+def _median_spacing_ns(index):
+    """Typischer Bar-Abstand (für Daten ohne Timeframe-Angabe)"""
+    values = as_ns(index).asi8
+    if len(values) < 2:
+        return 0
+    return int(np.median(np.diff(values)))
+
+
+def bar_end_ns(index, timeframe):
+    """
+    Ende jedes Bars in ns
+
+    Feste Dauer: min(Label + Dauer, nächstes Label).
+    Woche/Monat: nächstes Label; der letzte Bar gilt als nicht abgeschlossen.
+    Unbekannter Timeframe: Dauer = typischer Bar-Abstand.
+    """
+    labels = as_ns(index).asi8.astype(np.int64)
+    if len(labels) == 0:
+        return labels
+
+    next_labels = np.empty_like(labels)
+    next_labels[:-1] = labels[1:]
+    next_labels[-1] = np.iinfo(np.int64).max
+
+    if _parse_offset(timeframe) is None:
+        duration = _median_spacing_ns(index)
+    else:
+        duration = fixed_duration_ns(timeframe)
+    if duration is None:
+        return next_labels
+    return np.minimum(labels + duration, next_labels)
+
+
+def timeframe_rank(timeframe, index):
+    """Sortierschlüssel: typische Bar-Dauer in ns"""
+    duration = fixed_duration_ns(timeframe)
+    return duration if duration is not None else _median_spacing_ns(index)
+
+
+class ProjectionMap:
+    """
+    🗺️ VORBERECHNETE PROJEKTION
+    positions[i] = letzter höherer Bar, der beim Schluss des niedrigeren Bars i abgeschlossen ist (-1 = keiner)
+    """
+
+    def __init__(self, positions):
+        self.positions = positions
+        self.valid = positions >= 0
+
+    def __len__(self):
+        return len(self.positions)
+
+    def project(self, values):
+        """Werte des höheren Timeframes auf den niedrigeren übertragen"""
+        values = np.asarray(values)
+        if values.dtype.kind not in 'fc':
+            values = values.astype(np.float64)
+        out = np.full(len(self.positions), np.nan, dtype=values.dtype)
+        out[self.valid] = values[self.positions[self.valid]]
+        return out
+
+
+def build_projection_map(lower_index, lower_timeframe, higher_index, higher_timeframe):
+    """Index-Zuordnung niedriger → höherer Timeframe berechnen"""
+    lower_close = bar_end_ns(lower_index, lower_timeframe)
+    higher_end = bar_end_ns(higher_index, higher_timeframe)
+
+    # Bar-Enden sind nicht zwingend monoton (Session-Enden) → laufendes Maximum
+    higher_end_sorted = np.maximum.accumulate(higher_end) if len(higher_end) else higher_end
+    positions = np.searchsorted(higher_end_sorted, lower_close, side='right') - 1
+    return ProjectionMap(positions.astype(np.int64))
+
+
+class ProjectionCache:
+    """
+    ⚡ PROJEKTIONS-CACHE
+    LRU-Cache für Zuordnungen pro (niedriger Index, höherer Index, Timeframes)
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, lower_index, lower_timeframe, higher_index, higher_timeframe):
+        """Zuordnung abrufen oder berechnen"""
+        key = (
+            index_fingerprint(lower_index), str(lower_timeframe),
+            index_fingerprint(higher_index), str(higher_timeframe)
+        )
+
+        with self._lock:
+            projection = self._entries.get(key)
+            if projection is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return projection
+
+        projection = build_projection_map(lower_index, lower_timeframe, higher_index, higher_timeframe)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = projection
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return projection
+
+    def clear(self):
+        """Cache leeren"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """Cache-Statistiken"""
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Globale Instanz für alle Apps
+projection_cache = ProjectionCache()
+
+
+def indicator_columns_of(data):
+    """Alle Nicht-OHLCV-Spalten (Indikatoren)"""
+    return [column for column in data.columns if str(column).lower() not in OHLCV_COLUMNS]
+
+
+def project_columns(lower_data, lower_timeframe, higher_data, higher_timeframe, columns=None):
+    """
+    Spalten eines höheren Timeframes auf den niedrigeren projizieren
+
+    Returns:
+        DataFrame (Index des niedrigeren Timeframes, Spalten 'Spalte@Timeframe')
+    """
+    columns = indicator_columns_of(higher_data) if columns is None else list(columns)
+    projection = projection_cache.get(lower_data.index, lower_timeframe, higher_data.index, higher_timeframe)
+
+    projected = {
+        projected_name(column, higher_timeframe): projection.project(higher_data[column].to_numpy())
+        for column in columns
+    }
+    return pd.DataFrame(projected, index=lower_data.index)
+
+
+def finest_timeframe(datasets):
+    """Timeframe mit der kürzesten Bar-Dauer"""
+    return min(datasets, key=lambda timeframe: timeframe_rank(timeframe, datasets[timeframe].index))
+
+
+def project_timeframes(datasets, base_timeframe=None, columns=None):
+    """
+    Basis-Timeframe mit projizierten Indikatoren aller höheren Timeframes
+
+    Args:
+        datasets: Dict Timeframe → DataFrame (Multi-Timeframe Daten)
+        base_timeframe: Ziel-Timeframe (Standard: feinster Timeframe)
+        columns: Zu projizierende Spalten (Standard: alle Indikator-Spalten)
+
+    Returns:
+        DataFrame des Basis-Timeframes inkl. 'Spalte@Timeframe'-Spalten
+    """
+    if not isinstance(datasets, dict):
+        return datasets
+
+    base_timeframe = base_timeframe or finest_timeframe(datasets)
+    base = datasets[base_timeframe]
+    base_rank = timeframe_rank(base_timeframe, base.index)
+
+    blocks = [base]
+    for timeframe, data in datasets.items():
+        if timeframe == base_timeframe or timeframe_rank(timeframe, data.index) <= base_rank:
+            continue
+        selected = indicator_columns_of(data) if columns is None else [c for c in columns if c in data.columns]
+        if selected:
+            blocks.append(project_columns(base, base_timeframe, data, timeframe, selected))
+
+    return pd.concat(blocks, axis=1) if len(blocks) > 1 else base
+
+
+class TimeframeSources:
+    """
+    🧭 TIMEFRAME-QUELLEN
+    Spalten aller Timeframes auf dem Basis-Timeframe ('RSI', 'RSI@4H', 'close@1D').
+    Projizierte Spalten werden nicht kopiert: Werte des höheren Timeframes + gecachte Index-Zuordnung.
+    """
+
+    def __init__(self, datasets, base_timeframe=None):
+        if not isinstance(datasets, dict):
+            datasets = {base_timeframe or 'base': datasets}
+
+        self.base_timeframe = base_timeframe or finest_timeframe(datasets)
+        self.base = datasets[self.base_timeframe]
+        self.index = self.base.index
+        base_rank = timeframe_rank(self.base_timeframe, self.index)
+
+        # Name → (DataFrame, Spalte, Timeframe; None = Basis)
+        self._sources = {column: (self.base, column, None) for column in self.base.columns}
+        for timeframe, data in datasets.items():
+            if timeframe == self.base_timeframe or timeframe_rank(timeframe, data.index) <= base_rank:
+                continue
+            for column in data.columns:
+                self._sources[projected_name(column, timeframe)] = (data, column, timeframe)
+
+    @property
+    def columns(self):
+        return list(self._sources)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, name):
+        return name in self._sources
+
+    def is_projected(self, name):
+        """True für Spalten eines höheren Timeframes"""
+        return self._sources[name][2] is not None
+
+    def values(self, name):
+        """Werte im eigenen Timeframe (float64, zusammenhängend)"""
+        data, column, _ = self._sources[name]
+        return np.ascontiguousarray(data[column].to_numpy(), dtype=np.float64)
+
+    def positions(self, name):
+        """Index-Zuordnung Basis-Bar → höherer Bar (None bei Basis-Spalten)"""
+        data, _, timeframe = self._sources[name]
+        if timeframe is None:
+            return None
+        return projection_cache.get(self.index, self.base_timeframe, data.index, timeframe).positions
+
+    def __getitem__(self, name):
+        """Spalte als Series auf dem Basis-Index (projizierte Spalten werden hier einmal kopiert)"""
+        data, column, timeframe = self._sources[name]
+        if timeframe is None:
+            return data[column]
+        projection = projection_cache.get(self.index, self.base_timeframe, data.index, timeframe)
+        return pd.Series(projection.project(data[column].to_numpy()), index=self.index, name=name)